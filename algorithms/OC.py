@@ -1,5 +1,6 @@
 from config import Individual
 import random
+import numpy as np
 
 class OC:
     def __init__(self, fitness, data):
@@ -64,16 +65,8 @@ class OC:
                 cloud_server_index = i
                 break
         
-        # Build the CInd list: All users -> Cloud Server
-        # Format: [0, 0, 1, 0, 0...] repeated for each user
-        num_servers = len(all_servers)
-        c_ind = []
-        for _ in range(num_tasks):
-            user_gene = [0] * num_servers
-            user_gene[cloud_server_index] = 1 # Set Cloud to 1
-            c_ind.extend(user_gene)
-            
-        individual.CInd = c_ind
+        # Build the assignment: All users -> Cloud Server
+        individual.assignment = np.full(num_tasks, cloud_server_index, dtype=np.int32)
 
         return individual
 
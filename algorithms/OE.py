@@ -1,9 +1,12 @@
 import random
+import numpy as np
 from config import *
 
 class Individual:
     def __init__(self):
         self.CInd = []
+        self.assignment = None
+        self.evaluated = False
 
 class OE:
     def __init__(self, fitness, population_size, generation_count, data):
@@ -20,17 +23,13 @@ class OE:
             if len(bs.edge_servers) == 1:
                 count += 1
 
-        individual.CInd = [0] * (self.data['User'].count() * count)
+        individual.assignment = np.zeros(self.data['User'].count(), dtype=np.int32)
 
         task_size = count
 
         for task_idx in range(self.data['User'].count()):
-            start_idx = task_idx * task_size
-
             assigned_resource = random.randint(0, task_size - 1)
-
-            individual.CInd[start_idx:start_idx + task_size] = [0] * task_size
-            individual.CInd[start_idx + assigned_resource] = 1
+            individual.assignment[task_idx] = assigned_resource
         return individual
 
     def run(self):
@@ -1,71 +1,113 @@
 from config import *
+from algorithms.selection import non_dominated_sorting, calculate_crowding_distance, select_population
 import random
 import numpy as np
 
+QUBIT_REGISTERS = ["list", "array"]
+
+class QubitRegister:
+    """Qubits of a whole population stored as float32 angles of shape (population, users, servers).
+
+    A qubit [cos(theta), sin(theta)] is kept as its angle, so rotations become additions and the CNOT swap
+    becomes pi/2 - theta. Phase gates only change the relative phase of the amplitudes, which never alters the
+    observation probabilities, so the register leaves them out. This is where it differs from the "list"
+    register: there, phase gates turn the amplitudes complex, and NumPy compares complex numbers by their real
+    part first, so phases shift the later CNOT controls and observations a little.
+    Each individual's QInd is a (users, servers) view into the register.
+    """
+    def __init__(self, angles):
+        self.angles = np.ascontiguousarray(angles, dtype=np.float32)
+
+    @classmethod
+    def gather(cls, population):
+        # Reuses the register when the population is exactly its rows, in order
+        register = getattr(population[0], 'QRegister', None)
+        if register is not None and len(register.angles) == len(population) and all(
+            ind.QRegister is register and ind.QRow == i for i, ind in enumerate(population)
+        ):
+            return register
+        return cls(np.stack([ind.QInd for ind in population]))
+
+    def bind(self, population):
+        for i, individual in enumerate(population):
+            individual.QRegister = self
+            individual.QRow = i
+            individual.QInd = self.angles[i]
+        return population
+
+    def rotate(self, shifts):
+        self.angles += shifts.astype(np.float32)[:, None, None]
+
+    def mutate(self, mutation_rate):
+        angles = self.angles.reshape(len(self.angles), -1)
+        mutated = np.random.rand(*angles.shape) < mutation_rate
+
+        # CNOT: every mutated qubit whose |1> amplitude exceeds 0.5 swaps the amplitudes of the next qubit. As in
+        # _quantum_mutation, qubits are visited in order, so a control sees the swap its predecessor applied to it
+        # and whether it fires depends on whether the previous control fired
+        half_pi = np.float32(np.pi / 2)
+        fires_if_kept = mutated[:, :-1] & (np.sin(angles[:, :-1]) > 0.5)
+        fires_if_swapped = mutated[:, :-1] & (np.sin(half_pi - angles[:, :-1]) > 0.5)
+        fired = _chained_controls(fires_if_kept, fires_if_swapped)
+
+        targets = angles[:, 1:]
+        targets[fired] = half_pi - targets[fired]
+
+    def observe(self, greedy_rate=0.9):
+        population_size, num_users, num_servers = self.angles.shape
+        selected = np.argmax(np.sin(self.angles) ** 2, axis=2)
+        explore = np.random.rand(population_size, num_users) >= greedy_rate
+        selected[explore] = np.random.randint(0, num_servers, explore.sum())
+        return selected.astype(np.int32)
+
+def _chained_controls(fires_if_kept, fires_if_swapped):
+    """Resolves a chain of CNOT controls along the last axis, where control i fires according to fires_if_kept[i]
+    when control i - 1 didn't fire (its qubit keeps its amplitudes) and according to fires_if_swapped[i] otherwise.
+
+    Each control is a function of the previous one: constant (both flags equal) or the identity/negation of it.
+    A control thus equals the value of the last constant control before it, flipped once per negation since
+    then, which cumulative sums and maxima find for all controls at once.
+    """
+    positions = np.arange(fires_if_kept.shape[-1])
+    constant = fires_if_kept == fires_if_swapped
+    negation = fires_if_kept & ~fires_if_swapped
+
+    # Last constant control up to each position (-1 when there is none, as the first control sees an untouched qubit)
+    last_constant = np.maximum.accumulate(np.where(constant, positions, -1), axis=-1)
+    start_value = np.take_along_axis(fires_if_kept, np.maximum(last_constant, 0), axis=-1) & (last_constant >= 0)
+
+    negations = np.cumsum(negation, axis=-1)
+    negations_before = np.where(
+        last_constant >= 0, np.take_along_axis(negations, np.maximum(last_constant, 0), axis=-1), 0
+    )
+    return start_value ^ ((negations - negations_before) % 2 == 1)
+
 class QIGA:
-    def __init__(self, fitness, population_size, generation_count, data):
+    def __init__(self, fitness, population_size, generation_count, data, register="list"):
+        if register not in QUBIT_REGISTERS:
+            raise Exception(f"Unsupported qubit register {register}. Supported registers are {QUBIT_REGISTERS}.")
+
         self.fitness = fitness
         self.population_size = population_size
         self.generation_count = generation_count
         self.data = data
+        self.register = register
         self.distances = []
 
     def non_dominated_sorting(self, population):
-        fronts = [[]]
-        for i, individual in enumerate(population):
-            individual.domination_count = 0
-            individual.dominated_set = []
-            
-            for j, other_individual in enumerate(population):
-                if i == j:
-                    continue
-                if self.dominates(individual.fitness, other_individual.fitness):
-                    individual.dominated_set.append(other_individual)
-                elif self.dominates(other_individual.fitness, individual.fitness):
-                    individual.domination_count += 1
-                    
-            if individual.domination_count == 0:
-                individual.rank = 0
-                fronts[0].append(individual)
-        
-        current_front = 0
-        while len(fronts[current_front]) > 0:
-            next_front = []
-            for individual in fronts[current_front]:
-                for dominated_individual in individual.dominated_set:
-                    dominated_individual.domination_count -= 1
-                    if dominated_individual.domination_count == 0:
-                        dominated_individual.rank = current_front + 1
-                        next_front.append(dominated_individual)
-            current_front += 1
-            fronts.append(next_front)
-        
-        fronts.pop()
-        return fronts
-
-    def dominates(self, fitness1, fitness2):
-        return all(f1 <= f2 for f1, f2 in zip(fitness1, fitness2)) and any(f1 < f2 for f1, f2 in zip(fitness1, fitness2))
+        return non_dominated_sorting(population)
 
     def calculate_crowding_distance(self, front):
-        num_objectives = len(front[0].fitness)
-        for individual in front:
-            individual.crowding_distance = 0
-        
-        for i in range(num_objectives):
-            front.sort(key=lambda ind: ind.fitness[i])
-            min_fitness = front[0].fitness[i]
-            max_fitness = front[-1].fitness[i]
-            
-            front[0].crowding_distance = float('inf')
-            front[-1].crowding_distance = float('inf')
-            
-            for j in range(1, len(front) - 1):
-                front[j].crowding_distance += (front[j + 1].fitness[i] - front[j - 1].fitness[i]) / (max_fitness - min_fitness + 1e-9)
+        calculate_crowding_distance(front)
 
     def _initialize_population(self):
         users = self.data['User'].all() 
         edge_servers = self.data['EdgeServer'].all()
         
+        if self.register == "array":
+            angles = np.random.uniform(0, np.pi, (self.population_size, len(users), len(edge_servers)))
+            return QubitRegister(angles).bind([Individual() for _ in range(self.population_size)])
+
         population = []
         individual = Individual()
         individual.QInd = []
@@ -82,24 +124,21 @@ class QIGA:
         return population
 
     def select_population(self, population, population_size):
-        fronts = self.non_dominated_sorting(population)
-        selected_population = []
-        
-        for front in fronts:
-            self.calculate_crowding_distance(front)
-            front.sort(key=lambda ind: (-ind.rank, -ind.crowding_distance))
-            selected_population.extend(front)
-            
-            if len(selected_population) >= population_size:
-                break
-        
-        return selected_population[:population_size]
+        return select_population(population, population_size)
 
     def _quantum_observation(self, population):
+        if self.register == "array":
+            assignments = QubitRegister.gather(population).observe()
+            for individual, assignment in zip(population, assignments):
+                individual.assignment = assignment
+                individual.evaluated = False
+            return population
+
+        num_servers = self.data['EdgeServer'].count()
         for individual in population:
-            classical_individual = []
-            for i in range(0, len(individual.QInd), self.data['EdgeServer'].count()):
-                task_qubits = individual.QInd[i:i + self.data['EdgeServer'].count()]
+            assignment = np.zeros(len(individual.QInd) // num_servers, dtype=np.int32)
+            for task_idx, i in enumerate(range(0, len(individual.QInd), num_servers)):
+                task_qubits = individual.QInd[i:i + num_servers]
                 probabilities = np.sin(np.array([q[1][0] for q in task_qubits])) ** 2 
                 
                 if np.random.rand() < 0.9:
@@ -107,10 +146,10 @@ class QIGA:
                 else:
                     selected_resource = np.random.choice(len(probabilities))
                 
-                classical_value = [1 if j == selected_resource else 0 for j in range(self.data['EdgeServer'].count())]
-                classical_individual.extend(classical_value)
+                assignment[task_idx] = selected_resource
 
-            individual.CInd = classical_individual
+            individual.assignment = assignment
+            individual.evaluated = False
 
         return population
 
@@ -137,20 +176,11 @@ class QIGA:
         return individual
 
     def _quantum_offspring_generation(self, population, generation):
-        fronts = self.non_dominated_sorting(population)
-        
-        for front in fronts:
-            self.calculate_crowding_distance(front)
-
-        new_population = []
-        for front in fronts:
-            if len(new_population) + len(front) <= self.population_size:
-                new_population.extend(front)
-            else:
-                sorted_front = sorted(front, key=lambda ind: ind.crowding_distance, reverse=True)
-                new_population.extend(sorted_front[:self.population_size - len(new_population)])
-                break
-        
+        new_population = self.select_population(population, self.population_size)
+
+        if self.register == "array":
+            return self._quantum_offspring_register(new_population, generation)
+
         offspring_population = []
         half_population_size = self.population_size // 2
         for i in range(half_population_size):
@@ -165,6 +195,23 @@ class QIGA:
         
         return offspring_population
     
+    def _quantum_offspring_register(self, population, generation, crossover_rate=0.8):
+        # Same operators as _quantum_crossover and _quantum_mutation, applied to all offspring at once (phase gates
+        # aside, see QubitRegister)
+        parents = []
+        for i in range(self.population_size // 2):
+            parents.append(self._quantum_tournament_selection(population))
+            parents.append(self._quantum_tournament_selection(population))
+
+        crossed = np.repeat(np.random.rand(len(parents) // 2) < crossover_rate, 2)
+        theta_c = np.tile([np.pi / 4, -np.pi / 4], len(parents) // 2)
+
+        register = QubitRegister(np.stack([p.QInd for p in parents]))
+        register.rotate(np.where(crossed, theta_c, 0))
+        register.mutate(mutation_rate=0.2)
+
+        return register.bind([Individual() for _ in parents])
+
     def _quantum_tournament_selection(self, population, tournament_size=3):
         tournament = np.random.choice(population, tournament_size, replace=False)
         sorted_tournament = sorted(tournament, key=lambda ind: (ind.rank, -ind.crowding_distance))
@@ -190,30 +237,7 @@ class QIGA:
         return offspring1, offspring2
 
     def _quantum_elitism_selection(self, population, new_population, size):
-        combined_population = population + new_population
-        fronts = self.non_dominated_sorting(combined_population)
-
-        selected_population = []
-        for front in fronts:
-            self.calculate_crowding_distance(front)
-            front.sort(key=lambda ind: (ind.rank, -ind.crowding_distance))
-            if len(selected_population) + len(front) <= size:
-                selected_population.extend(front)
-            else:
-                selected_population.extend(front[:size - len(selected_population)])
-                break
-    
-        def euclidean_distance(fitness):
-            return np.sqrt(fitness[0]**2 + fitness[1]**2)
-
-        if len(selected_population) < size:
-            candidates = [ind for ind in combined_population if ind not in selected_population]
-            distances = [(ind, euclidean_distance(ind.fitness)) for ind in candidates]
-            distances.sort(key=lambda x: x[1])
-            additional_candidates = [ind for ind, _ in distances[:size - len(selected_population)]]
-            
-            selected_population.extend(additional_candidates)
-        return selected_population
+        return self.select_population(population + new_population, size)
 
     def run(self):
         population = self._initialize_population()
@@ -228,9 +252,13 @@ class QIGA:
         for i in range(self.generation_count):
             new_population = self._quantum_offspring_generation(population, i)
             new_population = self._quantum_observation(new_population)
-            new_population = self.fitness(new_population, self.data)
+            # Only the offspring are evaluated; the whole pool is then normalized together before selection
+            self.fitness(population + new_population, self.data)
 
             population = self._quantum_elitism_selection(population, new_population, self.population_size)
+            if self.register == "array":
+                # Survivors come from two registers, so pack them back into a single contiguous one
+                population = QubitRegister.gather(population).bind(population)
             best_individual = min(population, key=lambda ind: euclidean_distance(ind.fitness))
         
         return population
@@ -1,4 +1,5 @@
 import random
+import numpy as np
 from config import *
 
 class RA:
@@ -10,16 +11,13 @@ class RA:
 
     def schedule(self):
         individual = Individual()
-        individual.CInd = [0] * (self.data['User'].count() * self.data['EdgeServer'].count())
+        individual.assignment = np.zeros(self.data['User'].count(), dtype=np.int32)
 
         task_size = self.data['EdgeServer'].count()
 
         for task_idx in range(self.data['User'].count()):
-            start_idx = task_idx * task_size
             assigned_resource = random.randint(0, task_size - 1)
-
-            individual.CInd[start_idx:start_idx + task_size] = [0] * task_size
-            individual.CInd[start_idx + assigned_resource] = 1
+            individual.assignment[task_idx] = assigned_resource
 
         return individual
 
@@ -1,4 +1,6 @@
 from config import *
+import numpy as np
+
 class RR:
     def __init__(self, fitness, population_size, generation_count, data):
         self.fitness = fitness
@@ -9,17 +11,13 @@ class RR:
 
     def schedule(self):
         individual = Individual()
-        individual.CInd = [0] * (self.data['User'].count() * (self.data['EdgeServer'].count()))
+        individual.assignment = np.zeros(self.data['User'].count(), dtype=np.int32)
 
         task_size = self.data['EdgeServer'].count()
 
         for task_idx in range(self.data['User'].count()):
-            start_idx = task_idx * task_size
-
             assigned_resource = self.current_resource_idx % task_size
-
-            individual.CInd[start_idx:start_idx + task_size] = [0] * task_size
-            individual.CInd[start_idx + assigned_resource] = 1
+            individual.assignment[task_idx] = assigned_resource
 
             self.current_resource_idx += 1
 
@@ -0,0 +1,205 @@
+"""Multi-objective selection shared by QIGA and MOHEFT.
+
+Every function works on a fitness matrix of shape (individuals, objectives), where lower is better.
+"""
+import bisect
+import numpy as np
+
+
+def fitness_matrix(population):
+    return np.array([ind.fitness for ind in population], dtype=float)
+
+
+def domination_matrix(fitness):
+    """Returns a boolean matrix whose entry [i, j] tells if individual i dominates individual j."""
+    no_worse = np.all(fitness[:, None, :] <= fitness[None, :, :], axis=2)
+    better = np.any(fitness[:, None, :] < fitness[None, :, :], axis=2)
+    return no_worse & better
+
+
+def _ranks_by_matrix(fitness):
+    dominated_by = domination_matrix(fitness)
+    domination_count = dominated_by.sum(axis=0)
+
+    ranks = np.full(len(fitness), -1, dtype=np.int64)
+    front = np.flatnonzero(domination_count == 0)
+    rank = 0
+    while len(front) > 0:
+        ranks[front] = rank
+        domination_count -= dominated_by[front].sum(axis=0)
+        domination_count[front] = -1
+        front = np.flatnonzero(domination_count == 0)
+        rank += 1
+    return ranks
+
+
+def _ranks_by_sweep(fitness):
+    # Sweep in lexicographic order: everything that can dominate a point comes before it. Each front keeps
+    # the staircase of its points on the last two objectives, and since a front can only dominate a point if
+    # the previous front does, the point's front is found with a binary search over the fronts.
+    if fitness.shape[1] == 2:
+        fitness = np.column_stack([fitness, np.zeros(len(fitness))])
+
+    order = np.lexsort(fitness.T[::-1])
+    ranks = np.empty(len(fitness), dtype=np.int64)
+    staircases = []  # per front: f2 ascending and f3 descending
+
+    def front_dominates(staircase, f2, f3):
+        position = bisect.bisect_right(staircase[0], f2)
+        return position > 0 and staircase[1][position - 1] <= f3
+
+    previous = None
+    for index in order:
+        point = tuple(fitness[index])
+        if point == previous:
+            ranks[index] = ranks[previous_index]
+            continue
+        previous, previous_index = point, index
+        _, f2, f3 = point
+
+        low, high = 0, len(staircases)
+        while low < high:
+            middle = (low + high) // 2
+            if front_dominates(staircases[middle], f2, f3):
+                low = middle + 1
+            else:
+                high = middle
+        ranks[index] = low
+
+        if low == len(staircases):
+            staircases.append(([], []))
+        keys, values = staircases[low]
+
+        # Drops the staircase points the new one dominates on (f2, f3), then inserts it
+        position = bisect.bisect_left(keys, f2)
+        end = position
+        while end < len(keys) and values[end] >= f3:
+            end += 1
+        keys[position:end] = [f2]
+        values[position:end] = [f3]
+
+    return ranks
+
+
+def non_dominated_ranks(fitness, method="auto"):
+    """Computes the Pareto front index (0 = non-dominated) of every individual.
+
+    Args:
+        fitness (np.ndarray): Fitness matrix of shape (individuals, objectives).
+        method (str, optional): "sweep" (2 or 3 objectives, O(N log^2 N) comparisons plus list insertions that
+            are O(N^2) in the worst case), "matrix" (any number of objectives, vectorized O(M N^2)) or "auto" to
+            pick the sweep whenever it applies. Defaults to "auto".
+
+    Returns:
+        ranks (np.ndarray): Front index of each individual.
+    """
+    if method == "auto":
+        method = "sweep" if fitness.shape[1] in (2, 3) else "matrix"
+
+    if method == "sweep":
+        return _ranks_by_sweep(fitness)
+    if method == "matrix":
+        return _ranks_by_matrix(fitness)
+    raise Exception(f"Unsupported non-dominated sorting method {method}.")
+
+
+def non_dominated_fronts(fitness, method="auto"):
+    """Splits individuals into Pareto fronts.
+
+    Returns:
+        fronts (list): One array of individual indices per front, best front first.
+    """
+    ranks = non_dominated_ranks(fitness, method)
+    order = np.argsort(ranks, kind="stable")
+    boundaries = np.flatnonzero(np.diff(ranks[order])) + 1
+    return np.split(order, boundaries) if len(order) > 0 else []
+
+
+def non_dominated_sorting(population, method="auto"):
+    """Sorts a population into fronts of individuals, setting each individual's rank."""
+    if len(population) == 0:
+        return []
+
+    fronts = []
+    for front in non_dominated_fronts(fitness_matrix(population), method):
+        members = [population[i] for i in front]
+        for individual in members:
+            individual.rank = len(fronts)
+        fronts.append(members)
+    return fronts
+
+
+def crowding_distances(fitness, ranks):
+    """Computes the NSGA-II crowding distance of every individual within its own front, for all fronts at once.
+
+    Args:
+        fitness (np.ndarray): Fitness matrix of shape (individuals, objectives).
+        ranks (np.ndarray): Front index of each individual.
+
+    Returns:
+        distances (np.ndarray): Crowding distance of each individual (np.inf at the boundaries of a front).
+    """
+    num_individuals = len(fitness)
+    distances = np.zeros(num_individuals)
+    if num_individuals == 0:
+        return distances
+
+    for objective in range(fitness.shape[1]):
+        # Groups individuals by front and sorts each front by the objective
+        order = np.lexsort((fitness[:, objective], ranks))
+        values = fitness[order, objective]
+        sorted_ranks = ranks[order]
+
+        starts = np.flatnonzero(np.r_[True, sorted_ranks[1:] != sorted_ranks[:-1]])
+        ends = np.r_[starts[1:], num_individuals] - 1
+        span = np.repeat(values[ends] - values[starts], ends - starts + 1)
+
+        gaps = np.zeros(num_individuals)
+        gaps[1:-1] = values[2:] - values[:-2]
+        contribution = np.divide(gaps, span, out=np.zeros(num_individuals), where=span > 0)
+        contribution[starts] = np.inf
+        contribution[ends] = np.inf
+
+        distances[order] += contribution
+
+    return distances
+
+
+def environmental_selection(fitness, size, method="auto"):
+    """Picks the survivors of a generation: whole fronts first, then the least crowded individuals of the
+    front that does not fit.
+
+    Returns:
+        survivors (np.ndarray): Indices of the selected individuals, best first.
+        ranks (np.ndarray): Front index of each individual.
+        distances (np.ndarray): Crowding distance of each individual.
+    """
+    ranks = non_dominated_ranks(fitness, method)
+    distances = crowding_distances(fitness, ranks)
+    order = np.lexsort((-distances, ranks))
+    return order[:size], ranks, distances
+
+
+def calculate_crowding_distance(front):
+    """Sets the crowding distance of every individual of a front."""
+    if len(front) == 0:
+        return
+    distances = crowding_distances(fitness_matrix(front), np.zeros(len(front), dtype=np.int64))
+    for individual, distance in zip(front, distances):
+        individual.crowding_distance = float(distance)
+
+
+def select_population(population, size, method="auto"):
+    """Runs the environmental selection over a population, setting each individual's rank and crowding distance.
+
+    Returns:
+        survivors (list): Selected individuals, best first.
+    """
+    if len(population) == 0:
+        return []
+
+    survivors, ranks, distances = environmental_selection(fitness_matrix(population), size, method)
+    for individual, rank, distance in zip(population, ranks, distances):
+        individual.rank = int(rank)
+        individual.crowding_distance = float(distance)
+    return [population[i] for i in survivors]
@@ -0,0 +1,37 @@
+import time
+import argparse
+from edge_sim_py import *
+from edge_sim_py.dataset_generator import *
+
+# Times the construction of partially-connected hexagonal meshes of growing sizes (including the assignment of link
+# specifications). Construction is linear, so the time per base station should stay roughly flat as the map grows.
+parser = argparse.ArgumentParser(description="Benchmark the hexagonal mesh topology generator.")
+parser.add_argument("--sizes", type=int, nargs="+", default=[10, 32, 100, 317], help="Map sides (a side of N gives N*N base stations)")
+args = parser.parse_args()
+
+print(f"{'Base Stations':>14} {'Links':>10} {'Seconds':>9} {'us/BS':>8}")
+for size in args.sizes:
+    # Resetting the list of instances of EdgeSimPy's component classes
+    for component_class in ComponentManager.__subclasses__():
+        if component_class.__name__ != "Simulator":
+            component_class._object_count = 0
+            component_class._instances = []
+
+    network_switches = []
+    for coordinates in hexagonal_grid(x_size=size, y_size=size):
+        switch = NetworkSwitch()
+        switch.coordinates = coordinates
+        network_switches.append(switch)
+
+    # Number of links of a size x size hexagonal mesh (horizontal links plus the links between consecutive rows)
+    number_of_links = size * (size - 1) + (size - 1) * (2 * size - 1)
+    link_specifications = [
+        {"number_of_objects": number_of_links // 2, "delay": 5, "bandwidth": 1000},
+        {"number_of_objects": number_of_links - number_of_links // 2, "delay": 10, "bandwidth": 100},
+    ]
+
+    started = time.perf_counter()
+    topology = partially_connected_hexagonal_mesh(network_nodes=network_switches, link_specifications=link_specifications)
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(network_switches):>14} {len(topology.edges()):>10} {elapsed:>9.2f} {elapsed / len(network_switches) * 1e6:>8.1f}")
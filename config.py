@@ -1,11 +1,15 @@
-from collections import deque
+from collections import deque, OrderedDict
+import hashlib
 K_POP_SIZE = 32
 K_GEN_SIZE = 60
+K_QIGA_REGISTER = "list"  # "list" keeps one 2x1 array per qubit, "array" one (population, users, servers) register
+K_FITNESS_CACHE_SIZE = 4096  # Assignments whose raw metrics are memoized per scenario (0 disables the cache)
 
 class Individual:
     def __init__(self):
         self.QInd = []  # Quantum individual (Q-individual)
-        self.CInd = []  # Classical individual (C-individual)
+        self.CInd = []  # Legacy one-hot classical individual (users x servers)
+        self.assignment = None  # Classical individual: server slot per user (int32, user.id - 1 order)
         self.fitness = [float('inf'), float('inf')]
         self.crowding_distance = float('inf')
         self.rank = float('inf')
@@ -15,6 +19,8 @@ class Individual:
         self.resource_utilization = 0
         self.missed_deadlines = 0
         self.max_resource_latency = 0
+        self.memory_overloaded = False
+        self.evaluated = False  # Raw metrics are computed once per genome; fitness only re-normalizes them
 
 def get_freq(model_name):
     if model_name == "E5430":
@@ -38,27 +44,21 @@ def get_freq(model_name):
     return av_frequency
 
 import numpy as np
-def decode(data, individual):
-    resources_and_users = {es: [] for es in data['EdgeServer'].all()}
-    num_resources = int(len(individual.CInd) / data['User'].count())
-
-    for user in data['User'].all():
-        start_index = (user.id - 1) * num_resources
-        end_index = (user.id) * num_resources        
-
-        assigned_resource_id = np.argmax(individual.CInd[start_index:end_index]) + 1
-        edge_server = data['EdgeServer'].find_by_id(assigned_resource_id)
-        
-        if data['User'].find_by_id(user.id) not in resources_and_users[edge_server]:
-            resources_and_users[edge_server].append(data['User'].find_by_id(user.id))
-    
-    return resources_and_users
-
-def memory_is_overloaded(users, av_memory):
-    mem_usage = 0
-    for user in users:
-        mem_usage += user.applications[0].services[0].memory_demand
-    return mem_usage > av_memory
+from multiprocessing import Pool, shared_memory
+from tracing import TRACER, SCORES, TASKS
+def onehot_to_assignment(cind, num_users):
+    return np.argmax(np.asarray(cind).reshape(num_users, -1), axis=1).astype(np.int32)
+
+def assignment_to_onehot(assignment, num_servers):
+    onehot = np.zeros((len(assignment), num_servers), dtype=np.int32)
+    onehot[np.arange(len(assignment)), assignment] = 1
+    return onehot.ravel().tolist()
+
+def get_assignment(individual, num_users):
+    # Individuals built with the legacy one-hot CInd are converted on the fly
+    if getattr(individual, 'assignment', None) is not None:
+        return individual.assignment
+    return onehot_to_assignment(individual.CInd, num_users)
 
 import math
 def mobility_update(user, base_stations):
@@ -80,204 +80,451 @@ def mobility_update(user, base_stations):
 
 
 from collections import deque
-def get_path_delay(resource_bs_id, user_bs_id, task_data_size, data, user,graph):
-    
-    #nearest_base_station = mobility_update(user, data['BaseStation'].all())
-    #user_bs_id = nearest_base_station.id
+class PathDelayTable:
+    """Per-scenario table of cumulative path delays between base stations.
+
+    Each row is filled by a single BFS from a source base station (one that hosts an edge server),
+    walking the graph in the same order as the original per-task BFS. Instead of the delay for one
+    data size, it stores the sum of 1 / bandwidth over the links of the path, so the delay of any task
+    is that sum scaled by the task's data_size plus the wireless hop at the user's base station.
+    Scaling the sum once instead of dividing data_size by each bandwidth rounds differently, so delays
+    can differ from the original ones in the last bit (relative differences around 1e-16).
+    """
+    def __init__(self, graph, base_stations, sources=None):
+        self.columns = {bs.id: j for j, bs in enumerate(base_stations)}
+        self.wireless_delay = np.array([bs.wireless_delay for bs in base_stations], dtype=float)
+
+        if sources is None:
+            sources = list(self.columns)
+        self.rows = {bs_id: i for i, bs_id in enumerate(sources)}
+
+        # np.inf marks base stations the BFS cannot reach
+        self.inverse_bandwidth = np.full((len(self.rows), len(self.columns)), np.inf)
+        for source_id, row in self.rows.items():
+            self.inverse_bandwidth[row] = self._bfs(graph, source_id)
+
+    def _bfs(self, graph, source_id):
+        row = np.full(len(self.columns), np.inf)
+        queue = deque([(source_id, 0)])
+        visited = {source_id}
+
+        while queue:
+            current_node, cumulative = queue.popleft()
+            if current_node in self.columns:
+                row[self.columns[current_node]] = cumulative
+
+            for neighbor, bandwidth in graph.get(current_node, []):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append((neighbor, cumulative + 1 / bandwidth))
+
+        return row
+
+def build_path_delay_table(data):
+    sources = list(dict.fromkeys(server.base_station.id for server in data['EdgeServer'].all()))
+    return PathDelayTable(data['graph'], data['BaseStation'].all(), sources)
+
+class ScenarioArrays:
+    """Static per-scenario arrays used by the vectorized fitness kernel.
+
+    Users are stored in the order the original per-resource loop visited them (stable sort by
+    deadline), so per-resource sums accumulate in the same order. Raw metrics agree with the original
+    per-task computation up to PathDelayTable's rounding, i.e. to about 1e-15 relative error (checked
+    by tests/test_config.py).
+    """
+    # Arrays evaluate() reads, i.e. what worker processes need
+    SHARED_FIELDS = ['delay', 'exe_delay', 'energy', 'weight', 'deadline', 'memory_demand', 'frequency', 'memory', 'monetary_cost']
+
+    def __init__(self, data):
+        if 'path_delays' not in data:
+            data['path_delays'] = build_path_delay_table(data)
+        path_delays = data['path_delays']
+
+        servers = data['EdgeServer'].all()
+        self.num_servers = len(servers)
+        self.server_ids = np.array([server.id for server in servers])
+        self.frequency = np.array([get_freq(server.model_name) for server in servers], dtype=float)
+        self.memory = np.array([server.memory for server in servers], dtype=float)
+        self.monetary_cost = np.array([server.power_model_parameters['monetary_cost'] for server in servers])
+        self.power = np.array([server.power_model_parameters['static_power_percentage'] / 1e9 for server in servers])
+
+        # Genes point at servers by id (slot index + 1), so keep a lookup from id to server position
+        # (-1 marks ids without a server, and the last entry stands for every id out of range)
+        self.server_index_by_id = np.full(self.server_ids.max() + 2, -1, dtype=np.int64)
+        self.server_index_by_id[self.server_ids] = np.arange(self.num_servers)
+
+        users = data['User'].all()
+        tasks = [user.applications[0].services[0] for user in users]
+        self.num_users = len(users)
+        self.order = np.argsort([task.deadline for task in tasks], kind='stable')
+        users = [users[k] for k in self.order]
+        tasks = [tasks[k] for k in self.order]
+        self.user_slots = np.array([user.id - 1 for user in users], dtype=np.int64)
+        self.weight = np.array([task.weight for task in tasks], dtype=float)
+        self.deadline = np.array([task.deadline for task in tasks], dtype=float)
+        self.memory_demand = np.array([task.memory_demand for task in tasks], dtype=float)
+
+        # delay[s, k] is the total delay of user k's task when it runs on server s
+        self.data_size = np.array([task.data_size for task in tasks], dtype=float)
+        self.user_columns = np.array([path_delays.columns[user.base_station.id] for user in users], dtype=np.int64)
+        self.server_rows = np.array([path_delays.rows[server.base_station.id] for server in servers], dtype=np.int64)
+        self.path_delays = path_delays
+        path_delay = self.path_delay(np.arange(self.num_servers)[:, None])
+        self.exe_delay = self.weight / self.frequency[:, None]
+        self.delay = path_delay + self.exe_delay
+        self.energy = self.weight * self.power[:, None]
+
+    def path_delay(self, servers):
+        """Path delay of every user's task when placed on the given server positions (broadcast against users)."""
+        initial_delay = self.data_size / self.path_delays.wireless_delay[self.user_columns]
+        cumulative = self.path_delays.inverse_bandwidth[self.server_rows[servers], self.user_columns]
+        return initial_delay + self.data_size * cumulative
+
+    def assignments(self, population):
+        """Turns a population into an (individuals x users) matrix of server positions."""
+        server_ids = np.empty((len(population), self.num_users), dtype=np.int64)
+        for i, individual in enumerate(population):
+            server_ids[i] = get_assignment(individual, self.num_users)[self.user_slots] + 1
+
+        last = len(self.server_index_by_id) - 1
+        matrix = self.server_index_by_id[np.where((server_ids >= 0) & (server_ids < last), server_ids, last)]
+
+        # Genes pointing at servers that don't exist raise KeyError (as the original decoding did) instead of wrapping around
+        unknown = matrix < 0
+        if unknown.any():
+            raise KeyError(int(server_ids[unknown][0]))
+        return matrix
+
+    def share(self):
+        """Copies the arrays evaluate() needs into shared memory blocks.
+
+        Returns:
+            blocks (list): Shared memory blocks (the caller must close and unlink them).
+            specs (dict): Picklable description that attach() turns back into arrays.
+        """
+        blocks = []
+        specs = {'num_users': self.num_users, 'num_servers': self.num_servers}
+        for field in self.SHARED_FIELDS:
+            array = np.ascontiguousarray(getattr(self, field))
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            blocks.append(block)
+            specs[field] = (block.name, array.shape, array.dtype.str)
+        return blocks, specs
+
+    @classmethod
+    def attach(cls, specs):
+        """Builds a read-only ScenarioArrays on top of the shared memory blocks described by share()."""
+        arrays = cls.__new__(cls)
+        arrays.blocks = []
+        for key, value in specs.items():
+            if key not in cls.SHARED_FIELDS:
+                setattr(arrays, key, value)
+                continue
+
+            name, shape, dtype = value
+            block = shared_memory.SharedMemory(name=name)
+            arrays.blocks.append(block)
+            setattr(arrays, key, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+        return arrays
+
+def _sequential_sum(values):
+    # Sums the columns left to right, as the original per-resource loop did, instead of pairwise
+    total = np.zeros(values.shape[0])
+    for column in values.T:
+        total += column
+    return total
+
+def evaluate(assignments, arrays):
+    """Computes the raw objectives of every row of an (individuals x users) assignment matrix.
+
+    Returns:
+        metrics (dict): One array per metric, with one entry per individual.
+    """
+    num_individuals = assignments.shape[0]
+    num_servers = arrays.num_servers
+    users = np.arange(arrays.num_users)
+
+    delay = arrays.delay[assignments, users]
+    exe_delay = arrays.exe_delay[assignments, users]
+    energy = arrays.energy[assignments, users]
+
+    # Per (individual, server) reductions through a flat bincount over "individual * servers + server"
+    bins = (assignments + np.arange(num_individuals)[:, None] * num_servers).ravel()
+    shape = (num_individuals, num_servers)
+    size = num_individuals * num_servers
+
+    def per_server(weights=None):
+        return np.bincount(bins, weights=weights, minlength=size).reshape(shape)
+
+    task_count = per_server()
+    used = task_count > 0
+    resource_energy = per_server(energy.ravel())
+    resource_latency = per_server(delay.ravel())
+    active_time = per_server(exe_delay.ravel())
+    resource_weight = per_server(np.broadcast_to(arrays.weight, assignments.shape).ravel())
+    memory_usage = per_server(np.broadcast_to(arrays.memory_demand, assignments.shape).ravel())
+
+    utilization = np.zeros(shape)
+    np.divide(resource_weight, arrays.frequency * active_time, out=utilization, where=used)
+
+    return {
+        'energy': _sequential_sum(resource_energy),
+        'latency': _sequential_sum(resource_latency),
+        'cost': (used * arrays.monetary_cost).sum(axis=1),
+        'resource_utilization': _sequential_sum(utilization),
+        'missed_deadlines': (delay > arrays.deadline).sum(axis=1),
+        'memory_overloaded': (memory_usage > arrays.memory).any(axis=1),
+        'max_resource_latency': active_time.max(axis=1),
+    }
+
+def _normalize(values):
+    min_value = values.min()
+    max_value = values.max()
+    if max_value > min_value:
+        return (values - min_value) / (max_value - min_value)
+    return np.full(len(values), 0.5)
+
+def get_scenario_arrays(data):
+    if 'scenario_arrays' not in data:
+        data['scenario_arrays'] = ScenarioArrays(data)
+    return data['scenario_arrays']
+
+def store_raw_metrics(population, metrics, data):
+    """Stores the raw metrics from evaluate() in each individual and marks it as evaluated."""
+    num_users = data['User'].count()
+    num_servers = data['EdgeServer'].count()
+    energy = metrics['energy'] / num_servers
+    latency = metrics['latency'] / num_servers
 
-    '''graph = {}
-    for link in data['NetworkLink'].all():
-        node1_id = link.nodes[0].base_station.id
-        node2_id = link.nodes[1].base_station.id
-        
-        graph.setdefault(node1_id, []).append((node2_id, link.bandwidth))
-        graph.setdefault(node2_id, []).append((node1_id, link.bandwidth))'''
-
-    queue = deque([(resource_bs_id, 0)])
-    visited = {resource_bs_id}
-
-    while queue:
-        current_node, cumulative_delay = queue.popleft()
-        
-        if current_node == user_bs_id:
-            user_bs = data['BaseStation'].find_by_id(user_bs_id)
-            initial_delay = task_data_size / user_bs.wireless_delay
-            total_delay = initial_delay + cumulative_delay
-            return total_delay
-        
-        for neighbor, bandwidth in graph.get(current_node, []):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                link_delay = task_data_size / bandwidth
-                new_cumulative_delay = cumulative_delay + link_delay
-                queue.append((neighbor, new_cumulative_delay))
+    for i, individual in enumerate(population):
+        individual.missed_deadlines = int(metrics['missed_deadlines'][i])
+        individual.qos = (num_users - individual.missed_deadlines) / num_users
+        individual.energy = float(energy[i])
+        individual.latency = float(latency[i])
+        individual.cost = metrics['cost'][i].item()
+        individual.resource_utilization = float(metrics['resource_utilization'][i] / num_servers)
+        individual.max_resource_latency = float(metrics['max_resource_latency'][i])
+        individual.memory_overloaded = bool(metrics['memory_overloaded'][i])
+        individual.evaluated = True
+
+def normalize_fitness(population, traced=False):
+    """Min-max normalizes the raw objectives over the given pool and sets each individual's fitness.
+
+    Only stored raw metrics are read, so this never decodes or re-evaluates an individual.
+    """
+    energy = np.array([individual.energy for individual in population], dtype=float)
+    latency = np.array([individual.latency for individual in population], dtype=float)
+    cost = np.array([individual.cost for individual in population])
+
+    # --- NORMALIZATION STEP (3 OBJECTIVES) ---
+    normalized_energy = _normalize(energy)
+    normalized_latency = _normalize(latency)
+    normalized_cost = _normalize(cost)
+
+    penalty_weight = 1
+    total_penalty = np.array([individual.missed_deadlines for individual in population]) * penalty_weight
+    mem_penalty = np.array([100 if individual.memory_overloaded else 0 for individual in population])
 
-    return None
+    for i, individual in enumerate(population):
+        individual.fitness = [
+            float(normalized_energy[i] + total_penalty[i] + mem_penalty[i]),
+            float(normalized_latency[i] + total_penalty[i] + mem_penalty[i]),
+            float(normalized_cost[i] + total_penalty[i] + mem_penalty[i]),
+        ]
 
-def get_exe_delay(av_frequency, task_weight):
-    return task_weight / av_frequency
+    if traced and TRACER.enabled(SCORES):
+        for i in TRACER.sampled(len(population)):
+            individual = population[i]
+            TRACER.emit(
+                "score", individual=i,
+                raw_energy=individual.energy, norm_energy=normalized_energy[i],
+                raw_latency=individual.latency, norm_latency=normalized_latency[i],
+                raw_cost=individual.cost, norm_cost=normalized_cost[i],
+                missed_deadlines=individual.missed_deadlines, memory_overloaded=individual.memory_overloaded,
+                penalties=total_penalty[i] + mem_penalty[i], fitness=individual.fitness,
+            )
+
+    return population
+
+def score_population(population, data, evaluator):
+    """Evaluates the individuals that have no raw metrics yet, then normalizes the whole pool.
+
+    Args:
+        population (list): Individuals to score (e.g., parents + offspring).
+        data (dict): Scenario data.
+        evaluator (Callable): Function that maps an assignment matrix to raw metrics (see evaluate()).
+    """
+    pending = [i for i, individual in enumerate(population) if not getattr(individual, 'evaluated', False)]
+
+    # --- TRACING (a no-op unless enabled through tracing.configure_tracing) ---
+    traced = TRACER.next_call()
+    if traced:
+        TRACER.emit("fitness", individuals=len(population), evaluated=len(pending))
+
+    if pending:
+        arrays = get_scenario_arrays(data)
+        assignments = arrays.assignments([population[i] for i in pending])
+        metrics = get_fitness_cache(data).evaluate(assignments, evaluator)
+        store_raw_metrics([population[i] for i in pending], metrics, data)
+
+        if traced and TRACER.enabled(TASKS):
+            for j in TRACER.sampled(len(pending)):
+                trace_assignment(pending[j], assignments[j], arrays)
+
+    return normalize_fitness(population, traced)
+
+def trace_assignment(i, assignment, arrays):
+    """Emits the per-resource and per-task diagnostics of one individual."""
+    users = np.arange(arrays.num_users)
+    path_delay = arrays.path_delay(assignment)
+    exe_delay = arrays.exe_delay[assignment, users]
+    delay = path_delay + exe_delay
+    memory_usage = np.bincount(assignment, weights=arrays.memory_demand, minlength=arrays.num_servers)
+
+    for s in range(arrays.num_servers):
+        TRACER.emit(
+            "resource", individual=i, server=arrays.server_ids[s], frequency=arrays.frequency[s],
+            memory=arrays.memory[s], memory_usage=memory_usage[s], memory_overloaded=memory_usage[s] > arrays.memory[s],
+        )
+    for k in range(arrays.num_users):
+        TRACER.emit(
+            "task", individual=i, user=arrays.user_slots[k] + 1, server=arrays.server_ids[assignment[k]],
+            deadline=arrays.deadline[k], path_delay=path_delay[k], exec_delay=exe_delay[k], total_delay=delay[k],
+            missed_deadline=delay[k] > arrays.deadline[k],
+        )
+
+class FitnessCache:
+    """LRU cache of the raw metrics evaluate() returns, keyed by a hash of each assignment row.
+
+    Only raw metrics are cached; normalization always runs over the population being scored.
+    """
+    def __init__(self, max_size=K_FITNESS_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(assignment):
+        return hashlib.blake2b(np.ascontiguousarray(assignment).tobytes(), digest_size=16).digest()
+
+    def evaluate(self, assignments, evaluator):
+        """Returns the metrics of every row, calling evaluator(rows) only for assignments not seen before."""
+        if self.max_size <= 0:
+            self.misses += len(assignments)
+            return evaluator(assignments)
+
+        keys = [self.key(row) for row in assignments]
+        missing = {}
+        for i, key in enumerate(keys):
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            elif key in missing:
+                # Duplicates within the same population are evaluated once
+                self.hits += 1
+            else:
+                missing[key] = i
+                self.misses += 1
+
+        fresh = {}
+        if missing:
+            metrics = evaluator(assignments[list(missing.values())])
+            for j, key in enumerate(missing):
+                fresh[key] = {name: values[j] for name, values in metrics.items()}
+
+        rows = [fresh[key] if key in fresh else self.entries[key] for key in keys]
+        for key, entry in fresh.items():
+            self.entries[key] = entry
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+        return {name: np.array([row[name] for row in rows]) for name in rows[0]}
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.entries),
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+def get_fitness_cache(data):
+    if 'fitness_cache' not in data:
+        data['fitness_cache'] = FitnessCache()
+    return data['fitness_cache']
 
 def fitness(population, data):
+    """Scores a population: unevaluated individuals get their raw metrics computed, then fitness is normalized
+    over the whole list. Passing parents + offspring thus only evaluates the offspring."""
     if type(population) is not list:
         population = [population]
 
-    energy_values = []
-    latency_values = []
-    cost_values = []  # <-- ADD THIS
-    graph = data['graph']
-    
-    # --- DEBUG PRINT ---
-    print("\n=================================")
-    print(f"FITNESS: Scoring {len(population)} individuals...")
-    # -------------------
-
-    for i, individual in enumerate(population):
-        resources_and_users = decode(data, individual)
-        
-        # --- DEBUG PRINT ---
-        # (Your print statements are still here, which is good!)
-        # -------------------
-
-        individual.missed_deadlines = 0
-        mem_flag = False
-        total_resource_utilization = 0
-        total_energy = 0
-        total_latency = 0
-        total_cost = 0  # <-- ADD THIS
-        total_tasks = 0
-        individual.max_resource_latency = 0
-
-        for resource, users in resources_and_users.items():
-            resource_bs_id = data['BaseStation'].find_by_id(resource.base_station.id).id
-            av_frequency = get_freq(resource.model_name)
-            av_memory = resource.memory
-            
-            # --- DEBUG PRINT ---
-            print(f"  Checking Resource: {resource} (Freq: {av_frequency}, Mem: {av_memory})")
-            # -------------------
-
-            if memory_is_overloaded(users, av_memory):
-                mem_flag = True
-                print(f"    [PENALTY] Memory Overloaded!")
-
-            resource_total_energy = 0
-            resource_total_latency = 0
-            active_time = 0
-
-            # --- NEW: READ THE COST ---
-            # We'll just read the cost once per resource.
-            # A more complex model could make cost per-task, but this is fine.
-            if users: # Only add cost if the resource is actually used
-                total_cost += resource.power_model_parameters['monetary_cost']
-            # --------------------------
-
-            sorted_users = sorted(users, key=lambda user: user.applications[0].services[0].deadline)
-
-            for user in sorted_users:
-                user_bs_id = data['BaseStation'].find_by_id(user.base_station.id).id
-                task = user.applications[0].services[0]
-
-                # We already removed mobility_update, so this is correct
-                path_delay = get_path_delay(resource_bs_id, user_bs_id, task.data_size, data, user, graph)
-                exe_delay = get_exe_delay(av_frequency, task.weight)
-                delay = path_delay + exe_delay
-
-                energy_consumption = task.weight * (resource.power_model_parameters['static_power_percentage'] / 1e9)
-                resource_total_energy += energy_consumption
-                resource_total_latency += delay
-                active_time += exe_delay
-                
-                # --- DEBUG PRINT ---
-                print(f"    Assigning User {user.id} (Task Deadline: {task.deadline})")
-                print(f"      Path Delay: {path_delay:.4f} s")
-                print(f"      Exec Delay: {exe_delay:.4f} s")
-                print(f"      Total Delay: {delay:.4f} s")
-                # -------------------
-
-                if delay > task.deadline:
-                    individual.missed_deadlines += 1
-                    print(f"    [PENALTY] Missed Deadline!")
-
-            if sorted_users:
-                resource_utilization = sum(user.applications[0].services[0].weight for user in users) / (av_frequency * active_time)
-                total_resource_utilization += resource_utilization
-
-            total_energy += resource_total_energy
-            total_latency += resource_total_latency
-            total_tasks += len(users)
-
-            if active_time > individual.max_resource_latency:
-                individual.max_resource_latency = active_time
-
-        individual.qos = (data['User'].count() - individual.missed_deadlines) / data['User'].count()
-        individual.energy = total_energy / data['EdgeServer'].count()
-        individual.latency = total_latency / data['EdgeServer'].count()
-        individual.resource_utilization = total_resource_utilization / data['EdgeServer'].count()
-        
-        # --- ADD COST TO THE LISTS ---
-        individual.cost = total_cost # Store the raw cost
-        energy_values.append(individual.energy)
-        latency_values.append(individual.latency)
-        cost_values.append(individual.cost) # <-- ADD THIS
-        # -----------------------------
-
-    # --- NORMALIZATION STEP (NOW 3 OBJECTIVES) ---
-    min_energy = min(energy_values)
-    max_energy = max(energy_values)
-    min_latency = min(latency_values)
-    max_latency = max(latency_values)
-    min_cost = min(cost_values) # <-- ADD THIS
-    max_cost = max(cost_values) # <-- ADD THIS
-
-    for i, individual in enumerate(population):
-        if max_energy > min_energy:
-            normalized_energy = (individual.energy - min_energy) / (max_energy - min_energy)
-        else:
-            normalized_energy = 0.5
-
-        if max_latency > min_latency:
-            normalized_latency = (individual.latency - min_latency) / (max_latency - min_latency)
-        else:
-            normalized_latency = 0.5
-
-        # --- NORMALIZE COST ---
-        if max_cost > min_cost:
-            normalized_cost = (individual.cost - min_cost) / (max_cost - min_cost) # <-- ADD THIS
-        else:
-            normalized_cost = 0.5 # <-- ADD THIS
-        # ----------------------
-
-        penalty_weight = 1
-        # mem_flag is not defined in this loop, let's fix that
-        # We need to re-check mem_flag for the penalty
-        resources_and_users = decode(data, individual)
-        mem_flag = False
-        for resource, users in resources_and_users.items():
-            if memory_is_overloaded(users, resource.memory):
-                mem_flag = True
-                break
-        
-        if mem_flag:
-            mem_penalty = 100
-        else:
-            mem_penalty = 0
-        total_penalty = individual.missed_deadlines * penalty_weight
-
-        # --- UPDATE FITNESS TO 3 OBJECTIVES ---
-        individual.fitness = [
-            normalized_energy + total_penalty + mem_penalty, 
-            normalized_latency + total_penalty + mem_penalty,
-            normalized_cost + total_penalty + mem_penalty  # <-- ADD THIS
-        ]
-        # ------------------------------------
-        
-        # --- DEBUG PRINT ---
-        print(f"  --- Individual {i} Final Score ---")
-        print(f"    Raw Energy: {individual.energy:.4f} -> Norm: {normalized_energy:.4f}")
-        print(f"    Raw Latency: {individual.latency:.4f} -> Norm: {normalized_latency:.4f}")
-        print(f"    Raw Cost: {individual.cost:.4f} -> Norm: {normalized_cost:.4f}") # <-- ADD THIS
-        print(f"    Penalties: {total_penalty + mem_penalty}")
-        print(f"    FINAL FITNESS: {individual.fitness}")
-        # -------------------
-
-    return population
\ No newline at end of file
+    arrays = get_scenario_arrays(data)
+    return score_population(population, data, lambda rows: evaluate(rows, arrays))
+
+# --- Process-pool evaluation backend ---
+_worker_arrays = None
+
+def _attach_worker(specs):
+    global _worker_arrays
+    _worker_arrays = ScenarioArrays.attach(specs)
+
+def _evaluate_shard(assignments):
+    return evaluate(assignments, _worker_arrays)
+
+class ParallelFitness:
+    """Drop-in replacement for fitness(population, data) that shards each population across worker processes.
+
+    The static scenario arrays are copied into shared memory once per scenario, so only assignment matrices
+    travel to the workers and only raw metrics come back. Normalization still happens in this process.
+    """
+    def __init__(self, workers):
+        self.workers = workers
+        self._pool = None
+        self._blocks = []
+        self._arrays = None
+
+    def _start(self, arrays):
+        self.close()
+        self._blocks, specs = arrays.share()
+        self._pool = Pool(self.workers, initializer=_attach_worker, initargs=(specs,))
+        self._arrays = arrays
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+        self._arrays = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __call__(self, population, data):
+        if type(population) is not list:
+            population = [population]
+
+        arrays = get_scenario_arrays(data)
+        if arrays is not self._arrays:
+            self._start(arrays)
+
+        return score_population(population, data, self._evaluate)
+
+    def _evaluate(self, assignments):
+        shards = [shard for shard in np.array_split(assignments.astype(np.int32), self.workers) if len(shard) > 0]
+        results = self._pool.map(_evaluate_shard, shards)
+        return {key: np.concatenate([result[key] for result in results]) for key in results[0]}
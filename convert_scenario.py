@@ -0,0 +1,12 @@
+import argparse
+from edge_sim_py.binary_scenario import convert_scenario, BINARY_SCENARIO_EXTENSION
+
+# Converts datasets between JSON and the binary columnar format (the output format follows the output file extension)
+parser = argparse.ArgumentParser(description="Convert a scenario between JSON and the binary columnar format.")
+parser.add_argument("input_file", type=str, help="Input dataset (JSON or binary)")
+parser.add_argument("output_file", type=str, help=f"Output dataset (binary if it ends with {BINARY_SCENARIO_EXTENSION}, JSON otherwise)")
+args = parser.parse_args()
+
+print(f"Converting {args.input_file} to {args.output_file} ...")
+convert_scenario(args.input_file, args.output_file)
+print("Done!")
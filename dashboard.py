@@ -10,6 +10,7 @@ from pathlib import Path
 import networkx as nx
 from pyvis.network import Network
 import streamlit.components.v1 as components
+from edge_sim_py.binary_scenario import BinaryScenario, BINARY_SCENARIO_EXTENSION, is_binary_scenario
 
 # --- Page Configuration ---
 st.set_page_config(layout="wide", page_title="Fog Scheduler Digital Twin")
@@ -30,29 +31,36 @@ ROOT_DIR = str(Path(__file__).parent.resolve())
 def get_available_scenarios():
     # Scans the datasets/ folder to see what can be run
     files = glob.glob(os.path.join(ROOT_DIR, DATASET_DIR, "*_ES-*.json"))
+    files += glob.glob(os.path.join(ROOT_DIR, DATASET_DIR, f"*_ES-*{BINARY_SCENARIO_EXTENSION}"))
     scenarios = []
     for f in files:
         filename = os.path.basename(f)
         # Regex to extract just the name part before _ES-
-        match = re.match(r"(.+)_ES-(\d+)_ED-(\d+)\.json", filename)
+        match = re.match(r"(.+)_ES-(\d+)_ED-(\d+)\.", filename)
         if match:
             scenarios.append(match.group(1))
     return sorted(list(set(scenarios)))
 
 # --- Helper: Find Dataset File ---
 def get_dataset_path(scenario_name):
-    search_pattern = os.path.join(ROOT_DIR, DATASET_DIR, f"{scenario_name}_ES-*.json")
-    files = glob.glob(search_pattern)
-    if files:
-        return files[0]
+    # Binary datasets take precedence over JSON ones (as in main.py)
+    for extension in [BINARY_SCENARIO_EXTENSION, ".json"]:
+        files = glob.glob(os.path.join(ROOT_DIR, DATASET_DIR, f"{scenario_name}_ES-*{extension}"))
+        if files:
+            return files[0]
     return None
 
+# --- Helper: Read Dataset (JSON or binary) ---
+def load_dataset(file_path):
+    if is_binary_scenario(file_path): return BinaryScenario(file_path).to_dict()
+    with open(file_path, 'r') as f: return json.load(f)
+
 # --- Layout Caching ---
 @st.cache_data
 def get_fixed_layout(scenario_name):
     file_path = get_dataset_path(scenario_name)
     if not file_path: return None
-    with open(file_path, 'r') as f: data = json.load(f)
+    data = load_dataset(file_path)
     G = nx.Graph()
     if "BaseStation" in data:
         for bs in data["BaseStation"]: G.add_node(f"BS_{bs['attributes']['id']}")
@@ -83,7 +91,7 @@ def generate_network_html(scenario_name, algorithm_to_trace=None, run_id=1, use_
     file_path = get_dataset_path(scenario_name)
     if not file_path: return None
     fixed_positions = get_fixed_layout(scenario_name)
-    with open(file_path, 'r') as f: data = json.load(f)
+    data = load_dataset(file_path)
 
     # CALCULATE LOAD for Traffic Lights
     server_load = {}
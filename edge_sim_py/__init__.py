@@ -6,7 +6,14 @@ __version__ = "1.1.0"
 from .simulator import Simulator
 
 # Misc components
-from .component_manager import ComponentManager
+from .component_manager import ComponentManager, SUPPORTED_SCENARIO_FORMATS
+
+# Dataset file formats
+from .binary_scenario import BinaryScenario, BINARY_SCENARIO_EXTENSION, convert_scenario, is_binary_scenario
+
+# Metric logs
+from .metric_log import MetricStream, MetricWriter, AsyncMetricWriter, SUPPORTED_METRIC_COMPRESSIONS
+from .metric_store import MetricColumns, SUPPORTED_METRIC_LAYOUTS
 
 # EdgeSimPy components
 from .components import *
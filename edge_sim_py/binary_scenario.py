@@ -0,0 +1,392 @@
+""" Contains the binary columnar scenario format.
+
+A binary scenario stores each component class as a set of columns. Numeric attributes (e.g., IDs, coordinates,
+capacities, task weights, data sizes, deadlines, and memory demands) become typed arrays that are memory-mapped when
+the file is opened, references to other components become arrays of row indices, and everything else (strings,
+dictionaries, mixed values) is kept as MessagePack-encoded lists.
+
+File layout: magic bytes | header offset and size (uint64) | column blocks aligned to 64 bytes | MessagePack header.
+The header comes last so that classes can be written one at a time without holding the whole scenario in memory.
+Files in the previous layout (magic bytes "ESPYCOL1" | header size (uint64) | MessagePack header | column blocks, with
+block offsets counted from the first aligned position after the header) can still be read.
+
+Example:
+    'convert_scenario("datasets/Base_Case.json", "datasets/Base_Case.esb")' converts a JSON dataset to a binary one.
+"""
+# Python libraries
+import os
+import json
+import msgpack
+import numpy as np
+
+BINARY_SCENARIO_MAGIC = b"ESPYCOL2"
+LEGACY_BINARY_SCENARIO_MAGIC = b"ESPYCOL1"
+BINARY_SCENARIO_EXTENSION = ".esb"
+BLOCK_ALIGNMENT = 64
+
+
+def _to_msgpack(value: object) -> object:
+    # NumPy scalars and arrays
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} cannot be serialized")
+
+
+def _array_dtype(values: list) -> str:
+    """Returns the dtype of the column that stores a list of values without changing their Python types, if any.
+
+    Args:
+        values (list): Values of an attribute (or of the items of list attributes) across all objects of a class.
+
+    Returns:
+        dtype (str): NumPy dtype string, or None if the values can't be stored as a typed array.
+    """
+    value_types = set(map(type, values))
+    if value_types == {bool}:
+        return "|b1"
+    if value_types == {float}:
+        return "<f8"
+    if value_types == {int} and all(-(2**63) <= value < 2**63 for value in values):
+        return "<i8"
+    return None
+
+
+def _is_reference(value: object) -> bool:
+    return type(value) == dict and len(value) == 2 and "class" in value and "id" in value
+
+
+class BinaryScenarioWriter:
+    """Class that writes a binary scenario one component class at a time."""
+
+    def __init__(self, file_path: str, rows_by_id: dict):
+        """Creates a BinaryScenarioWriter object.
+
+        Args:
+            file_path (str): Output file path.
+            rows_by_id (dict): Row of each object ID within its class ({class name: {id: row}}), used to turn references
+                into index vectors.
+        """
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.rows_by_id = rows_by_id
+        self.classes = {}
+        self.output_file = open(file_path, "wb")
+        self.output_file.write(BINARY_SCENARIO_MAGIC + bytes(BLOCK_ALIGNMENT - len(BINARY_SCENARIO_MAGIC)))
+        self.size = BLOCK_ALIGNMENT
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def add(self, payload: bytes) -> dict:
+        descriptor = {"offset": self.size, "size": len(payload)}
+        padding = -len(payload) % BLOCK_ALIGNMENT
+        self.output_file.write(payload)
+        self.output_file.write(bytes(padding))
+        self.size += len(payload) + padding
+        return descriptor
+
+    def add_array(self, array: np.ndarray) -> dict:
+        descriptor = self.add(np.ascontiguousarray(array).tobytes())
+        descriptor.update(kind="array", dtype=array.dtype.str, shape=list(array.shape))
+        return descriptor
+
+    def add_objects(self, values: list) -> dict:
+        descriptor = self.add(msgpack.packb(values, default=_to_msgpack, use_bin_type=True))
+        descriptor["kind"] = "objects"
+        return descriptor
+
+    def write_class(self, class_name: str, objects: list):
+        """Writes the columns of a component class.
+
+        Args:
+            class_name (str): Component class name.
+            objects (list): Objects of the class in the same structure as JSON datasets ({"attributes", "relationships"}).
+        """
+        attribute_names = list(objects[0]["attributes"]) if len(objects) > 0 else []
+        relationship_names = list(objects[0]["relationships"]) if len(objects) > 0 else []
+
+        # Classes whose objects don't share the same attribute and relationship names are stored object by object
+        if any(
+            list(object_metadata["attributes"]) != attribute_names
+            or list(object_metadata["relationships"]) != relationship_names
+            for object_metadata in objects
+        ):
+            self.classes[class_name] = {"count": len(objects), "objects": self.add_objects(objects)}
+            return
+
+        self.classes[class_name] = {
+            "count": len(objects),
+            "attributes": {
+                name: _attribute_column(self, [object_metadata["attributes"][name] for object_metadata in objects])
+                for name in attribute_names
+            },
+            "relationships": {
+                name: _relationship_column(
+                    self, [object_metadata["relationships"][name] for object_metadata in objects], self.rows_by_id
+                )
+                for name in relationship_names
+            },
+        }
+
+    def close(self):
+        """Writes the header and closes the file."""
+        if self.output_file.closed:
+            return
+
+        header = msgpack.packb({"version": 2, "classes": self.classes}, use_bin_type=True)
+        self.output_file.write(header)
+        self.output_file.seek(len(BINARY_SCENARIO_MAGIC))
+        self.output_file.write(np.array([self.size, len(header)], dtype="<u8").tobytes())
+        self.output_file.close()
+
+
+def _attribute_column(writer: BinaryScenarioWriter, values: list) -> dict:
+    dtype = _array_dtype(values)
+    if dtype is not None:
+        return writer.add_array(np.array(values, dtype=dtype))
+
+    # Fixed-length numeric lists (e.g., coordinates) are stored as two-dimensional arrays
+    if len(values) > 0 and all(type(value) == list for value in values) and len(set(map(len, values))) == 1:
+        items = [item for value in values for item in value]
+        dtype = _array_dtype(items) if len(items) > 0 else None
+        if dtype is not None:
+            descriptor = writer.add_array(np.array(values, dtype=dtype))
+            descriptor["kind"] = "list_array"
+            return descriptor
+
+    return writer.add_objects(values)
+
+
+def _relationship_column(writer: BinaryScenarioWriter, values: list, rows_by_id: dict) -> dict:
+    def row_of(reference):
+        rows = rows_by_id.get(reference["class"])
+        return None if rows is None else rows.get(reference["id"])
+
+    # Single references (or None) to objects of the same class become an index vector (-1 stands for None)
+    references = [value for value in values if value is not None]
+    if len(references) > 0 and all(_is_reference(value) for value in references):
+        targets = {value["class"] for value in references}
+        rows = [-1 if value is None else row_of(value) for value in values]
+        if len(targets) == 1 and None not in rows:
+            descriptor = writer.add_array(np.array(rows, dtype="<i8"))
+            descriptor.update(kind="reference", target=targets.pop())
+            return descriptor
+
+    # Lists of references to objects of the same class become a flat index vector plus row offsets
+    if all(type(value) == list for value in values) and all(_is_reference(item) for value in values for item in value):
+        targets = {item["class"] for value in values for item in value}
+        rows = [row_of(item) for value in values for item in value]
+        if len(targets) <= 1 and None not in rows:
+            offsets = np.zeros(len(values) + 1, dtype="<i8")
+            np.cumsum([len(value) for value in values], out=offsets[1:])
+            return {
+                "kind": "references",
+                "target": targets.pop() if len(targets) > 0 else None,
+                "offsets": writer.add_array(offsets),
+                "rows": writer.add_array(np.array(rows, dtype="<i8")),
+            }
+
+    return writer.add_objects(values)
+
+
+def write_binary_scenario(scenario: dict, file_path: str):
+    """Writes a scenario to a binary columnar file.
+
+    Args:
+        scenario (dict): Scenario in the same structure as JSON datasets ({class name: [{"attributes", "relationships"}]}).
+        file_path (str): Output file path.
+    """
+    # Row of each object within its class, used to turn references into index vectors (the first object with an ID wins)
+    rows_by_id = {}
+    for class_name, objects in scenario.items():
+        rows = {}
+        for row, object_metadata in enumerate(objects):
+            rows.setdefault(object_metadata["attributes"]["id"], row)
+        rows_by_id[class_name] = rows
+
+    with BinaryScenarioWriter(file_path, rows_by_id) as writer:
+        for class_name, objects in scenario.items():
+            writer.write_class(class_name, objects)
+
+
+def is_binary_scenario(file_path: str) -> bool:
+    """Checks whether a file is a binary columnar scenario.
+
+    Args:
+        file_path (str): File path.
+
+    Returns:
+        bool: True if the file starts with the binary scenario magic bytes (current or legacy layout).
+    """
+    if not os.path.isfile(file_path):
+        return False
+    with open(file_path, "rb") as input_file:
+        return input_file.read(len(BINARY_SCENARIO_MAGIC)) in [BINARY_SCENARIO_MAGIC, LEGACY_BINARY_SCENARIO_MAGIC]
+
+
+def _rebase_blocks(value: object, data_offset: int):
+    """Turns the block offsets of a legacy header, which are relative to the end of the header, into file offsets."""
+    if type(value) is dict:
+        if type(value.get("offset")) is int and type(value.get("size")) is int:
+            value["offset"] += data_offset
+        for item in value.values():
+            _rebase_blocks(item, data_offset)
+
+
+class BinaryScenario:
+    """Class that gives access to the columns of a binary scenario. Typed arrays are memory-mapped views of the file."""
+
+    def __init__(self, file_path: str):
+        """Opens a binary scenario.
+
+        Args:
+            file_path (str): Binary scenario file path.
+        """
+        if not is_binary_scenario(file_path):
+            raise TypeError(f"{file_path} is not a binary scenario file.")
+
+        self.file_path = file_path
+        self.buffer = np.memmap(file_path, dtype=np.uint8, mode="r")
+
+        sizes = self.buffer[len(BINARY_SCENARIO_MAGIC) : len(BINARY_SCENARIO_MAGIC) + 16].view("<u8").tolist()
+        legacy = bytes(self.buffer[: len(BINARY_SCENARIO_MAGIC)]) == LEGACY_BINARY_SCENARIO_MAGIC
+        if legacy:
+            header_offset, header_size = len(BINARY_SCENARIO_MAGIC) + 8, sizes[0]
+        else:
+            header_offset, header_size = sizes
+        header = msgpack.unpackb(bytes(self.buffer[header_offset : header_offset + header_size]), raw=False)
+
+        self.classes = header["classes"]
+        if legacy:
+            header_end = header_offset + header_size
+            _rebase_blocks(self.classes, header_end + (-header_end % BLOCK_ALIGNMENT))
+
+    def _array(self, descriptor: dict) -> np.ndarray:
+        dtype = np.dtype(descriptor["dtype"])
+        if descriptor["size"] == 0:
+            return np.empty(descriptor["shape"], dtype=dtype)
+        return np.ndarray(descriptor["shape"], dtype=dtype, buffer=self.buffer, offset=descriptor["offset"])
+
+    def _objects(self, descriptor: dict) -> list:
+        start = descriptor["offset"]
+        return msgpack.unpackb(bytes(self.buffer[start : start + descriptor["size"]]), raw=False, strict_map_key=False)
+
+    def count(self, class_name: str) -> int:
+        return self.classes[class_name]["count"]
+
+    def column(self, class_name: str, attribute_name: str) -> object:
+        """Returns an attribute column of a given class.
+
+        Args:
+            class_name (str): Component class name.
+            attribute_name (str): Attribute name.
+
+        Returns:
+            object: Memory-mapped NumPy array for typed columns, list of values otherwise.
+        """
+        descriptor = self.classes[class_name]["attributes"][attribute_name]
+        return self._array(descriptor) if descriptor["kind"] in ["array", "list_array"] else self._objects(descriptor)
+
+    def attribute_values(self, class_name: str, attribute_name: str) -> list:
+        """Returns the values of an attribute of a given class as Python objects (the same ones a JSON dataset yields)."""
+        column = self.column(class_name, attribute_name)
+        return column.tolist() if type(column) != list else column
+
+    def ids(self, class_name: str) -> list:
+        """Returns the IDs of the objects of a given class, in row order."""
+        specification = self.classes[class_name]
+        if "objects" in specification:
+            return [object_metadata["attributes"]["id"] for object_metadata in self._objects(specification["objects"])]
+        return self.attribute_values(class_name, "id")
+
+    def references(self, class_name: str, relationship_name: str) -> tuple:
+        """Returns the index vectors of a relationship of a given class.
+
+        Returns:
+            kind (str): "reference" (one row per object, -1 for None), "references" (rows of all objects, split by
+                offsets), or "objects" (relationship values kept as they are).
+            target (str): Name of the referenced class (None for "objects" relationships).
+            columns (tuple): (rows,) for "reference", (offsets, rows) for "references", (values,) for "objects".
+        """
+        descriptor = self.classes[class_name]["relationships"][relationship_name]
+        if descriptor["kind"] == "reference":
+            return "reference", descriptor["target"], (self._array(descriptor),)
+        if descriptor["kind"] == "references":
+            return "references", descriptor["target"], (self._array(descriptor["offsets"]), self._array(descriptor["rows"]))
+        return "objects", None, (self._objects(descriptor),)
+
+    def rows(self, class_name: str, include_references: bool = True) -> list:
+        """Returns the specification of every object of a given class, in the same structure as JSON datasets.
+
+        Args:
+            class_name (str): Component class name.
+            include_references (bool, optional): Whether relationships stored as index vectors are included. Defaults to True.
+
+        Returns:
+            list: List of {"attributes": dict, "relationships": dict} entries.
+        """
+        specification = self.classes[class_name]
+        if "objects" in specification:
+            return self._objects(specification["objects"])
+
+        count = specification["count"]
+        attributes = {name: self.attribute_values(class_name, name) for name in specification["attributes"]}
+
+        relationships = {}
+        for name in specification["relationships"]:
+            kind, target, columns = self.references(class_name, name)
+            if kind == "objects":
+                relationships[name] = columns[0]
+                continue
+            if not include_references:
+                continue
+
+            target_ids = self.ids(target) if target is not None else []
+            if kind == "reference":
+                relationships[name] = [None if row < 0 else {"class": target, "id": target_ids[row]} for row in columns[0].tolist()]
+            else:
+                offsets, rows = columns[0].tolist(), columns[1].tolist()
+                relationships[name] = [
+                    [{"class": target, "id": target_ids[row]} for row in rows[offsets[i] : offsets[i + 1]]] for i in range(count)
+                ]
+
+        return [
+            {
+                "attributes": {name: values[i] for name, values in attributes.items()},
+                "relationships": {name: values[i] for name, values in relationships.items()},
+            }
+            for i in range(count)
+        ]
+
+    def to_dict(self) -> dict:
+        """Returns the scenario in the same structure as JSON datasets.
+
+        Returns:
+            scenario (dict): Scenario dictionary.
+        """
+        return {class_name: self.rows(class_name) for class_name in self.classes}
+
+
+def convert_scenario(input_file: str, output_file: str):
+    """Converts a JSON dataset to a binary scenario or vice versa. The output format is chosen by the output file extension.
+
+    Args:
+        input_file (str): Input dataset path (JSON or binary).
+        output_file (str): Output dataset path (binary if it ends with BINARY_SCENARIO_EXTENSION, JSON otherwise).
+    """
+    if is_binary_scenario(input_file):
+        scenario = BinaryScenario(input_file).to_dict()
+    else:
+        with open(input_file, "r", encoding="UTF-8") as read_file:
+            scenario = json.load(read_file)
+
+    if output_file.endswith(BINARY_SCENARIO_EXTENSION):
+        write_binary_scenario(scenario, output_file)
+    else:
+        with open(output_file, "w", encoding="UTF-8") as output:
+            json.dump(scenario, output, indent=4)
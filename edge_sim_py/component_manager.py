@@ -7,7 +7,121 @@ Example:
 """
 # Python libraries
 import os
+import copy
 import json
+from edge_sim_py.binary_scenario import BINARY_SCENARIO_EXTENSION, BinaryScenarioWriter, write_binary_scenario
+
+SUPPORTED_SCENARIO_FORMATS = ["json", "compact_json", "binary"]
+
+
+def _index_key(value: object) -> object:
+    """Returns a hashable key that is equal for two values if and only if the values are equal. Lists and tuples
+    are tagged with their type, as [1, 2] and (1, 2) are not equal.
+
+    Args:
+        value (object): Attribute value.
+
+    Returns:
+        object: Hashable key (raises TypeError if the value is not hashable).
+    """
+    if type(value) is list or type(value) is tuple:
+        return (type(value), tuple(_index_key(item) for item in value))
+    hash(value)
+    return value
+
+
+def _index_value(state: dict, obj: object, attribute_name: str, position: int):
+    """Adds an object to the index entry of the current value of one of its attributes, keeping the objects of each
+    entry in the order of the list of instances.
+
+    Args:
+        state (dict): Indexes state (see 'ComponentManager._indexes()').
+        obj (object): Indexed object.
+        attribute_name (str): Attribute name.
+        position (int): Position of the object within the list of instances.
+    """
+    if not hasattr(obj, attribute_name):
+        return
+    try:
+        key = _index_key(getattr(obj, attribute_name))
+    except TypeError:
+        # Attributes with unhashable values fall back to linear searches
+        state["unhashable"].add(attribute_name)
+        return
+
+    objects = state["indexes"][attribute_name].setdefault(key, [])
+    insert_at = len(objects)
+    while insert_at > 0 and state["positions"][id(objects[insert_at - 1])] > position:
+        insert_at -= 1
+    objects.insert(insert_at, obj)
+    state["keys"][attribute_name][id(obj)] = key
+
+
+def _unindex_value(state: dict, obj: object, attribute_name: str):
+    """Removes an object from the index entry it was added to for one of its attributes.
+
+    Args:
+        state (dict): Indexes state (see 'ComponentManager._indexes()').
+        obj (object): Indexed object.
+        attribute_name (str): Attribute name.
+    """
+    keys = state["keys"][attribute_name]
+    if id(obj) not in keys:
+        return
+
+    index = state["indexes"][attribute_name]
+    key = keys.pop(id(obj))
+    objects = [item for item in index[key] if item is not obj]
+    if objects:
+        index[key] = objects
+    else:
+        del index[key]
+
+
+def _write_json_class(output_file: object, class_name: str, instances: list, compact: bool, first: bool):
+    """Writes the objects of a component class to an open JSON dataset file, one object at a time. The indented output is
+    the same as 'json.dump(scenario, output_file, indent=4)' would produce for the whole scenario.
+
+    Args:
+        output_file (object): Output file.
+        class_name (str): Component class name.
+        instances (list): Component instances.
+        compact (bool): Whether the output is compact (no whitespace) or indented.
+        first (bool): Whether this is the first class written to the file.
+    """
+    if compact:
+        output_file.write(f'{"" if first else ","}{json.dumps(class_name)}:[')
+        for position, instance in enumerate(instances):
+            if position > 0:
+                output_file.write(",")
+            output_file.write(json.dumps(instance._to_dict(), separators=(",", ":")))
+        output_file.write("]")
+        return
+
+    output_file.write(f'{"" if first else ","}\n    {json.dumps(class_name)}: [')
+    for position, instance in enumerate(instances):
+        output_file.write(",\n        " if position > 0 else "\n        ")
+        output_file.write(json.dumps(instance._to_dict(), indent=4).replace("\n", "\n        "))
+    if len(instances) > 0:
+        output_file.write("\n    ]")
+    else:
+        output_file.write("]")
+
+
+class _IndexedAttribute:
+    """Write hook for indexed attributes. As it doesn't define '__get__', reads are served from the instance dictionary
+    as usual, and only writes pay for the hook.
+    """
+
+    def __init__(self, attribute_name: str):
+        self.attribute_name = attribute_name
+
+    def __set__(self, obj: object, value: object):
+        obj.__dict__[self.attribute_name] = value
+
+        # Objects are usually created before their class is searched, so most writes find no indexes to update
+        if "_index_state" in type(obj).__dict__:
+            obj._reindex(self.attribute_name)
 
 
 class ComponentManager:
@@ -15,6 +129,17 @@ class ComponentManager:
 
     __model = None
 
+    # Attributes that get a hash index for 'find_by' in addition to "id" (classes opt in by overriding this list)
+    _indexed_attributes = []
+
+    # Kind of each metric returned by "collect()" ("int64", "float64", "bool", or "object"), used when metrics are recorded
+    # by column (see 'edge_sim_py.metric_store'). Metrics missing from the schema are stored as lists of objects
+    _metric_schema = {}
+
+    # Attributes that change while a simulation runs, which are the only ones copied by 'Simulator.snapshot()' (classes
+    # that keep None have all their attributes copied). Components that are dictionaries (e.g., NetworkLink) list items
+    _snapshot_attributes = None
+
     def __str__(self) -> str:
         """Defines how the object is represented inside print statements.
 
@@ -31,34 +156,130 @@ class ComponentManager:
         """
         return f"{self.__class__.__name__}_{self.id}"
 
+    def __init_subclass__(cls, **kwargs):
+        """Installs write hooks on the indexed attributes of component classes, so that changing them updates the hash
+        indexes used by 'find_by()'. Classes that override '__setattr__' (e.g., NetworkLink) call '_reindex()' themselves.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.__setattr__ is object.__setattr__:
+            for attribute_name in ["id"] + list(cls._indexed_attributes):
+                setattr(cls, attribute_name, _IndexedAttribute(attribute_name))
+
+    def _reindex(self, attribute_name: str):
+        """Moves the object to the index entry of the new value of an indexed attribute, if the object has been indexed.
+
+        Args:
+            attribute_name (str): Name of the attribute that changed.
+        """
+        cls = type(self)
+        state = cls.__dict__.get("_index_state")
+        if state is None or state["stale"] or state["instances"] is not cls._instances:
+            return
+
+        position = state["positions"].get(id(self))
+        if position is None:
+            return
+
+        _unindex_value(state, self, attribute_name)
+        _index_value(state, self, attribute_name, position)
+
     @classmethod
     def export_scenario(
-        cls, ignore_list: list = ["Simulator", "Topology", "NetworkFlow"], save_to_file: bool = False, file_name: str = "dataset"
+        cls,
+        ignore_list: list = ["Simulator", "Topology", "NetworkFlow"],
+        save_to_file: bool = False,
+        file_name: str = "dataset",
+        file_format: str = "json",
     ) -> dict:
         """Exports metadata about the simulation model to a Python dictionary. If the "save_to_file" attribute is set to True, the
-        external dataset file generated is saved inside the "datasets/" directory by default.
+        external dataset file generated is saved inside the "datasets/" directory by default (see 'write_scenario()' to save
+        large scenarios without building the dictionary).
 
         Args:
             ignore_list (list, optional): List of entities that will not be included in the output dict. Defaults to ["Simulator", "Topology", "NetworkFlow"].
             save_to_file (bool, optional): Attribute that tells the method if it needs to save the scenario to an external file. Defaults to False.
             file_name (str, optional): Output file name. Defaults to "dataset".
+            file_format (str, optional): Output file format ("json", "compact_json", or "binary", see 'edge_sim_py.binary_scenario'). Defaults to "json".
 
         Returns:
             scenario (dict): Python dictionary representing the simulation model.
         """
-        scenario = {}
+        if file_format not in SUPPORTED_SCENARIO_FORMATS:
+            raise Exception(f"Unsupported scenario format {file_format}. Supported formats are {SUPPORTED_SCENARIO_FORMATS}.")
+
+        scenario = {
+            component.__name__: [instance._to_dict() for instance in component._instances]
+            for component in ComponentManager.__subclasses__()
+            if component.__name__ not in ignore_list
+        }
+
+        if save_to_file:
+            # Creating the "datasets" directory if it doesn't exists
+            if not os.path.exists("datasets/"):
+                os.makedirs("datasets")
+
+            if file_format == "binary":
+                write_binary_scenario(scenario, f"datasets/{file_name}{BINARY_SCENARIO_EXTENSION}")
+            else:
+                with open(f"datasets/{file_name}.json", "w", encoding="UTF-8") as output_file:
+                    if file_format == "compact_json":
+                        json.dump(scenario, output_file, separators=(",", ":"))
+                    else:
+                        json.dump(scenario, output_file, indent=4)
+
+        return scenario
+
+    @classmethod
+    def write_scenario(
+        cls,
+        ignore_list: list = ["Simulator", "Topology", "NetworkFlow"],
+        file_name: str = "dataset",
+        file_format: str = "json",
+    ) -> str:
+        """Saves the simulation model to an external dataset file inside the "datasets/" directory. Unlike 'export_scenario()',
+        the scenario is streamed to the file one component class at a time, so the whole scenario is never held in memory.
+
+        Args:
+            ignore_list (list, optional): List of entities that will not be included in the file. Defaults to ["Simulator", "Topology", "NetworkFlow"].
+            file_name (str, optional): Output file name. Defaults to "dataset".
+            file_format (str, optional): Output file format ("json", "compact_json", or "binary", see 'edge_sim_py.binary_scenario'). Defaults to "json".
+
+        Returns:
+            file_path (str): Output file path.
+        """
+        if file_format not in SUPPORTED_SCENARIO_FORMATS:
+            raise Exception(f"Unsupported scenario format {file_format}. Supported formats are {SUPPORTED_SCENARIO_FORMATS}.")
+
+        components = [component for component in ComponentManager.__subclasses__() if component.__name__ not in ignore_list]
 
         # Creating the "datasets" directory if it doesn't exists
         if not os.path.exists("datasets/"):
             os.makedirs("datasets")
 
-        for component in ComponentManager.__subclasses__():
-            if component.__name__ not in ignore_list:
-                scenario[component.__name__] = [instance._to_dict() for instance in component._instances]
-                with open(f"datasets/{file_name}.json", "w", encoding="UTF-8") as output_file:
-                    json.dump(scenario, output_file, indent=4)
+        if file_format == "binary":
+            file_path = f"datasets/{file_name}{BINARY_SCENARIO_EXTENSION}"
 
-        return scenario
+            # Row of each object within its class, used to turn references into index vectors (the first object with an ID wins)
+            rows_by_id = {}
+            for component in components:
+                rows = {}
+                for row, instance in enumerate(component._instances):
+                    rows.setdefault(instance.id, row)
+                rows_by_id[component.__name__] = rows
+
+            with BinaryScenarioWriter(file_path, rows_by_id) as writer:
+                for component in components:
+                    writer.write_class(component.__name__, [instance._to_dict() for instance in component._instances])
+        else:
+            file_path = f"datasets/{file_name}.json"
+
+            with open(file_path, "w", encoding="UTF-8") as output_file:
+                output_file.write("{")
+                for position, component in enumerate(components):
+                    _write_json_class(output_file, component.__name__, component._instances, file_format == "compact_json", position == 0)
+                output_file.write("}" if file_format == "compact_json" or len(components) == 0 else "\n}")
+
+        return file_path
 
     @classmethod
     def _from_dict(cls, dictionary: dict) -> object:
@@ -76,9 +297,95 @@ class ComponentManager:
 
         return created_object
 
+    @classmethod
+    def _from_columns(cls, columns: dict, count: int) -> list:
+        """Method that creates objects based on columns of attribute values (e.g., from binary scenarios). The result is
+        the same as calling '_from_dict()' for each object, but objects are allocated without running the constructor
+        (attributes the columns do not cover take the constructor's default values) and attributes are assigned column by
+        column, without per-object dictionaries.
+
+        Args:
+            columns (dict): Values of each attribute, in object order.
+            count (int): Number of objects.
+
+        Returns:
+            created_objects (list): Objects created from the columns.
+        """
+        # Classes that override '__setattr__' (e.g., NetworkLink, whose attributes are dictionary items) are built as usual
+        if cls.__setattr__ is not object.__setattr__:
+            created_objects = [cls() for _ in range(count)]
+            for attribute, values in columns.items():
+                for created_object, value in zip(created_objects, values):
+                    setattr(created_object, attribute, value)
+            return created_objects
+
+        # Default attribute values, taken from an object that is dropped from the list of instances right after being created
+        template = cls()
+        cls._instances.pop()
+        cls._object_count -= 1
+        defaults = {attribute: value for attribute, value in template.__dict__.items() if attribute not in columns}
+        containers = [(attribute, type(value)) for attribute, value in defaults.items() if type(value) in (list, dict, set)]
+
+        created_objects = [cls.__new__(cls) for _ in range(count)]
+        attributes = [created_object.__dict__ for created_object in created_objects]
+        for values in attributes:
+            values.update(defaults)
+            # Each object gets its own copy of mutable defaults (e.g., empty lists of services)
+            for attribute, container_type in containers:
+                values[attribute] = container_type() if not defaults[attribute] else copy.deepcopy(defaults[attribute])
+
+        # Indexed attributes can be written directly, as new objects are indexed when their class is searched
+        for attribute, values in columns.items():
+            for object_attributes, value in zip(attributes, values):
+                object_attributes[attribute] = value
+
+        cls._instances.extend(created_objects)
+        cls._object_count += count
+        return created_objects
+
+    @classmethod
+    def _indexes(cls) -> dict:
+        """Returns the state of the hash indexes of a given class, bringing them up to date with its list of instances.
+
+        Indexes map each attribute value to the instances that have it, in the order of the list of instances. Objects
+        appended to the list of instances are indexed incrementally and changes to indexed attributes move objects between
+        index entries (see '__init_subclass__()'), while a new list of instances (e.g., after 'Simulator.initialize()') or
+        a removal triggers a rebuild.
+
+        Returns:
+            state (dict): Indexes state.
+        """
+        instances = cls._instances
+        state = cls.__dict__.get("_index_state")
+
+        if state is None or state["stale"] or state["instances"] is not instances or state["count"] > len(instances):
+            attributes = ["id"] + list(cls._indexed_attributes)
+            state = {
+                "instances": instances,
+                "count": 0,
+                "positions": {},
+                "stale": False,
+                "indexes": {attribute: {} for attribute in attributes},
+                "keys": {attribute: {} for attribute in attributes},
+                "unhashable": set(),
+            }
+            cls._index_state = state
+
+        for position in range(state["count"], len(instances)):
+            obj = instances[position]
+            state["positions"][id(obj)] = position
+            for attribute in state["indexes"]:
+                _index_value(state, obj, attribute, position)
+        state["count"] = len(instances)
+
+        return state
+
     @classmethod
     def find_by(cls, attribute_name: str, attribute_value: object) -> object:
-        """Finds objects from a given class based on an user-specified attribute.
+        """Finds objects from a given class based on an user-specified attribute. Searches over "id" and the attributes
+        listed in '_indexed_attributes' take constant time (hits and misses alike), falling back to a linear search when the
+        values are not hashable. Either way, the first instance that has the value is returned. Values changed in place
+        (e.g., an item of an indexed list) are not seen by the indexes, so indexed attributes should be reassigned instead.
 
         Args:
             attribute_name (str): Attribute name.
@@ -87,8 +394,20 @@ class ComponentManager:
         Returns:
             object: Class object.
         """
-        class_object = next((obj for obj in cls._instances if getattr(obj, attribute_name) == attribute_value), None)
-        return class_object
+        indexed = attribute_name == "id" or attribute_name in cls._indexed_attributes
+        if indexed:
+            state = cls._indexes()
+            try:
+                key = _index_key(attribute_value)
+            except TypeError:
+                key = None
+                indexed = False
+
+            if indexed and attribute_name not in state["unhashable"]:
+                objects = state["indexes"][attribute_name].get(key)
+                return objects[0] if objects else None
+
+        return next((obj for obj in cls._instances if getattr(obj, attribute_name) == attribute_value), None)
 
     @classmethod
     def find_by_id(cls, obj_id: int) -> object:
@@ -100,8 +419,7 @@ class ComponentManager:
         Returns:
             class_object (object): Class object found.
         """
-        class_object = next((obj for obj in cls._instances if obj.id == obj_id), None)
-        return class_object
+        return cls.find_by(attribute_name="id", attribute_value=obj_id)
 
     @classmethod
     def all(cls) -> list:
@@ -153,3 +471,8 @@ class ComponentManager:
             raise Exception(f"Object {obj} is not in the list of instances of the '{cls.__name__}' class.")
 
         cls._instances.remove(obj)
+
+        # Rebuilding the indexes on the next search, as another object with the same attribute values may take its place
+        state = cls.__dict__.get("_index_state")
+        if state is not None:
+            state["stale"] = True
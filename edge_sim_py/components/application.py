@@ -13,6 +13,9 @@ class Application(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = []
+
     def __init__(self, obj_id: int = None, label: str = "") -> object:
         """Creates an Application object.
 
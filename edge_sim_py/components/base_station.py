@@ -13,6 +13,12 @@ class BaseStation(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = []
+
+    # Attributes that 'find_by' searches through a hash index
+    _indexed_attributes = ["coordinates"]
+
     def __init__(self, obj_id: int = None) -> object:
         """Creates a BaseStation object.
 
@@ -13,6 +13,12 @@ class ContainerImage(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = ["server"]
+
+    # Attributes that 'find_by' searches through a hash index
+    _indexed_attributes = ["digest"]
+
     def __init__(
         self,
         obj_id: int = None,
@@ -20,6 +20,12 @@ class ContainerRegistry(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = ["server", "available", "cpu_demand", "memory_demand", "_ContainerRegistry__migrations"]
+
+    # Kind of each metric returned by "collect()" (used when metrics are recorded by column)
+    _metric_schema = {"Available": "bool", "CPU Demand": "int64", "RAM Demand": "int64"}
+
     def __init__(self, obj_id: int = None, cpu_demand: int = 0, memory_demand: int = 0) -> object:
         """Creates a ContainerRegistry object.
 
@@ -216,7 +222,7 @@ class ContainerRegistry(ComponentManager, Agent):
 
                     # Removing the unused image from the simulator's agent list and from its class instance list
                     image.model.schedule.remove(image)
-                    image.__class__._instances.remove(image)
+                    image.__class__.remove(image)
 
                 # Removing unused layers
                 for layer in unused_layers:
@@ -227,7 +233,7 @@ class ContainerRegistry(ComponentManager, Agent):
 
                     # Removing the unused layer from the simulator's agent list and from its class instance list
                     layer.model.schedule.remove(layer)
-                    layer.__class__._instances.remove(layer)
+                    layer.__class__.remove(layer)
 
             # Removing relationship between the registry and its server
             self.server.container_registries.remove(self)
@@ -237,4 +243,4 @@ class ContainerRegistry(ComponentManager, Agent):
 
             # Removing the registry
             self.model.schedule.remove(self)
-            self.__class__._instances.remove(self)
+            self.__class__.remove(self)
@@ -21,6 +21,40 @@ class EdgeServer(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = [
+        "active",
+        "available",
+        "cpu_demand",
+        "memory_demand",
+        "disk_demand",
+        "frequency_demand",
+        "ongoing_migrations",
+        "container_registries",
+        "services",
+        "container_images",
+        "container_layers",
+        "waiting_queue",
+        "download_queue",
+    ]
+
+    # Kind of each metric returned by "collect()" (used when metrics are recorded by column)
+    _metric_schema = {
+        "Instance ID": "int64",
+        "Available": "bool",
+        "CPU": "int64",
+        "RAM": "int64",
+        "Disk": "int64",
+        "Frequency": "float64",
+        "CPU Demand": "int64",
+        "RAM Demand": "int64",
+        "Disk Demand": "int64",
+        "Frequency Demand": "float64",
+        "Ongoing Migrations": "int64",
+        "Max. Concurrent Layer Downloads": "int64",
+        "Power Consumption": "float64",
+    }
+
     def __init__(
         self,
         obj_id: int = None,
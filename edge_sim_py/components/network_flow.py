@@ -13,6 +13,9 @@ class NetworkFlow(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Kind of each metric returned by "collect()" (used when metrics are recorded by column)
+    _metric_schema = {"Instance ID": "int64", "Start": "int64"}
+
     def __init__(
         self,
         obj_id: int = None,
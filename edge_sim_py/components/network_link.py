@@ -13,6 +13,9 @@ class NetworkLink(dict, ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = ["active", "active_flows", "bandwidth_demand"]
+
     def __init__(self, obj_id: int = None) -> object:
         """Creates a NetworkLink object.
 
@@ -79,6 +82,8 @@ class NetworkLink(dict, ComponentManager, Agent):
             attribute_value (object): Value for the attribute.
         """
         self[attribute_name] = attribute_value
+        if attribute_name == "id" or attribute_name in self._indexed_attributes:
+            self._reindex(attribute_name)
 
     def __delattr__(self, attribute_name: str):
         """Deletes an object attribute by its name.
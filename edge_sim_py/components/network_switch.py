@@ -16,6 +16,12 @@ class NetworkSwitch(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = ["active"]
+
+    # Kind of each metric returned by "collect()" (used when metrics are recorded by column)
+    _metric_schema = {"Instance ID": "int64", "Power Consumption": "float64"}
+
     def __init__(self, obj_id: int = None) -> object:
         """Creates a NetworkSwitch object.
 
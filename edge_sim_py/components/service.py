@@ -19,6 +19,12 @@ class Service(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = ["server", "_available", "being_provisioned", "_Service__migrations"]
+
+    # Kind of each metric returned by "collect()" (used when metrics are recorded by column)
+    _metric_schema = {"Instance ID": "int64", "Available": "bool", "Being Provisioned": "bool"}
+
     def __init__(
         self,
         obj_id: int = None,
@@ -17,6 +17,9 @@ class Topology(ComponentManager, nx.Graph, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = []
+
     def __init__(self, obj_id: int = None, existing_graph: nx.Graph = None) -> object:
         """Creates a Topology object backed by NetworkX functionality.
 
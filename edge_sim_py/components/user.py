@@ -20,6 +20,12 @@ class User(ComponentManager, Agent):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = ["coordinates", "coordinates_trace", "base_station", "making_requests", "communication_paths", "delays"]
+
+    # Kind of each metric returned by "collect()" (used when metrics are recorded by column)
+    _metric_schema = {"Instance ID": "int64"}
+
     def __init__(self, obj_id: int = None) -> object:
         """Creates an User object.
 
@@ -48,7 +54,7 @@ class User(ComponentManager, Agent):
         # Reference to the base station the user is connected to
         self.base_station = None
 
-        # User access metadata
+        # User access metadata ("making_requests" only keeps the request flags of the current and the next time steps)
         self.making_requests = {}
         self.access_patterns = {}
 
@@ -98,14 +104,18 @@ class User(ComponentManager, Agent):
         return dictionary
 
     def collect(self) -> dict:
-        """Method that collects a set of metrics for the object.
+        """Method that collects a set of metrics for the object. Access metrics only cover the current time step (whether the
+        user is making requests and the current access of each application), so collecting them takes constant time.
 
         Returns:
             metrics (dict): Object metrics.
         """
-        access_history = {}
+        current_step = str(self.model.schedule.steps)
+        making_requests = {}
+        current_access = {}
         for app in self.applications:
-            access_history[str(app.id)] = self.access_patterns[str(app.id)].history
+            making_requests[str(app.id)] = self.making_requests[str(app.id)].get(current_step, False)
+            current_access[str(app.id)] = dict(self.access_patterns[str(app.id)].history[-1])
 
         metrics = {
             "Instance ID": self.id,
@@ -113,8 +123,8 @@ class User(ComponentManager, Agent):
             "Base Station": f"{self.base_station} ({self.base_station.coordinates})" if self.base_station else None,
             "Delays": copy.deepcopy(self.delays),
             "Communication Paths": copy.deepcopy(self.communication_paths),
-            "Making Requests": copy.deepcopy(self.making_requests),
-            "Access History": copy.deepcopy(access_history),
+            "Making Requests": making_requests,
+            "Current Access": current_access,
         }
         return metrics
 
@@ -146,6 +156,9 @@ class User(ComponentManager, Agent):
                 self.making_requests[str(app.id)][str(current_step + 1)] = True
                 self.access_patterns[str(app.id)].get_next_access(start=current_step + 1)
 
+            # Discarding the request flag of the previous time step, so that the attribute doesn't grow over time
+            self.making_requests[str(app.id)].pop(str(current_step - 1), None)
+
         # Re-executing user's mobility model in case no future mobility track is known by the simulator
         if len(self.coordinates_trace) <= self.model.schedule.steps:
             self.mobility_model(self)
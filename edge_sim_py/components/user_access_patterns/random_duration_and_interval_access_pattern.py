@@ -13,6 +13,9 @@ class RandomDurationAndIntervalAccessPattern(ComponentManager):
     _instances = []
     _object_count = 0
 
+    # Attributes that change while a simulation runs (copied by snapshots)
+    _snapshot_attributes = ["history"]
+
     def __init__(
         self,
         obj_id: int = None,
@@ -52,7 +55,7 @@ class RandomDurationAndIntervalAccessPattern(ComponentManager):
         self.duration_values = duration_values
         self.interval_values = interval_values
 
-        # History of user accesses
+        # History of user accesses (only the previous and the current accesses are kept)
         self.history = []
 
         # Updating the user "making_request" for the steps prior to user's first access based on the "start" attribute
@@ -114,4 +117,7 @@ class RandomDurationAndIntervalAccessPattern(ComponentManager):
 
         self.history.append(access)
 
+        # Keeping only the previous and the current accesses, so that the history doesn't grow over time
+        del self.history[:-2]
+
         return access
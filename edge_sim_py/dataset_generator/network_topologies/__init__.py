@@ -5,3 +5,5 @@ __version__ = "1.1.0"
 # Network topologies
 from .partially_connected_hexagonal_mesh import partially_connected_hexagonal_mesh
 from .barabasi_albert import barabasi_albert
+from .grid_mesh import grid_mesh
+from .hierarchical_tree import hierarchical_tree
@@ -5,9 +5,9 @@
 # EdgeSimPy components
 from edge_sim_py.components.topology import Topology
 from edge_sim_py.components.network_link import NetworkLink
+from edge_sim_py.dataset_generator.network_topologies.link_specifications import apply_link_specifications
 
 # Python libraries
-import random
 import networkx as nx
 
 
@@ -32,12 +32,6 @@ def barabasi_albert(network_nodes: list, link_specifications: list = [], min_lin
     # Creating a topology object from the default NetworkX graph object
     topology = Topology(existing_graph=topology)
 
-    # Checking if the number of link specifications is equal to the number of links in the network topology
-    if len(link_specifications) > 0 and sum([spec["number_of_objects"] for spec in link_specifications]) != len(topology.edges()):
-        raise Exception(
-            f"You must specify the properties for {len(topology.edges())} links or ignore the 'link_specifications' parameter."
-        )
-
     # Replacing default NetworkX links with NetworkLink objects
     for link in topology.edges(data=True):
         link_object = NetworkLink()
@@ -51,12 +45,6 @@ def barabasi_albert(network_nodes: list, link_specifications: list = [], min_lin
         topology._adj[link[1]][link[0]] = link_object
 
     # Applying the user-specified attributes to the network links
-    links = (link for link in random.sample(NetworkLink.all(), NetworkLink.count()))
-    for spec in link_specifications:
-        for _ in range(spec["number_of_objects"]):
-            link = next(links)
-            for key, value in spec.items():
-                if key != "number_of_objects":
-                    link[key] = value
+    apply_link_specifications(topology, link_specifications)
 
     return topology
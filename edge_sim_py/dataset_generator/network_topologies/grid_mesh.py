@@ -0,0 +1,49 @@
+"""Contains a method that creates a grid mesh network topology, where each network node is linked to its horizontal and
+vertical neighbors on a quadratic grid map.
+"""
+# EdgeSimPy components
+from edge_sim_py.components.topology import Topology
+from edge_sim_py.components.network_link import NetworkLink
+from edge_sim_py.dataset_generator.network_topologies.link_specifications import apply_link_specifications
+
+
+def grid_mesh(network_nodes: list, link_specifications: list = []) -> object:
+    """Creates a grid mesh network topology. Neighbors are found through a map from coordinates to network nodes, so the
+    topology is built in linear time on the number of network nodes.
+
+    Args:
+        network_nodes (list): Network nodes placed on a quadratic grid (see 'quadratic_grid').
+        link_specifications (list, optional): Technical specifications for the network links. Defaults to [].
+
+    Returns:
+        topology (object): Created topology
+    """
+    # Creating topology and creating initial nodes according to the map coordinates
+    topology = Topology()
+    topology.add_nodes_from(network_nodes)
+
+    nodes_by_coordinates = {tuple(node.coordinates): node for node in network_nodes}
+
+    # Linking each network node to its right and upper neighbors (the left and lower ones link to it)
+    for node in network_nodes:
+        x, y = node.coordinates
+        for neighbor_coordinates in [(x + 1, y), (x, y + 1)]:
+            neighbor = nodes_by_coordinates.get(neighbor_coordinates)
+            if neighbor is None:
+                continue
+
+            link = NetworkLink()
+            link.topology = topology
+
+            # List of network nodes connected by the link
+            link.nodes = [node, neighbor]
+
+            # Replacing NetworkX's default link dictionary with the NetworkLink object
+            topology.add_edge(node, neighbor)
+            topology._adj[node][neighbor] = link
+            topology._adj[neighbor][node] = link
+
+    # Applying the user-specified attributes to the network links
+    apply_link_specifications(topology, link_specifications)
+
+    return topology
@@ -0,0 +1,51 @@
+"""Contains a method that creates a hierarchical (tree) network topology, where the network nodes of each tier are linked
+to the network nodes of the tier above them (e.g., access nodes -> tier-1 fog nodes -> tier-2 fog servers -> cloud).
+"""
+# EdgeSimPy components
+from edge_sim_py.components.topology import Topology
+from edge_sim_py.components.network_link import NetworkLink
+from edge_sim_py.dataset_generator.network_topologies.link_specifications import apply_link_specifications
+
+
+def hierarchical_tree(tiers: list, link_specifications: list = []) -> object:
+    """Creates a hierarchical network topology. The network nodes of each tier are spread in a round-robin fashion among
+    the network nodes of the closest non-empty tier above them, so the topology has one link per network node outside
+    the top tier.
+
+    Args:
+        tiers (list): Lists of network nodes, from the top tier (e.g., the cloud) to the bottom one.
+        link_specifications (list, optional): Technical specifications for the network links. Defaults to [].
+
+    Returns:
+        topology (object): Created topology
+    """
+    topology = Topology()
+    for tier in tiers:
+        topology.add_nodes_from(tier)
+
+    parents = []
+    for tier in tiers:
+        if len(tier) == 0:
+            continue
+
+        if len(parents) > 0:
+            for index, node in enumerate(tier):
+                parent = parents[index % len(parents)]
+
+                link = NetworkLink()
+                link.topology = topology
+
+                # List of network nodes connected by the link
+                link.nodes = [parent, node]
+
+                # Replacing NetworkX's default link dictionary with the NetworkLink object
+                topology.add_edge(parent, node)
+                topology._adj[parent][node] = link
+                topology._adj[node][parent] = link
+
+        parents = tier
+
+    # Applying the user-specified attributes to the network links
+    apply_link_specifications(topology, link_specifications)
+
+    return topology
@@ -0,0 +1,28 @@
+"""Contains a method that applies user-specified attributes to the links of a network topology."""
+# Python libraries
+import random
+
+
+def apply_link_specifications(topology: object, link_specifications: list):
+    """Applies link specifications to the links of a network topology, picking the links that get each specification at
+    random. Only the links of the given topology are changed.
+
+    Args:
+        topology (object): Network topology whose links are NetworkLink objects.
+        link_specifications (list): Technical specifications for the network links.
+    """
+    # Checking if the number of link specifications is equal to the number of links in the network topology
+    if len(link_specifications) > 0 and sum([spec["number_of_objects"] for spec in link_specifications]) != len(topology.edges()):
+        raise Exception(
+            f"You must specify the properties for {len(topology.edges())} links or ignore the 'link_specifications' parameter."
+        )
+
+    # Applying the user-specified attributes to the network links
+    edges = list(topology.edges())
+    links = (topology[node_1][node_2] for node_1, node_2 in random.sample(edges, len(edges)))
+    for spec in link_specifications:
+        for _ in range(spec["number_of_objects"]):
+            link = next(links)
+            for key, value in spec.items():
+                if key != "number_of_objects":
+                    link[key] = value
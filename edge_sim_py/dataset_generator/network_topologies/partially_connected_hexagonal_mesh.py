@@ -6,17 +6,16 @@
 # EdgeSimPy components
 from edge_sim_py.components.topology import Topology
 from edge_sim_py.components.network_link import NetworkLink
+from edge_sim_py.dataset_generator.network_topologies.link_specifications import apply_link_specifications
 
-# Python libraries
-import random
 
-
-def partially_connected_hexagonal_mesh(network_nodes: list, link_specifications: list) -> object:
-    """Creates a partially-connected mesh network topology.
+def partially_connected_hexagonal_mesh(network_nodes: list, link_specifications: list = []) -> object:
+    """Creates a partially-connected mesh network topology. Neighbors are found through a map from coordinates to network
+    nodes, so the topology (including the assignment of link specifications) is built in linear time on the number of nodes.
 
     Args:
         network_nodes (list): Objects that will be assigned as network nodes.
-        link_specifications (list): Technical specifications for the network links.
+        link_specifications (list, optional): Technical specifications for the network links. Defaults to [].
 
     Returns:
         topology (object): Created topology
@@ -25,15 +24,17 @@ def partially_connected_hexagonal_mesh(network_nodes: list, link_specifications:
     topology = Topology()
     topology.add_nodes_from(network_nodes)
 
-    # Gathering the list of coordinates of all network nodes
-    map_coordinates = [node.coordinates for node in network_nodes]
+    # Mapping the coordinates of each network node to the node (the first node placed at a given position wins)
+    nodes_by_coordinates = {}
+    for node in network_nodes:
+        nodes_by_coordinates.setdefault(tuple(node.coordinates), node)
 
     # Adding links to each network node
     for node in network_nodes:
-        neighbors = find_neighbors_hexagonal_grid(current_position=node.coordinates, map_coordinates=map_coordinates)
+        neighbors = find_neighbors_hexagonal_grid(current_position=node.coordinates, map_coordinates=nodes_by_coordinates)
 
         for neighbor_coordinates in neighbors:
-            neighbor = next((n for n in network_nodes if n.coordinates == neighbor_coordinates), None)
+            neighbor = nodes_by_coordinates.get(neighbor_coordinates)
 
             if not neighbor:
                 raise Exception(f"Cannot find network node with coordinates: {neighbor_coordinates}")
@@ -51,21 +52,8 @@ def partially_connected_hexagonal_mesh(network_nodes: list, link_specifications:
                 topology._adj[node][neighbor] = link
                 topology._adj[neighbor][node] = link
 
-    # Checking if the number of link specifications is equal to the number of links in the network topology
-    links_with_missing_specs = sum([spec["number_of_objects"] for spec in link_specifications]) != len(topology.edges())
-    if links_with_missing_specs:
-        raise Exception(
-            f"You must specify the properties for {len(topology.edges())} links or ignore the 'link_specifications' parameter."
-        )
-
     # Applying the user-specified attributes to the network links
-    links = (link for link in random.sample(NetworkLink.all(), NetworkLink.count()))
-    for spec in link_specifications:
-        for _ in range(spec["number_of_objects"]):
-            link = next(links)
-            for key, value in spec.items():
-                if key != "number_of_objects":
-                    link[key] = value
+    apply_link_specifications(topology, link_specifications)
 
     return topology
 
@@ -74,7 +62,7 @@ def find_neighbors_hexagonal_grid(map_coordinates: list, current_position: tuple
     """Finds the set of adjacent positions of coordinates 'current_position' on a hexagonal grid.
 
     Args:
-        map_coordinates (list): List of map coordinates.
+        map_coordinates (list): Map coordinates (a set or a dictionary keyed by coordinates makes the lookup constant-time).
         current_position (tuple): Current position on the map.
 
     Returns:
@@ -0,0 +1,211 @@
+""" Contains the append-only metric log format used by 'Simulator.dump_data_to_disk()'.
+
+Metric logs hold one file per component class ("{logs_directory}/{class name}.msgpack"). Each dump appends a frame with
+the metrics collected since the previous dump, so writing a dump costs the same regardless of how long the simulation
+has been running. Frames hold either a list of metric rows or, when metrics are recorded by column, a columnar frame
+(see 'edge_sim_py.metric_store'). Frames can also be written by a background thread ('AsyncMetricWriter'), so that serialization,
+compression, and disk I/O overlap with the simulation. A frame is MessagePack-encoded or, when compression is enabled, a MessagePack extension whose type code
+identifies the standard library codec that compressed the encoded frame.
+
+Example:
+    'for frame in MetricStream("logs/User.msgpack"): ...' iterates over the frames of a metric log.
+"""
+# EdgeSimPy components
+from edge_sim_py.metric_store import decode_metric_columns
+
+# Python libraries
+import os
+import bz2
+import lzma
+import zlib
+import queue
+import msgpack
+import threading
+import numpy as np
+
+# Extension type code, compression function, and decompression function of each supported codec
+METRIC_CODECS = {
+    "zlib": (1, zlib.compress, zlib.decompress),
+    "bz2": (2, bz2.compress, bz2.decompress),
+    "lzma": (3, lzma.compress, lzma.decompress),
+}
+SUPPORTED_METRIC_COMPRESSIONS = [None] + list(METRIC_CODECS)
+
+
+def encode_metric_frame(rows: object, compression: str = None) -> bytes:
+    """Encodes a list of metric rows (or a columnar frame) as a metric log frame.
+
+    Args:
+        rows (object): Metric rows or columnar frame.
+        compression (str, optional): Compression codec (one of SUPPORTED_METRIC_COMPRESSIONS). Defaults to None.
+
+    Returns:
+        bytes: Encoded frame.
+    """
+    payload = msgpack.packb(rows)
+    if compression is None:
+        return payload
+
+    code, compress, _ = METRIC_CODECS[compression]
+    return msgpack.packb(msgpack.ExtType(code, compress(payload)))
+
+
+def _decode_compressed_frame(code: int, data: bytes) -> list:
+    for codec_code, _, decompress in METRIC_CODECS.values():
+        if codec_code == code:
+            return msgpack.unpackb(decompress(data))
+    raise ValueError(f"Unknown metric frame compression code {code}.")
+
+
+class MetricWriter:
+    """Class that appends metric frames to the metric log of each component class."""
+
+    def __init__(self, logs_directory: str, compression: str = None):
+        """Creates a MetricWriter object. Metric logs that already exist are overwritten by the first frame written to them.
+
+        Args:
+            logs_directory (str): Directory where the metric logs are stored.
+            compression (str, optional): Compression codec (one of SUPPORTED_METRIC_COMPRESSIONS). Defaults to None.
+        """
+        if compression not in SUPPORTED_METRIC_COMPRESSIONS:
+            raise Exception(
+                f"Unsupported metric compression {compression}. Supported compressions are {SUPPORTED_METRIC_COMPRESSIONS}."
+            )
+
+        self.logs_directory = logs_directory
+        self.compression = compression
+
+        # Names of the classes whose metric logs were created by this writer (frames are appended to them from then on)
+        self.started = set()
+
+    def write(self, class_name: str, rows: object):
+        """Appends a frame to the metric log of a component class.
+
+        Args:
+            class_name (str): Component class name.
+            rows (object): Metric rows or columnar frame.
+        """
+        if not os.path.exists(f"{self.logs_directory}/"):
+            os.makedirs(f"{self.logs_directory}")
+
+        mode = "ab" if class_name in self.started else "wb"
+        with open(f"{self.logs_directory}/{class_name}.msgpack", mode) as output_file:
+            output_file.write(encode_metric_frame(rows, self.compression))
+        self.started.add(class_name)
+
+    def flush(self):
+        """Waits until every frame handed to the writer is on disk (frames are written right away by this class)."""
+
+    def close(self):
+        """Flushes the writer and releases its resources."""
+        self.flush()
+
+
+class AsyncMetricWriter(MetricWriter):
+    """Class that appends metric frames to the metric logs from a background thread. Frames wait in a bounded queue, so
+    'write()' blocks (applying backpressure on the simulation) whenever the thread falls 'max_pending' frames behind.
+    Rows handed to 'write()' must not be modified afterwards, as they may be serialized later.
+    """
+
+    def __init__(self, logs_directory: str, compression: str = None, max_pending: int = 8):
+        """Creates an AsyncMetricWriter object.
+
+        Args:
+            logs_directory (str): Directory where the metric logs are stored.
+            compression (str, optional): Compression codec (one of SUPPORTED_METRIC_COMPRESSIONS). Defaults to None.
+            max_pending (int, optional): Maximum number of frames waiting to be written. Defaults to 8.
+        """
+        MetricWriter.__init__(self, logs_directory=logs_directory, compression=compression)
+
+        self.pending = queue.Queue(maxsize=max_pending)
+        self.error = None
+        self.thread = None
+
+    def write(self, class_name: str, rows: object):
+        """Queues a frame to be appended to the metric log of a component class.
+
+        Args:
+            class_name (str): Component class name.
+            rows (object): Metric rows or columnar frame.
+        """
+        self._raise_error()
+
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="MetricWriter", daemon=True)
+            self.thread.start()
+
+        self.pending.put((class_name, rows))
+
+    def flush(self):
+        """Waits until every queued frame is on disk."""
+        if self.thread is not None:
+            self.pending.join()
+        self._raise_error()
+
+    def close(self):
+        """Flushes the writer and stops its thread."""
+        try:
+            self.flush()
+        finally:
+            if self.thread is not None:
+                self.pending.put(None)
+                self.thread.join()
+                self.thread = None
+
+    def _run(self):
+        while True:
+            frame = self.pending.get()
+            try:
+                if frame is None:
+                    return
+                # Frames that arrive after an error are dropped (the error is raised by the next write or flush)
+                if self.error is None:
+                    MetricWriter.write(self, *frame)
+            except Exception as error:
+                self.error = error
+            finally:
+                self.pending.task_done()
+
+    def _raise_error(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+
+class MetricStream:
+    """Iterates over the frames (lists of metric rows or columnar frames) of a metric log, reading the file incrementally."""
+
+    def __init__(self, file_path: str):
+        """Creates a MetricStream object.
+
+        Args:
+            file_path (str): Metric log path.
+        """
+        self.file_path = file_path
+
+    def __iter__(self):
+        with open(self.file_path, "rb") as input_file:
+            yield from msgpack.Unpacker(input_file, ext_hook=_decode_compressed_frame, max_buffer_size=0)
+
+    def rows(self):
+        """Iterates over the metric rows of the log, one frame at a time (columnar frames are turned into rows)."""
+        for frame in self:
+            if type(frame) is dict:
+                columns = [(name, column.tolist() if type(column) is np.ndarray else column) for name, column in decode_metric_columns(frame).items()]
+                for row in range(frame["count"]):
+                    yield {name: column[row] for name, column in columns}
+            else:
+                yield from frame
+
+    def columns(self):
+        """Iterates over the columns of the log, one frame at a time (frames of rows are turned into columns).
+
+        Yields:
+            columns (dict): NumPy arrays (typed columns) and lists (other columns) by metric name.
+        """
+        for frame in self:
+            if type(frame) is dict:
+                yield decode_metric_columns(frame)
+            else:
+                names = list(dict.fromkeys(name for row in frame for name in row))
+                yield {name: [row.get(name) for row in frame] for name in names}
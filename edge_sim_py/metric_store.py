@@ -0,0 +1,133 @@
+""" Contains the columnar metric store used by 'Simulator.monitor()' when metrics are recorded by column.
+
+Instead of keeping one dictionary per agent and time step, 'MetricColumns' appends the metrics of each agent to one
+column per metric. Component classes declare the type of their metrics once ('_metric_schema'), so numeric and boolean
+metrics go into typed arrays, while the other metrics (and typed metrics whose values turn out not to fit their declared
+type) are kept as lists. Columns are written to the metric logs as columnar frames (see 'edge_sim_py.metric_log').
+"""
+# Python libraries
+from array import array
+import numpy as np
+
+SUPPORTED_METRIC_LAYOUTS = ["rows", "columns"]
+
+# Python type and array type code of each typed column kind (any other kind is stored as a list)
+METRIC_COLUMN_TYPES = {
+    "int64": (int, "q"),
+    "float64": (float, "d"),
+    "bool": (bool, "b"),
+}
+
+
+class MetricColumns:
+    """Class that stores the metrics of a component class by column."""
+
+    def __init__(self, schema: dict = {}):
+        """Creates a MetricColumns object.
+
+        Args:
+            schema (dict, optional): Kind of each metric ("int64", "float64", "bool", or "object"). Metrics missing from the
+                schema are stored as lists. Defaults to {}.
+        """
+        self.kinds = {"Object": "object", "Time Step": "int64", **schema}
+        self.columns = {}
+
+        # Python type of the values of each typed column
+        self.types = {}
+
+        # Number of rows (one per agent and time step)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _new_column(self, name: str) -> object:
+        kind = self.kinds.get(name, "object")
+
+        # Rows recorded before the column existed get None, which only lists can hold
+        if kind in METRIC_COLUMN_TYPES and self.count == 0:
+            column = array(METRIC_COLUMN_TYPES[kind][1])
+            self.types[name] = METRIC_COLUMN_TYPES[kind][0]
+        else:
+            column = [None] * self.count
+
+        self.columns[name] = column
+        return column
+
+    def _append(self, name: str, value: object):
+        column = self.columns.get(name)
+        if column is None:
+            column = self._new_column(name)
+
+        if type(column) is list:
+            column.append(value)
+        elif type(value) is self.types[name]:
+            column.append(value)
+        else:
+            # Values that don't fit the declared type turn the column into a list, so no value is ever converted
+            values = column.tolist()
+            if self.types.pop(name) is bool:
+                values = [bool(item) for item in values]
+            values.append(value)
+            self.columns[name] = values
+
+    def append(self, time_step: int, object_name: str, metrics: dict):
+        """Appends the metrics of an agent.
+
+        Args:
+            time_step (int): Time step in which the metrics were collected.
+            object_name (str): Agent representation (e.g., "User_1").
+            metrics (dict): Agent metrics.
+        """
+        self._append("Object", object_name)
+        self._append("Time Step", time_step)
+        for name, value in metrics.items():
+            self._append(name, value)
+
+        self.count += 1
+
+        # Metrics the agent didn't report are recorded as None
+        if len(metrics) + 2 < len(self.columns):
+            for name, column in list(self.columns.items()):
+                if len(column) < self.count:
+                    self._append(name, None)
+
+    def frame(self, start: int = 0) -> dict:
+        """Returns the rows recorded from a given position on as a columnar frame.
+
+        Args:
+            start (int, optional): First row of the frame. Defaults to 0.
+
+        Returns:
+            frame (dict): Number of rows ("count") and columns ("columns"). Typed columns are encoded as {"dtype", "data"}.
+        """
+        columns = {}
+        for name, column in self.columns.items():
+            if type(column) is list:
+                columns[name] = column[start:]
+            else:
+                dtype = "|b1" if self.types[name] is bool else np.dtype(column.typecode).str
+                columns[name] = {"dtype": dtype, "data": column[start:].tobytes()}
+
+        return {"count": self.count - start, "columns": columns}
+
+    def clear(self):
+        """Removes every recorded row."""
+        self.columns = {}
+        self.types = {}
+        self.count = 0
+
+
+def decode_metric_columns(frame: dict) -> dict:
+    """Decodes the columns of a columnar frame.
+
+    Args:
+        frame (dict): Columnar frame.
+
+    Returns:
+        columns (dict): NumPy arrays (typed columns) and lists (other columns) by metric name.
+    """
+    return {
+        name: np.frombuffer(column["data"], dtype=column["dtype"]) if type(column) is dict else column
+        for name, column in frame["columns"].items()
+    }
@@ -0,0 +1,130 @@
+""" Contains the incremental JSON dataset reader.
+
+JSON datasets map each component class name to an array of objects. Instead of materializing the whole document,
+'JSONScenarioStream' reads the file in chunks and decodes one object at a time, so only the current chunk and the
+object being built are held in memory on top of what the caller keeps.
+
+Example:
+    'for class_name, object_metadata in JSONScenarioStream("datasets/dataset.json"): ...'
+"""
+# Python libraries
+import re
+import json
+import time
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONScenarioStream:
+    """Iterates over the (class name, object metadata) pairs of a JSON dataset file, in file order."""
+
+    def __init__(self, file_path: str, chunk_size: int = 1 << 20):
+        """Creates a JSONScenarioStream object.
+
+        Args:
+            file_path (str): JSON dataset path.
+            chunk_size (int, optional): Number of characters read from the file at a time. Defaults to 1 << 20.
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+
+        # Time (in seconds) spent reading and decoding the file, excluding the time the consumer takes between objects
+        self.parse_time = 0
+
+    def __iter__(self):
+        self.parse_time = 0
+        # Keys are shared among decoded objects, as json.load does within a single document
+        keys = {}
+        self._decoder = json.JSONDecoder(object_pairs_hook=lambda pairs: {keys.setdefault(k, k): v for k, v in pairs})
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+        with open(self.file_path, "r", encoding="UTF-8") as self._file:
+            started = time.perf_counter()
+
+            self._expect("{")
+            if self._peek() == "}":
+                self.parse_time += time.perf_counter() - started
+                return
+
+            while True:
+                class_name = self._decode()
+                if type(class_name) is not str:
+                    raise ValueError(f"Invalid dataset file {self.file_path}: expected a component class name.")
+                self._expect(":")
+
+                if self._peek() == "[":
+                    self._position += 1
+                    if self._peek() == "]":
+                        self._position += 1
+                    else:
+                        while True:
+                            object_metadata = self._decode()
+                            self.parse_time += time.perf_counter() - started
+                            yield class_name, object_metadata
+                            started = time.perf_counter()
+
+                            if self._separator("]"):
+                                break
+                else:
+                    # Values other than arrays are decoded whole
+                    for object_metadata in self._decode():
+                        self.parse_time += time.perf_counter() - started
+                        yield class_name, object_metadata
+                        started = time.perf_counter()
+
+                if self._separator("}"):
+                    break
+
+            self.parse_time += time.perf_counter() - started
+
+    def _read(self) -> bool:
+        """Appends a chunk of the file to the buffer, dropping the part that has already been decoded."""
+        if self._eof:
+            return False
+
+        chunk = self._file.read(max(self.chunk_size, len(self._buffer) - self._position))
+        if chunk == "":
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skips whitespace and returns the next character (an empty string at the end of the file)."""
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer) or not self._read():
+                return self._buffer[self._position : self._position + 1]
+
+    def _expect(self, character: str):
+        if self._peek() != character:
+            raise ValueError(f"Invalid dataset file {self.file_path}: expected '{character}' at offset {self._position}.")
+        self._position += 1
+
+    def _separator(self, closing: str) -> bool:
+        """Consumes a comma or the closing character of the current array/object. Returns True for the latter."""
+        character = self._peek()
+        if character == ",":
+            self._position += 1
+            return False
+        self._expect(closing)
+        return True
+
+    def _decode(self) -> object:
+        """Decodes the JSON value that starts at the current position, reading more of the file until it is complete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+
+                # A value that ends with the buffer (e.g., a number) might continue in the next chunk
+                if end < len(self._buffer) or not self._read():
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
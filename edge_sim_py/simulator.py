@@ -1,6 +1,10 @@
 """ Contains all the simulation management functionality."""
 # EdgeSimPy components
 from edge_sim_py.component_manager import ComponentManager
+from edge_sim_py.binary_scenario import BinaryScenario, is_binary_scenario
+from edge_sim_py.scenario_stream import JSONScenarioStream
+from edge_sim_py.metric_log import MetricWriter, AsyncMetricWriter, SUPPORTED_METRIC_COMPRESSIONS
+from edge_sim_py.metric_store import MetricColumns, SUPPORTED_METRIC_LAYOUTS
 from edge_sim_py.components import *
 from edge_sim_py.activation_schedulers import *
 
@@ -8,16 +12,93 @@ from edge_sim_py.activation_schedulers import *
 from mesa import Model, Agent
 
 # Python libraries
+import gc
 import os
+import marshal
 import json
-import msgpack
+import time
 from typing import Callable
+from contextlib import contextmanager
 from datetime import timedelta
 from urllib.parse import urlparse
 from urllib.request import urlopen
 
 SUPPORTED_TIME_UNITS = ["seconds", "microseconds", "milliseconds", "minutes"]
 
+# Metric collection intervals other than a number of time steps
+SUPPORTED_METRIC_INTERVALS = ["on_change", "never"]
+
+# Attribute values copied by snapshots (anything else is kept by reference)
+CONTAINER_TYPES = (list, dict, set)
+
+
+def _copy_state(value: object) -> object:
+    """Copies the containers (lists, dictionaries, and sets) of an attribute value. Components and any other objects are
+    kept by reference, so a restored state still points to the same component objects.
+
+    Args:
+        value (object): Attribute value.
+
+    Returns:
+        object: Copy of the value.
+    """
+    value_type = type(value)
+    if value_type is list:
+        return [_copy_state(item) if type(item) in CONTAINER_TYPES else item for item in value]
+    if value_type is dict:
+        return {key: _copy_state(item) if type(item) in CONTAINER_TYPES else item for key, item in value.items()}
+    if value_type is set:
+        return set(value)
+    return value
+
+
+
+def _copy_column(values: list) -> object:
+    """Copies the values of one attribute of all instances of a class. Columns of plain data (numbers, strings, and
+    containers of them) are serialized with "marshal", which copies nested containers much faster than '_copy_state()'.
+    Columns that reference components are copied with '_copy_state()' instead, keeping the components by reference.
+
+    Args:
+        values (list): Attribute values.
+
+    Returns:
+        object: Serialized values (bytes) or copy of the values (list).
+    """
+    try:
+        return marshal.dumps(values)
+    except ValueError:
+        return _copy_state(values)
+
+
+def _load_column(column: object) -> list:
+    """Returns a new copy of the values stored by '_copy_column()'.
+
+    Args:
+        column (object): Column returned by '_copy_column()'.
+
+    Returns:
+        list: Attribute values.
+    """
+    return marshal.loads(column) if type(column) is bytes else _copy_state(column)
+
+
+# Placeholder for attributes an object does not have when its class is snapshotted
+_MISSING = object()
+
+
+@contextmanager
+def _garbage_collection_paused():
+    """Pauses the garbage collector while many objects are allocated at once (e.g., when loading datasets or taking
+    snapshots). Otherwise, the collector keeps scanning every loaded component as new objects are allocated, which can
+    take longer than creating them."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
 
 class Simulator(ComponentManager, Model):
     """Class responsible for managing the simulation."""
@@ -39,6 +120,10 @@ class Simulator(ComponentManager, Model):
         scheduler: Callable = DefaultScheduler,
         dump_interval: int = 100,
         logs_directory: str = "logs",
+        metrics_compression: str = None,
+        metrics_queue_size: int = 0,
+        metrics_layout: str = "rows",
+        metrics_collection: dict = {},
     ) -> object:
         """Creates a Simulator object.
 
@@ -52,6 +137,10 @@ class Simulator(ComponentManager, Model):
             scheduler (Callable, optional): Agent activation scheduler regime.
             dump_interval (int, optional): Interval (in time steps) between each time EdgeSimPy dumps simulation data to disk.
             logs_directory (str, optional): Name of the directory where the simulation logs will be stored.
+            metrics_compression (str, optional): Codec that compresses the frames of the metric logs (see 'edge_sim_py.metric_log'). Defaults to None.
+            metrics_queue_size (int, optional): Number of metric frames that can wait for a background writer thread, which writes them while the simulation goes on (0 writes them synchronously). Defaults to 0.
+            metrics_layout (str, optional): Whether agent metrics are recorded as one dictionary per agent and time step ("rows") or by column ("columns", see 'edge_sim_py.metric_store'). Defaults to "rows".
+            metrics_collection (dict, optional): Collection settings by component class name. "interval" is a number of time steps, "on_change" (metrics are only recorded when they differ from the ones last recorded for the agent), or "never", and "fields" lists the metrics that are recorded. Classes not listed are collected every time step. Defaults to {}.
 
         Returns:
             object: Created Simulator object.
@@ -77,6 +166,22 @@ class Simulator(ComponentManager, Model):
         if seconds + microseconds + milliseconds + minutes == 0:
             raise Exception("Tick duration attribute must be greater than zero.")
 
+        if metrics_compression not in SUPPORTED_METRIC_COMPRESSIONS:
+            raise Exception(
+                f"Unsupported metric compression {metrics_compression}. Supported compressions are {SUPPORTED_METRIC_COMPRESSIONS}."
+            )
+
+        if metrics_layout not in SUPPORTED_METRIC_LAYOUTS:
+            raise Exception(f"Unsupported metrics layout {metrics_layout}. Supported layouts are {SUPPORTED_METRIC_LAYOUTS}.")
+
+        for class_name, settings in metrics_collection.items():
+            interval = settings.get("interval", 1)
+            if interval not in SUPPORTED_METRIC_INTERVALS and (type(interval) is not int or interval < 1):
+                raise Exception(
+                    f"Unsupported metric collection interval {interval} for {class_name}. Supported intervals are positive "
+                    f"numbers of time steps and {SUPPORTED_METRIC_INTERVALS}."
+                )
+
         self.tick_duration = timedelta(
             seconds=seconds, microseconds=microseconds, milliseconds=milliseconds, minutes=minutes
         ).total_seconds()
@@ -84,6 +189,12 @@ class Simulator(ComponentManager, Model):
         # Simulation metrics
         self.model_metrics = {}
         self.agent_metrics = {}
+        self.metric_columns = {}
+        self.metrics_layout = metrics_layout
+        self.metrics_collection = metrics_collection
+
+        # Metrics last recorded for each agent (by unique ID) whose class is collected "on_change"
+        self.last_metrics = {}
 
         # Defining the model schedule
         self.schedule = scheduler(self)
@@ -108,22 +219,37 @@ class Simulator(ComponentManager, Model):
         self.last_dump = 0
         self.dump_interval = dump_interval
         self.logs_directory = logs_directory
+        self.metrics_compression = metrics_compression
+        self.metrics_queue_size = metrics_queue_size
+
+        # Writer that appends each dump to the metric logs, and number of metric rows of each class already dumped
+        self.metric_writer = None
+        self.dumped_metrics = {}
 
         # Attribute that stores the network topology used during the simulation
         self.topology = None
 
+        # Duration (in seconds) of each phase of the last call to "initialize()"
+        self.load_timings = {}
+
         # Storing a reference to the Simulator object inside the ComponentManager class
         ComponentManager._ComponentManager__model = self
 
         # Adding the new object to the list of instances of its class
         self.__class__._instances.append(self)
 
-    def initialize(self, input_file: str) -> None:
+    @_garbage_collection_paused()
+    def initialize(self, input_file: str, stream: bool = False) -> None:
         """Sets up the initial values for state variables, which includes, e.g., loading components from a dataset file.
+        The duration of each loading phase (parse, construct, wire, and topology) is stored in the "load_timings" attribute.
 
         Args:
-            input_file (str): Dataset file (URL for external JSON file, path for local JSON file, Python dictionary).
+            input_file (str): Dataset file (URL for external JSON file, path for local JSON or binary file, Python dictionary).
+            stream (bool, optional): Parses local JSON files one object at a time while building components, which lowers
+                peak memory at the cost of a slower parse (see 'edge_sim_py.scenario_stream'). Defaults to False.
         """
+        load_started = time.perf_counter()
+
         # Resetting the list of instances of EdgeSimPy's component classes
         for component_class in ComponentManager.__subclasses__():
             if component_class.__name__ != "Simulator":
@@ -143,43 +269,125 @@ class Simulator(ComponentManager, Model):
 
         # If "input_file" points to the local filesystem, checks if the file exists and parses it
         else:
-            if os.path.exists(input_file):
-                with open(input_file, "r", encoding="UTF-8") as read_file:
-                    data = json.load(read_file)
+            file_path = input_file if os.path.exists(input_file) else f"{os.getcwd()}/{input_file}"
+
+            # Binary scenarios are memory-mapped instead of parsed
+            if is_binary_scenario(file_path):
+                data = BinaryScenario(file_path)
 
-            elif os.path.exists(f"{os.getcwd()}/{input_file}"):
-                with open(f"{os.getcwd()}/{input_file}", "r", encoding="UTF-8") as read_file:
+            # Streamed JSON files are parsed one object at a time while components are built
+            elif os.path.exists(file_path) and stream:
+                data = JSONScenarioStream(file_path)
+
+            elif os.path.exists(file_path):
+                with open(file_path, "r", encoding="UTF-8") as read_file:
                     data = json.load(read_file)
 
         # Raising exception if the dataset could not be loaded based on the specified arguments
-        if type(data) is not dict:
+        if type(data) not in [dict, BinaryScenario, JSONScenarioStream]:
             raise TypeError("EdgeSimPy could not load the dataset based on the specified arguments.")
 
-        # Creating simulator components based on the specified input data
-        missing_keys = [key for key in data.keys() if key not in globals()]
+        # Creating simulator components based on the specified input data (class names in streamed files are checked as they come)
+        class_names = list(data.keys()) if type(data) is dict else list(data.classes) if type(data) is BinaryScenario else []
+        missing_keys = [key for key in class_names if key not in globals()]
         if len(missing_keys) > 0:
             raise Exception(f"\n\nCould not find component classes named: {missing_keys}. Please check your input file.\n\n")
 
+        parsed = time.perf_counter()
+
         # Creating a list that will store all the relationships among components
         components = []
+        components_by_class = {}
 
         # Creating the topology object and storing a reference to it as an attribute of the Simulator instance
         topology = self.initialize_agent(agent=Topology())
         self.topology = topology
 
-        # Creating simulator components
-        for key in data.keys():
+        def add_component(key: str, object_metadata: dict):
             if key != "Simulator" and key != "Topology":
-                for object_metadata in data[key]:
-                    new_component = globals()[key]._from_dict(dictionary=object_metadata["attributes"])
-                    new_component.relationships = object_metadata["relationships"]
+                if key not in globals():
+                    raise Exception(f"\n\nCould not find component classes named: {[key]}. Please check your input file.\n\n")
+
+                new_component = globals()[key]._from_dict(dictionary=object_metadata["attributes"])
+                new_component.relationships = object_metadata["relationships"]
 
-                    if hasattr(new_component, "model") and hasattr(new_component, "unique_id"):
-                        self.initialize_agent(agent=new_component)
+                if hasattr(new_component, "model") and hasattr(new_component, "unique_id"):
+                    self.initialize_agent(agent=new_component)
 
-                    components.append(new_component)
+                components.append(new_component)
+                components_by_class.setdefault(key, []).append(new_component)
+
+        # Creating simulator components
+        if type(data) is JSONScenarioStream:
+            objects = data
+        elif type(data) is dict:
+            objects = (
+                (key, object_metadata)
+                for key in class_names
+                if key != "Simulator" and key != "Topology"
+                for object_metadata in data[key]
+            )
+        else:
+            # Classes stored by column in binary scenarios are built straight from their columns, skipping per-object
+            # dictionaries. Relationships stored as index vectors are wired separately from the other ones
+            objects = []
+            for key in class_names:
+                if key == "Simulator" or key == "Topology":
+                    continue
+                if "objects" in data.classes[key]:
+                    for object_metadata in data.rows(key):
+                        add_component(key, object_metadata)
+                    continue
+
+                class_components = self._components_from_columns(data, key)
+                components.extend(class_components)
+                components_by_class.setdefault(key, []).extend(class_components)
+
+        for key, object_metadata in objects:
+            add_component(key, object_metadata)
+
+        constructed = time.perf_counter()
+
+        # Time spent parsing a streamed file is interleaved with the construction of components
+        parse_time = parsed - load_started
+        if type(data) is JSONScenarioStream:
+            parse_time += data.parse_time
+            parsed += data.parse_time
+
+        # Defining relationships between components (references are resolved through per-class maps of IDs to objects)
+        id_maps = {}
+
+        def resolve(reference: object) -> object:
+            if type(reference) != dict or "class" not in reference or reference["class"] not in globals():
+                return None
+
+            class_name = reference["class"]
+            if class_name not in id_maps:
+                # Iterating backwards so that the first instance with a given ID wins, as in "find_by_id()"
+                id_maps[class_name] = {obj.id: obj for obj in reversed(globals()[class_name].all())}
+            return id_maps[class_name].get(reference.get("id"))
+
+        # Relationships stored as index vectors in binary scenarios point directly to rows of the referenced class
+        if type(data) is BinaryScenario:
+            for class_name, class_components in components_by_class.items():
+                for key in data.classes[class_name].get("relationships", {}):
+                    kind, target, columns = data.references(class_name, key)
+                    if kind == "objects":
+                        continue
+
+                    if target is None or target in components_by_class:
+                        targets = components_by_class.get(target, [])
+                    else:
+                        # Classes that are not built from the dataset (e.g., "Topology") are matched by ID
+                        targets = [resolve({"class": target, "id": obj_id}) for obj_id in data.ids(target)]
+                    if kind == "reference":
+                        for component, row in zip(class_components, columns[0].tolist()):
+                            setattr(component, f"{key}", targets[row] if row >= 0 else None)
+                    else:
+                        offsets, rows = columns[0].tolist(), columns[1].tolist()
+                        for i, component in enumerate(class_components):
+                            setattr(component, f"{key}", [targets[row] for row in rows[offsets[i] : offsets[i + 1]]])
 
-        # Defining relationships between components
         for component in components:
             for key, value in component.relationships.items():
                 # Defining attributes referencing callables (i.e., functions and methods)
@@ -190,11 +398,7 @@ class Simulator(ComponentManager, Model):
                 elif type(value) == list:
                     attribute_values = []
                     for item in value:
-                        obj = (
-                            globals()[item["class"]].find_by_id(item["id"])
-                            if type(item) == dict and "class" in item and item["class"] in globals()
-                            else None
-                        )
+                        obj = resolve(item)
 
                         if obj == None:
                             raise Exception(f"List relationship '{key}' of component {component} has an invalid item: {item}.")
@@ -205,11 +409,7 @@ class Simulator(ComponentManager, Model):
 
                 # Defining attributes that reference a single component (e.g., an edge server, an user, etc.)
                 elif type(value) == dict and "class" in value and "id" in value:
-                    obj = (
-                        globals()[value["class"]].find_by_id(value["id"])
-                        if type(value) == dict and "class" in value and value["class"] in globals()
-                        else None
-                    )
+                    obj = resolve(value)
 
                     if obj == None:
                         raise Exception(f"Relationship '{key}' of component {component} references an invalid object: {value}.")
@@ -222,7 +422,7 @@ class Simulator(ComponentManager, Model):
                 ):
                     attribute = {}
                     for k, v in value.items():
-                        obj = globals()[v["class"]].find_by_id(v["id"]) if "class" in v and v["class"] in globals() else None
+                        obj = resolve(v)
                         if obj == None:
                             raise Exception(
                                 f"Relationship '{key}' of component {component} references an invalid object: {value}."
@@ -238,6 +438,8 @@ class Simulator(ComponentManager, Model):
                 else:
                     raise Exception(f"Couldn't add the relationship {key} with value {value}. Please check your dataset.")
 
+        wired = time.perf_counter()
+
         # Filling the network topology
         for link in NetworkLink.all():
             # Adding the nodes connected by the link to the topology
@@ -249,6 +451,113 @@ class Simulator(ComponentManager, Model):
             topology._adj[link.nodes[0]][link.nodes[1]] = link
             topology._adj[link.nodes[1]][link.nodes[0]] = link
 
+        self.load_timings = {
+            "parse": parse_time,
+            "construct": constructed - parsed,
+            "wire": wired - constructed,
+            "topology": time.perf_counter() - wired,
+        }
+
+    def _components_from_columns(self, data: BinaryScenario, class_name: str) -> list:
+        """Creates the components of a class stored by column in a binary scenario (see 'ComponentManager._from_columns()').
+
+        Args:
+            data (BinaryScenario): Binary scenario.
+            class_name (str): Component class name.
+
+        Returns:
+            class_components (list): Created components, in row order.
+        """
+        specification = data.classes[class_name]
+        count = specification["count"]
+        class_components = globals()[class_name]._from_columns(
+            {name: data.attribute_values(class_name, name) for name in specification["attributes"]}, count
+        )
+
+        # Relationships kept as they are (i.e., not stored as index vectors) are wired like the ones from JSON datasets
+        relationships = [{} for _ in range(count)]
+        for name in specification["relationships"]:
+            kind, _, columns = data.references(class_name, name)
+            if kind == "objects":
+                for component_relationships, value in zip(relationships, columns[0]):
+                    component_relationships[name] = value
+        for component, component_relationships in zip(class_components, relationships):
+            component.relationships = component_relationships
+
+        if count > 0 and hasattr(class_components[0], "model") and hasattr(class_components[0], "unique_id"):
+            for component in class_components:
+                self.initialize_agent(agent=component)
+
+        return class_components
+
+    def snapshot(self) -> dict:
+        """Captures the state of the simulator and its components (e.g., right after "initialize()") so that it can be
+        brought back with "restore()" instead of reloading the dataset. Only the attributes listed in the
+        "_snapshot_attributes" of each component class are copied, as the others do not change while a simulation runs.
+
+        Returns:
+            snapshot (dict): Lists of instances of each component class and copies of the per-run attributes of every object
+                (items, for components that are dictionaries).
+        """
+        classes = {
+            component_class: (list(component_class._instances), component_class._object_count)
+            for component_class in ComponentManager.__subclasses__()
+            if component_class.__name__ != "Simulator"
+        }
+
+        objects = [self, self.schedule]
+        columns = []
+        with _garbage_collection_paused():
+            for component_class, (instances, _) in classes.items():
+                attribute_names = component_class._snapshot_attributes
+                if attribute_names is None:
+                    objects.extend(instances)
+                elif attribute_names:
+                    # Components that are dictionaries (e.g., NetworkLink) store their attributes as items
+                    stores_items = issubclass(component_class, dict)
+                    values = instances if stores_items else [obj.__dict__ for obj in instances]
+                    attributes = {
+                        name: _copy_column([value.get(name, _MISSING) for value in values]) for name in attribute_names
+                    }
+                    columns.append((instances, stores_items, attributes))
+
+            states = [
+                (obj, _copy_state(obj.__dict__), _copy_state(dict(obj)) if isinstance(obj, dict) else None) for obj in objects
+            ]
+
+        return {"classes": classes, "states": states, "columns": columns, "random": self.random.getstate()}
+
+    def restore(self, snapshot: dict):
+        """Brings the simulator and its components back to the state captured by "snapshot()". Components keep their
+        identity, so references held elsewhere (e.g., lists of users) remain valid. Objects created after the snapshot
+        are dropped from the lists of instances of their classes.
+
+        Args:
+            snapshot (dict): Snapshot returned by "snapshot()".
+        """
+        for component_class, (instances, object_count) in snapshot["classes"].items():
+            component_class._instances = list(instances)
+            component_class._object_count = object_count
+
+        with _garbage_collection_paused():
+            for obj, state, items in snapshot["states"]:
+                obj.__dict__.clear()
+                obj.__dict__.update(_copy_state(state))
+                if items is not None:
+                    obj.clear()
+                    obj.update(_copy_state(items))
+
+            for instances, stores_items, attributes in snapshot["columns"]:
+                values = instances if stores_items else [obj.__dict__ for obj in instances]
+                for name, column in attributes.items():
+                    for value, attribute in zip(values, _load_column(column)):
+                        if attribute is _MISSING:
+                            value.pop(name, None)
+                        else:
+                            value[name] = attribute
+
+        self.random.setstate(snapshot["random"])
+
     def run_model(self):
         """Executes the simulation."""
         if self.stopping_criterion == None:
@@ -257,21 +566,35 @@ class Simulator(ComponentManager, Model):
         if self.resource_management_algorithm == None:
             raise Exception("Please assign the 'resource_management_algorithm' attribute before starting the simulation.")
 
-        # Calls the method that collects monitoring data about the agents
-        self.monitor()
-
-        while self.running:
-            # Calls the method that advances the simulation time
-            self.step()
-
+        try:
             # Calls the method that collects monitoring data about the agents
             self.monitor()
 
-            # Checks if the simulation should end according to the stop condition
-            self.running = False if self.stopping_criterion(self) else True
+            while self.running:
+                # Calls the method that advances the simulation time
+                self.step()
 
-        # Dumps simulation data to the disk to make sure no metrics are discarded
-        self.dump_data_to_disk()
+                # Calls the method that collects monitoring data about the agents
+                self.monitor()
+
+                # Checks if the simulation should end according to the stop condition
+                self.running = False if self.stopping_criterion(self) else True
+
+            # Dumps simulation data to the disk to make sure no metrics are discarded
+            self.dump_data_to_disk()
+        except BaseException:
+            # Still waits for the queued metrics to reach the disk, but errors from the writer must not replace the error
+            # that stopped the simulation
+            if self.metric_writer is not None:
+                try:
+                    self.metric_writer.flush()
+                except Exception:
+                    pass
+            raise
+
+        # Waits for the metrics handed to the background writer (if any) to reach the disk
+        if self.metric_writer is not None:
+            self.metric_writer.flush()
 
     def step(self):
         """Advances the model's system in one step."""
@@ -298,37 +621,87 @@ class Simulator(ComponentManager, Model):
         # Collecting model-level metrics
         self.collect()
 
+        # Classes that are not collected in this time step
+        skipped = set()
+        for class_name, settings in self.metrics_collection.items():
+            interval = settings.get("interval", 1)
+            if interval == "never" or (type(interval) is int and self.schedule.steps % interval != 0):
+                skipped.add(class_name)
+
         # Collecting agent-level metrics
         for agent in self.schedule._agents.values():
+            class_name = agent.__class__.__name__
+            if class_name in skipped:
+                continue
+
             metrics = agent.collect()
 
+            settings = self.metrics_collection.get(class_name)
+            if settings is not None:
+                if "fields" in settings:
+                    metrics = {field: metrics[field] for field in settings["fields"] if field in metrics}
+
+                if settings.get("interval") == "on_change":
+                    if self.last_metrics.get(agent.unique_id) == metrics:
+                        continue
+                    self.last_metrics[agent.unique_id] = metrics
+
             if metrics != {}:
-                if f"{agent.__class__.__name__}" not in self.agent_metrics:
-                    self.agent_metrics[f"{agent.__class__.__name__}"] = []
+                if self.metrics_layout == "columns":
+                    columns = self.metric_columns.get(class_name)
+                    if columns is None:
+                        columns = MetricColumns(schema=agent._metric_schema)
+                        self.metric_columns[class_name] = columns
+
+                    columns.append(self.schedule.steps, f"{agent}", metrics)
+                else:
+                    if f"{agent.__class__.__name__}" not in self.agent_metrics:
+                        self.agent_metrics[f"{agent.__class__.__name__}"] = []
 
-                metrics = {**{"Object": f"{agent}", "Time Step": self.schedule.steps}, **metrics}
-                self.agent_metrics[f"{agent.__class__.__name__}"].append(metrics)
+                    metrics = {**{"Object": f"{agent}", "Time Step": self.schedule.steps}, **metrics}
+                    self.agent_metrics[f"{agent.__class__.__name__}"].append(metrics)
 
         if self.schedule.steps == self.last_dump + self.dump_interval:
             self.dump_data_to_disk()
             self.last_dump = self.schedule.steps
 
     def dump_data_to_disk(self, clean_data_in_memory: bool = True) -> None:
-        """Dumps simulation metrics to the disk.
+        """Dumps simulation metrics to the disk. Each dump appends the metrics collected since the previous one to the metric
+        log of each class (see 'edge_sim_py.metric_log.MetricStream' to read them back).
 
         Args:
             clean_data_in_memory (bool, optional): Purges the list of metrics stored in the memory. Defaults to True.
         """
         if self.dump_interval != float("inf"):
-            if not os.path.exists(f"{self.logs_directory}/"):
-                os.makedirs(f"{self.logs_directory}")
+            if (
+                self.metric_writer is None
+                or self.metric_writer.logs_directory != self.logs_directory
+                or self.metric_writer.compression != self.metrics_compression
+                or type(self.metric_writer) != (AsyncMetricWriter if self.metrics_queue_size > 0 else MetricWriter)
+            ):
+                if self.metric_writer is not None:
+                    self.metric_writer.close()
+
+                if self.metrics_queue_size > 0:
+                    self.metric_writer = AsyncMetricWriter(
+                        logs_directory=self.logs_directory,
+                        compression=self.metrics_compression,
+                        max_pending=self.metrics_queue_size,
+                    )
+                else:
+                    self.metric_writer = MetricWriter(logs_directory=self.logs_directory, compression=self.metrics_compression)
 
-            for key, value in self.agent_metrics.items():
-                with open(f"{self.logs_directory}/{key}.msgpack", "wb") as output_file:
-                    output_file.write(msgpack.packb(value))
+            # Metrics recorded by column are written as columnar frames
+            for key, value in [*self.agent_metrics.items(), *self.metric_columns.items()]:
+                dumped = self.dumped_metrics.get(key, 0)
+                if len(value) > dumped:
+                    self.metric_writer.write(key, value[dumped:] if type(value) is list else value.frame(start=dumped))
 
                 if clean_data_in_memory:
-                    value = []
+                    value.clear()
+                    self.dumped_metrics[key] = 0
+                else:
+                    self.dumped_metrics[key] = len(value)
 
     def initialize_agent(self, agent: object) -> object:
         """Initializes an agent object.
@@ -1,159 +1,288 @@
 import os
 import random
+import json
 import argparse
 from edge_sim_py import *
 from edge_sim_py.dataset_generator import *
 from edge_sim_py.components.mobility_models import random_mobility
 from edge_sim_py.dataset_generator.edge_servers import raspberry_pi4, e5430
 
-# --- Step 1: Parse Command-Line Arguments ---
-parser = argparse.ArgumentParser(description="Generate a custom Fog scenario.")
-parser.add_argument("--scenario_name", type=str, default="Base_Case", help="Name for the output folder/file prefix")
-parser.add_argument("--users", type=int, default=50, help="Number of users (sensors) to create")
-parser.add_argument("--tier1", type=int, default=15, help="Number of Tier 1 (Fog Node) servers")
-parser.add_argument("--tier2", type=int, default=4, help="Number of Tier 2 (Fog Server) servers")
-parser.add_argument("--avg_weight", type=int, default=3, help="Average compute weight (X * 10e9)")
-parser.add_argument("--avg_data_size", type=int, default=500, help="Average data size (in MB)")
-parser.add_argument("--deadline", type=float, default=30.0, help="Absolute deadline for all tasks (in seconds)")
-args = parser.parse_args()
-
-# --- Step 2: Define Scenario Size from Arguments ---
-NUM_USERS = args.users
-NUM_TIER1_NODES = args.tier1
-NUM_TIER2_SERVERS = args.tier2
-NUM_TIER3_CLOUD = 1   # We always have 1 Cloud
-TOTAL_SERVERS = NUM_TIER1_NODES + NUM_TIER2_SERVERS + NUM_TIER3_CLOUD
-SCENARIO_FILENAME = f"{args.scenario_name}_ES-{TOTAL_SERVERS}_ED-{NUM_USERS}"
-
-# Make a grid big enough to hold all servers, plus a few empty spots
-TOTAL_BS_NEEDED = NUM_TIER1_NODES + NUM_TIER2_SERVERS + NUM_TIER3_CLOUD
-MAP_SIZE = int(TOTAL_BS_NEEDED**0.5) + 2
-TOTAL_BS = MAP_SIZE * MAP_SIZE
-
-print(f"Generating scenario: {SCENARIO_FILENAME}")
-print(f"Grid size: {MAP_SIZE}x{MAP_SIZE} ({TOTAL_BS} Base Stations)")
-print(f"Users: {NUM_USERS}, Servers: {TOTAL_SERVERS} (T1: {NUM_TIER1_NODES}, T2: {NUM_TIER2_SERVERS}, T3: {NUM_TIER3_CLOUD})")
-
-# --- Step 3: Create directories ---
-output_dir = "datasets"
-os.makedirs(output_dir, exist_ok=True)
-
-# --- Step 4: Define the map coordinates ---
-map_coordinates = quadratic_grid(x_size=MAP_SIZE, y_size=MAP_SIZE)
-
-# --- Step 5: Create Base Stations and Switches ---
-base_stations = []
-network_switches = []
-for i, coords in enumerate(map_coordinates):
-    bs = BaseStation()
-    bs.id = i + 1
-    bs.coordinates = coords
-    bs.wireless_delay = 100 # Interpreted as 100 Mbps bandwidth by our config
-    base_stations.append(bs)
-    
-    switch = NetworkSwitch()
-    switch.id = i + 1
-    network_switches.append(switch)
-    bs._connect_to_network_switch(switch)
-
-# --- Step 6: Create Edge Servers (Fog Tiers) ---
-edge_servers = []
-server_id_counter = 1
-
-# Tier 1 (Fog Nodes)
-for i in range(NUM_TIER1_NODES):
-    fog_node = raspberry_pi4()
-    fog_node.id = server_id_counter
-    fog_node.power_model_parameters["monetary_cost"] = 1
-    edge_servers.append(fog_node)
-    base_stations[i]._connect_to_edge_server(fog_node) # Connect to first N base stations
-    server_id_counter += 1
-
-# Tier 2 (Fog Servers)
-for i in range(NUM_TIER2_SERVERS):
-    fog_server = e5430()
-    fog_server.id = server_id_counter
-    fog_server.power_model_parameters["monetary_cost"] = 3
-    edge_servers.append(fog_server)
-    base_stations[NUM_TIER1_NODES + i]._connect_to_edge_server(fog_server) # Connect to next batch
-    server_id_counter += 1
-
-# Tier 3 (Cloud Server)
-cloud_server = EdgeServer()
-cloud_server.id = server_id_counter
-cloud_server.model_name = "Cloud-Server"
-cloud_server.cpu = 1000
-cloud_server.memory = 999999
-cloud_server.disk = 999999
-cloud_server.power_model_parameters = {
-    "static_power_percentage": 200,
-    "monetary_cost": 10
-}
-edge_servers.append(cloud_server)
-base_stations[NUM_TIER1_NODES + NUM_TIER2_SERVERS]._connect_to_edge_server(cloud_server) # Connect to next
-
-# --- Step 7: Create the Network Topology ---
-topology = Topology()
-topology.id = 1
-topology.add_nodes_from(network_switches)
-
-cloud_switch = cloud_server.base_station.network_switch
-
-for i in range(len(network_switches)):
-    for j in range(i + 1, len(network_switches)):
-        link = NetworkLink()
-        link.id = len(topology.edges) + 1
-        link.nodes = [network_switches[i], network_switches[j]]
-        link.topology = topology # Fix for the NoneType error
-
-        if network_switches[i] == cloud_switch or network_switches[j] == cloud_switch:
+TOPOLOGIES = ["full_mesh", "grid", "hexagonal_mesh", "barabasi_albert", "hierarchical"]
+
+
+def _json_typed(value: object) -> object:
+    """Copies a scenario value with the types its JSON encoding decodes to: tuples become lists and dictionary keys
+    become strings. Containers are copied, so the result shares no lists or dictionaries with the components.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {
+            key if type(key) is str else json.dumps(key): _json_typed(item) if type(item) in (dict, list, tuple) else item
+            for key, item in value.items()
+        }
+    if value_type is list or value_type is tuple:
+        return [_json_typed(item) if type(item) in (dict, list, tuple) else item for item in value]
+    return value
+
+
+def grid_size(total_servers: int) -> int:
+    """Side of a grid big enough to hold all servers, plus a few empty spots."""
+    return int(total_servers**0.5) + 2
+
+
+def create_scenario(
+    users: int = 50,
+    tier1: int = 15,
+    tier2: int = 4,
+    avg_weight: int = 3,
+    avg_data_size: int = 500,
+    deadline: float = 30.0,
+    seed: int = None,
+    topology: str = "full_mesh",
+):
+    """Creates the components of a Fog scenario (base stations, switches, tiered servers, topology, users and their tasks).
+    The instance lists of every component class are reset first, so the created components are the only ones left.
+
+    Args:
+        users (int, optional): Number of users (sensors) to create. Defaults to 50.
+        tier1 (int, optional): Number of Tier 1 (Fog Node) servers. Defaults to 15.
+        tier2 (int, optional): Number of Tier 2 (Fog Server) servers. Defaults to 4.
+        avg_weight (int, optional): Average compute weight (X * 10e9). Defaults to 3.
+        avg_data_size (int, optional): Average data size (in MB). Defaults to 500.
+        deadline (float, optional): Absolute deadline for all tasks (in seconds). Defaults to 30.0.
+        seed (int, optional): Seed for the random module (None keeps its current state). Defaults to None.
+        topology (str, optional): Network topology connecting the base stations (one of TOPOLOGIES). Defaults to "full_mesh".
+    """
+    if topology not in TOPOLOGIES:
+        raise Exception(f"Unsupported topology {topology}. Supported topologies are {TOPOLOGIES}.")
+
+    if seed is not None:
+        random.seed(seed)
+
+    # Resetting the list of instances of EdgeSimPy's component classes
+    for component_class in ComponentManager.__subclasses__():
+        if component_class.__name__ != "Simulator":
+            component_class._object_count = 0
+            component_class._instances = []
+
+    total_servers = tier1 + tier2 + 1  # We always have 1 Cloud
+    map_size = grid_size(total_servers)
+
+    # --- Step 4: Define the map coordinates ---
+    # (the hexagonal mesh links nodes according to the hexagonal grid layout, which has the same number of positions)
+    if topology == "hexagonal_mesh":
+        map_coordinates = hexagonal_grid(x_size=map_size, y_size=map_size)
+    else:
+        map_coordinates = quadratic_grid(x_size=map_size, y_size=map_size)
+
+    # --- Step 5: Create Base Stations and Switches ---
+    base_stations = []
+    network_switches = []
+    for i, coords in enumerate(map_coordinates):
+        bs = BaseStation()
+        bs.id = i + 1
+        bs.coordinates = coords
+        bs.wireless_delay = 100 # Interpreted as 100 Mbps bandwidth by our config
+        base_stations.append(bs)
+
+        switch = NetworkSwitch()
+        switch.id = i + 1
+        network_switches.append(switch)
+        bs._connect_to_network_switch(switch)
+
+    # --- Step 6: Create Edge Servers (Fog Tiers) ---
+    edge_servers = []
+    server_id_counter = 1
+
+    # Tier 1 (Fog Nodes)
+    for i in range(tier1):
+        fog_node = raspberry_pi4()
+        fog_node.id = server_id_counter
+        fog_node.power_model_parameters["monetary_cost"] = 1
+        edge_servers.append(fog_node)
+        base_stations[i]._connect_to_edge_server(fog_node) # Connect to first N base stations
+        server_id_counter += 1
+
+    # Tier 2 (Fog Servers)
+    for i in range(tier2):
+        fog_server = e5430()
+        fog_server.id = server_id_counter
+        fog_server.power_model_parameters["monetary_cost"] = 3
+        edge_servers.append(fog_server)
+        base_stations[tier1 + i]._connect_to_edge_server(fog_server) # Connect to next batch
+        server_id_counter += 1
+
+    # Tier 3 (Cloud Server)
+    cloud_server = EdgeServer()
+    cloud_server.id = server_id_counter
+    cloud_server.model_name = "Cloud-Server"
+    cloud_server.cpu = 1000
+    cloud_server.memory = 999999
+    cloud_server.disk = 999999
+    cloud_server.power_model_parameters = {
+        "static_power_percentage": 200,
+        "monetary_cost": 10
+    }
+    edge_servers.append(cloud_server)
+    base_stations[tier1 + tier2]._connect_to_edge_server(cloud_server) # Connect to next
+
+    # --- Step 7: Create the Network Topology ---
+    cloud_switch = cloud_server.base_station.network_switch
+
+    if topology == "full_mesh":
+        # Every pair of switches is linked (O(base stations^2) links)
+        network_topology = Topology()
+        network_topology.add_nodes_from(network_switches)
+
+        for i in range(len(network_switches)):
+            for j in range(i + 1, len(network_switches)):
+                link = NetworkLink()
+                link.nodes = [network_switches[i], network_switches[j]]
+                link.topology = network_topology # Fix for the NoneType error
+
+                network_topology.add_edge(link.nodes[0], link.nodes[1])
+                network_topology._adj[link.nodes[0]][link.nodes[1]] = link
+                network_topology._adj[link.nodes[1]][link.nodes[0]] = link
+    elif topology == "grid":
+        network_topology = grid_mesh(network_nodes=network_switches)
+    elif topology == "hexagonal_mesh":
+        network_topology = partially_connected_hexagonal_mesh(network_nodes=network_switches)
+    elif topology == "barabasi_albert":
+        network_topology = barabasi_albert(network_nodes=network_switches, min_links_per_node=2, seed=random.getrandbits(32))
+    else:
+        # Access switches -> Tier 1 -> Tier 2 -> Cloud
+        tier1_switches = network_switches[:tier1]
+        tier2_switches = network_switches[tier1 : tier1 + tier2]
+        access_switches = network_switches[total_servers:]
+        network_topology = hierarchical_tree(tiers=[[cloud_switch], tier2_switches, tier1_switches, access_switches])
+    network_topology.id = 1
+
+    # Links reaching the cloud are slow, while the links between fog nodes are fast
+    for node1, node2, link in network_topology.edges(data=True):
+        if node1 == cloud_switch or node2 == cloud_switch:
             link.bandwidth = 100   # 100 Mbps (Slow)
             link.delay = 50        # 50ms (High Delay)
         else:
             link.bandwidth = 1000  # 1000 Mbps (Fast)
             link.delay = 5         # 5ms (Low Delay)
-        
-        topology.add_edge(link.nodes[0], link.nodes[1])
-        topology._adj[link.nodes[0]][link.nodes[1]] = link
-        topology._adj[link.nodes[1]][link.nodes[0]] = link
-
-# --- Step 8: Create Users (Sensors) and their Tasks ---
-for i in range(NUM_USERS):
-    user = User()
-    user.id = i + 1
-    
-    # Place user at a random base station (can't be the cloud one)
-    user_bs = random.choice([bs for bs in base_stations if bs != cloud_server.base_station])
-    user.coordinates = user_bs.coordinates
-    user.coordinates_trace = [user_bs.coordinates, user_bs.coordinates] # Stationary user fix
-    user.base_station = user_bs
-    user_bs.users.append(user)
-    user.mobility_model = random_mobility # Still needed by simulator
-    
-    app = Application()
-    app.id = i + 1
-    
-    # Create a service (task) with parameters from args
-    service = Service()
-    service.id = i + 1
-    service.cpu_demand = random.randint(50, 200)
-    service.memory_demand = random.randint(32, 128)
-    
-    # Use the args to set a randomized range
-    service.weight = random.randint(max(1, args.avg_weight - 1), args.avg_weight + 2) * 10e9
-    service.data_size = random.randint(max(50, args.avg_data_size - 100), args.avg_data_size + 200)
-    service.deadline = args.deadline
-    
-    app.connect_to_service(service)
-    user._connect_to_application(app, delay_sla=100)
-
-# --- Step 9: Export the scenario to JSON! ---
-file_name_base = SCENARIO_FILENAME
-full_file_path = f"{output_dir}/{file_name_base}.json"
-
-print(f"Exporting scenario to {full_file_path} ...")
-ComponentManager.export_scenario(
-    save_to_file=True,
-    file_name=file_name_base
-)
-print("Done!")
\ No newline at end of file
+
+    # --- Step 8: Create Users (Sensors) and their Tasks ---
+    user_base_stations = [bs for bs in base_stations if bs != cloud_server.base_station]
+    for i in range(users):
+        user = User()
+        user.id = i + 1
+
+        # Place user at a random base station (can't be the cloud one)
+        user_bs = random.choice(user_base_stations)
+        user.coordinates = user_bs.coordinates
+        user.coordinates_trace = [user_bs.coordinates, user_bs.coordinates] # Stationary user fix
+        user.base_station = user_bs
+        user_bs.users.append(user)
+        user.mobility_model = random_mobility # Still needed by simulator
+
+        app = Application()
+        app.id = i + 1
+
+        # Create a service (task) with parameters from args
+        service = Service()
+        service.id = i + 1
+        service.cpu_demand = random.randint(50, 200)
+        service.memory_demand = random.randint(32, 128)
+
+        # Use the args to set a randomized range
+        service.weight = random.randint(max(1, avg_weight - 1), avg_weight + 2) * 10e9
+        service.data_size = random.randint(max(50, avg_data_size - 100), avg_data_size + 200)
+        service.deadline = deadline
+
+        app.connect_to_service(service)
+        user._connect_to_application(app, delay_sla=100)
+
+
+def build_scenario(
+    users: int = 50,
+    tier1: int = 15,
+    tier2: int = 4,
+    avg_weight: int = 3,
+    avg_data_size: int = 500,
+    deadline: float = 30.0,
+    seed: int = None,
+    topology: str = "full_mesh",
+) -> dict:
+    """Builds a Fog scenario in memory. The returned dictionary goes straight into 'Simulator.initialize()' and holds the
+    same values the JSON dataset of the scenario would (e.g., lists instead of tuples and string dictionary keys), without
+    writing or reading any file. Each dictionary should initialize a single simulator, as the created components share
+    its lists and dictionaries (see 'Simulator.snapshot()' to run a loaded scenario several times).
+
+    Args:
+        users (int, optional): Number of users (sensors) to create. Defaults to 50.
+        tier1 (int, optional): Number of Tier 1 (Fog Node) servers. Defaults to 15.
+        tier2 (int, optional): Number of Tier 2 (Fog Server) servers. Defaults to 4.
+        avg_weight (int, optional): Average compute weight (X * 10e9). Defaults to 3.
+        avg_data_size (int, optional): Average data size (in MB). Defaults to 500.
+        deadline (float, optional): Absolute deadline for all tasks (in seconds). Defaults to 30.0.
+        seed (int, optional): Seed for the random module (None keeps its current state). Defaults to None.
+        topology (str, optional): Network topology connecting the base stations (one of TOPOLOGIES). Defaults to "full_mesh".
+
+    Returns:
+        scenario (dict): Scenario in the same structure as JSON datasets.
+    """
+    create_scenario(users, tier1, tier2, avg_weight, avg_data_size, deadline, seed, topology)
+
+    return _json_typed(ComponentManager.export_scenario())
+
+
+if __name__ == "__main__":
+    # --- Step 1: Parse Command-Line Arguments ---
+    parser = argparse.ArgumentParser(description="Generate a custom Fog scenario.")
+    parser.add_argument("--scenario_name", type=str, default="Base_Case", help="Name for the output folder/file prefix")
+    parser.add_argument("--users", type=int, default=50, help="Number of users (sensors) to create")
+    parser.add_argument("--tier1", type=int, default=15, help="Number of Tier 1 (Fog Node) servers")
+    parser.add_argument("--tier2", type=int, default=4, help="Number of Tier 2 (Fog Server) servers")
+    parser.add_argument("--avg_weight", type=int, default=3, help="Average compute weight (X * 10e9)")
+    parser.add_argument("--avg_data_size", type=int, default=500, help="Average data size (in MB)")
+    parser.add_argument("--deadline", type=float, default=30.0, help="Absolute deadline for all tasks (in seconds)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (unseeded by default)")
+    parser.add_argument("--format", choices=SUPPORTED_SCENARIO_FORMATS, default="json", help="Output dataset format")
+    parser.add_argument(
+        "--topology",
+        choices=TOPOLOGIES,
+        default="full_mesh",
+        help="Network topology connecting the base stations (every topology but full_mesh has O(base stations) links)",
+    )
+    args = parser.parse_args()
+
+    # --- Step 2: Define Scenario Size from Arguments ---
+    total_servers = args.tier1 + args.tier2 + 1
+    map_size = grid_size(total_servers)
+    scenario_file_name = f"{args.scenario_name}_ES-{total_servers}_ED-{args.users}"
+
+    print(f"Generating scenario: {scenario_file_name}")
+    print(f"Grid size: {map_size}x{map_size} ({map_size * map_size} Base Stations)")
+    print(f"Topology: {args.topology}")
+    print(f"Users: {args.users}, Servers: {total_servers} (T1: {args.tier1}, T2: {args.tier2}, T3: 1)")
+
+    # --- Step 3: Create directories ---
+    output_dir = "datasets"
+    os.makedirs(output_dir, exist_ok=True)
+
+    create_scenario(
+        users=args.users,
+        tier1=args.tier1,
+        tier2=args.tier2,
+        avg_weight=args.avg_weight,
+        avg_data_size=args.avg_data_size,
+        deadline=args.deadline,
+        seed=args.seed,
+        topology=args.topology,
+    )
+
+    # --- Step 9: Export the scenario to JSON (or to the binary columnar format) ---
+    extension = BINARY_SCENARIO_EXTENSION if args.format == "binary" else ".json"
+    full_file_path = f"{output_dir}/{scenario_file_name}{extension}"
+
+    print(f"Exporting scenario to {full_file_path} ...")
+    ComponentManager.write_scenario(
+        file_name=scenario_file_name,
+        file_format=args.format,
+    )
+    print("Done!")
@@ -4,12 +4,17 @@ import glob
 import re
 import argparse
 import json
+import random
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from algorithms import QIGA, MOHEFT, RR, RA, OE, OC
 from config import *
+from tracing import TRACER, LEVELS, configure_tracing
 import pandas as pd
 
 # --- Step 1: Define Your Experiment Parameters ---
 NUM_RUNS = 5
+ALGORITHMS = ["QIGA", "MOHEFT", "RR", "RA", "OE", "OC"]
 
 # -------------------------------------------
 
@@ -36,39 +41,136 @@ def save_population(scenario_name, run_id, algorithm_name, best_individuals, dat
 
     # 2. Save Assignments (For Visualizer)
     best_ind = best_individuals[0]
-    resources_and_users = decode(data, best_ind)
-    user_assignments = {}
-    for server, users in resources_and_users.items():
-        for user in users:
-            user_assignments[user.id] = server.id     
+    assignment = get_assignment(best_ind, data['User'].count())
+    user_assignments = {user.id: int(assignment[user.id - 1]) + 1 for user in data['User'].all()}
     with open(f"{output_dir}{algorithm_name}_assignments.json", "w") as f:
         json.dump(user_assignments, f, indent=4)
 
+# --- Per-Task Execution (one scenario, run and algorithm) ---
+# Every process keeps its own simulator and only reloads it when a task needs a different scenario. Tasks on the same
+# scenario start from a snapshot of the freshly loaded components instead.
+_simulator = None
+_loaded = {}
+_evaluator = fitness  # Replaced by a ParallelFitness backend with --fitness-workers
+_stream_datasets = False  # Set with --stream-datasets
+
+def load_scenario(file_path):
+    global _simulator
+    if _loaded.get('file_path') == file_path:
+        _simulator.restore(_loaded['snapshot'])
+        return _loaded['data']
+
+    if _simulator is None:
+        _simulator = Simulator()
+    _loaded.clear()
+    _simulator.initialize(input_file=file_path, stream=_stream_datasets)
+    timings = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in _simulator.load_timings.items())
+    print(f"Loaded {file_path} ({timings})")
+
+    # Build Graph
+    data = {
+        'BaseStation': BaseStation, 'EdgeServer': EdgeServer, 'User': User,
+        'NetworkSwitch': NetworkSwitch, 'NetworkLink': NetworkLink
+    }
+    graph = {}
+    for link in data['NetworkLink'].all():
+        node1_id = link.nodes[0].base_station.id
+        node2_id = link.nodes[1].base_station.id
+        graph.setdefault(node1_id, []).append((node2_id, link.bandwidth))
+        graph.setdefault(node2_id, []).append((node1_id, link.bandwidth))
+    data['graph'] = graph
+    data['path_delays'] = build_path_delay_table(data)
+
+    _loaded.update(file_path=file_path, data=data, snapshot=_simulator.snapshot())
+    return data
+
+def task_seed(seed, scenario_name, run_id, algorithm_name):
+    # Derived from the task itself, so results do not depend on which worker runs it or when
+    return zlib.crc32(f"{seed}/{scenario_name}/{run_id}/{algorithm_name}".encode())
+
+def run_algorithm(algorithm_name, data, fitness=fitness):
+    if algorithm_name == "QIGA":
+        return QIGA.QIGA(fitness, K_POP_SIZE, K_GEN_SIZE, data, register=K_QIGA_REGISTER).run()
+    if algorithm_name == "MOHEFT":
+        return MOHEFT.MOHEFT(fitness, K_POP_SIZE, K_GEN_SIZE, data).run()
+    if algorithm_name == "RR":
+        return RR.RR(fitness, K_POP_SIZE, K_GEN_SIZE, data).run()
+    if algorithm_name == "RA":
+        return RA.RA(fitness, K_POP_SIZE, K_GEN_SIZE, data).run()
+    if algorithm_name == "OE":
+        return OE.OE(fitness, K_POP_SIZE, K_GEN_SIZE, data).run()
+    if algorithm_name == "OC":
+        return OC.OC(fitness, data).run()
+    raise Exception(f"Unknown algorithm {algorithm_name}. Supported algorithms are {ALGORITHMS}.")
+
+def run_task(task):
+    file_path, scenario_name, run_id, algorithm_name, seed = task
+
+    try:
+        data = load_scenario(file_path)
+    except TypeError:
+        print(f"[Error] Could not load file: {file_path}")
+        return False
+
+    if seed is not None:
+        random.seed(task_seed(seed, scenario_name, run_id, algorithm_name))
+        np.random.seed(task_seed(seed, scenario_name, run_id, algorithm_name))
+
+    print(f'Running {algorithm_name} ({scenario_name}, run {run_id}/{NUM_RUNS})...')
+    TRACER.context = {'scenario': scenario_name, 'run': run_id, 'algorithm': algorithm_name}
+    # A fresh cache per task, so the reported hit rate only counts this task's own repeats
+    cache = data['fitness_cache'] = FitnessCache()
+    best_population = run_algorithm(algorithm_name, data, _evaluator)
+    stats = cache.stats()
+    if stats['hits'] + stats['misses'] > 0:
+        print(f"  Fitness cache: {stats['hits']} hits / {stats['misses']} evaluations ({stats['hit_rate']:.1%} saved)")
+    save_population(scenario_name, run_id, algorithm_name, best_population, data)
+    return True
+
+def init_worker_tracing(level, path, sample_individuals, every):
+    # Each worker process writes its own trace file
+    configure_tracing(level, f"{path}.{os.getpid()}", sample_individuals, every)
+
 # --- Main Execution Block ---
 if __name__ == "__main__":
     
     # --- NEW: Parse Arguments for Selective Running ---
     parser = argparse.ArgumentParser()
     parser.add_argument('--scenarios', nargs='+', help='List of specific scenario names to run')
+    parser.add_argument('--jobs', type=int, default=1, help='Number of worker processes (1 runs everything in this process)')
+    parser.add_argument('--fitness-workers', type=int, default=1, help='Worker processes used to evaluate each population (needs --jobs 1)')
+    parser.add_argument('--stream-datasets', action='store_true', help='Parse JSON datasets incrementally to lower peak memory')
+    parser.add_argument('--seed', type=int, default=None, help='Base seed; each (scenario, run, algorithm) task derives its own seed from it')
+    parser.add_argument('--trace', choices=list(LEVELS), default='off', help='Fitness trace level')
+    parser.add_argument('--trace-file', default='logs/fitness_trace.jsonl', help='JSON lines file that receives fitness traces')
+    parser.add_argument('--trace-sample', type=int, default=None, help='Individuals traced per fitness call (default: all)')
+    parser.add_argument('--trace-every', type=int, default=1, help='Trace only every N-th fitness call')
     args = parser.parse_args()
+    if args.jobs > 1 and args.fitness_workers > 1:
+        parser.error("--jobs and --fitness-workers cannot both be greater than 1")
     # --------------------------------------------------
 
-    simulator = Simulator()
+    _stream_datasets = args.stream_datasets
+    tracing_settings = (args.trace, args.trace_file, args.trace_sample, args.trace_every)
+    configure_tracing(*tracing_settings)
 
-    # Auto-discover scenarios
-    dataset_files = glob.glob("datasets/*.json")
+    # Auto-discover scenarios (a binary dataset takes precedence over the JSON one with the same name)
+    binary_files = glob.glob(f"datasets/*{BINARY_SCENARIO_EXTENSION}")
+    binary_names = {os.path.splitext(file_path)[0] for file_path in binary_files}
+    dataset_files = [f for f in glob.glob("datasets/*.json") if os.path.splitext(f)[0] not in binary_names] + binary_files
 
     if not dataset_files:
-        print("No dataset .json files found in 'datasets/' folder. Stopping.")
+        print(f"No dataset .json or {BINARY_SCENARIO_EXTENSION} files found in 'datasets/' folder. Stopping.")
         print("Please use the dashboard to generate a dataset first.")
         exit()
 
     print(f"Found {len(dataset_files)} total datasets.")
 
     # Regex to parse filenames
-    filename_regex = re.compile(r"datasets[/\\](.+)_ES-(\d+)_ED-(\d+)\.json")
+    filename_regex = re.compile(rf"datasets[/\\](.+)_ES-(\d+)_ED-(\d+)(\.json|{re.escape(BINARY_SCENARIO_EXTENSION)})")
 
-    # --- Main Experiment Loop ---
+    # --- Build the Task List ---
+    tasks = []
     for file_path in dataset_files:
         match = filename_regex.match(file_path)
         if not match:
@@ -85,64 +187,26 @@ if __name__ == "__main__":
 
         es_count = int(match.group(2))
         user_count = int(match.group(3))
-        
-        print(f"\n=================================================")
-        print(f"STARTING SCENARIO: {scenario_name} ({user_count} Users, {es_count} Servers)")
-        print(f"=================================================")
-        
+        print(f"Queued scenario: {scenario_name} ({user_count} Users, {es_count} Servers)")
+
         for run_id in range(1, NUM_RUNS + 1):
-            print(f"\n--- Starting Run {run_id}/{NUM_RUNS} for {scenario_name} ---")
-
-            try:
-                simulator.initialize(input_file=file_path)
-            except TypeError:
-                print(f"[Error] Could not load file: {file_path}")
-                break 
-
-            # Build Graph
-            data = {
-                'BaseStation': BaseStation, 'EdgeServer': EdgeServer, 'User': User,
-                'NetworkSwitch': NetworkSwitch, 'NetworkLink': NetworkLink
-            }
-            graph = {}
-            for link in data['NetworkLink'].all():
-                node1_id = link.nodes[0].base_station.id
-                node2_id = link.nodes[1].base_station.id
-                graph.setdefault(node1_id, []).append((node2_id, link.bandwidth))
-                graph.setdefault(node2_id, []).append((node1_id, link.bandwidth))
-            data['graph'] = graph
-
-            # Run Algorithms
-            print(f'Running QIGA...')
-            QIGA_alg = QIGA.QIGA(fitness, K_POP_SIZE, K_GEN_SIZE, data)
-            QIGA_pop = QIGA_alg.run()
-            save_population(scenario_name, run_id, "QIGA", QIGA_pop, data)
-
-            print(f'Running MOHEFT...')
-            MOHEFT_alg = MOHEFT.MOHEFT(fitness, K_POP_SIZE, K_GEN_SIZE, data)
-            MOHEFT_pop = MOHEFT_alg.run()
-            save_population(scenario_name, run_id, "MOHEFT", MOHEFT_pop, data)
-
-            print(f'Running RR...')
-            RR_alg = RR.RR(fitness, K_POP_SIZE, K_GEN_SIZE, data)
-            RR_pop = RR_alg.run()
-            save_population(scenario_name, run_id, "RR", RR_pop, data)
-
-            print(f'Running RA...')
-            RA_alg = RA.RA(fitness, K_POP_SIZE, K_GEN_SIZE, data)
-            RA_pop = RA_alg.run()
-            save_population(scenario_name, run_id, "RA", RA_pop, data)
-
-            print(f'Running OE...')
-            OE_alg = OE.OE(fitness, K_POP_SIZE, K_GEN_SIZE, data)
-            OE_pop = OE_alg.run()
-            save_population(scenario_name, run_id, "OE", OE_pop, data)
-
-            print(f'Running OC...')
-            OC_alg = OC.OC(fitness, data)
-            OC_pop = OC_alg.run()
-            save_population(scenario_name, run_id, "OC", OC_pop, data)
-            
-            print(f"--- Completed Run {run_id}/{NUM_RUNS} ---")
-
-    print("\nAll requested simulations completed.")
\ No newline at end of file
+            for algorithm_name in ALGORITHMS:
+                tasks.append((file_path, scenario_name, run_id, algorithm_name, args.seed))
+
+    # --- Main Experiment Loop ---
+    if args.jobs > 1:
+        print(f"Running {len(tasks)} tasks on {args.jobs} worker processes...")
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker_tracing, initargs=tracing_settings) as executor:
+            for _ in executor.map(run_task, tasks):
+                pass
+    else:
+        if args.fitness_workers > 1:
+            _evaluator = ParallelFitness(args.fitness_workers)
+        try:
+            for task in tasks:
+                run_task(task)
+        finally:
+            if _evaluator is not fitness:
+                _evaluator.close()
+
+    print("\nAll requested simulations completed.")
@@ -0,0 +1,91 @@
+""" Checks that binary scenarios load the same components as JSON datasets (faster) and that files in the legacy layout
+("ESPYCOL1") are still readable."""
+# Python libraries
+import json
+import time
+import msgpack
+import numpy as np
+
+# EdgeSimPy components
+from edge_sim_py import Simulator
+from edge_sim_py.component_manager import ComponentManager
+
+# EdgeSimPy binary scenarios
+from edge_sim_py.binary_scenario import (
+    BLOCK_ALIGNMENT,
+    LEGACY_BINARY_SCENARIO_MAGIC,
+    BinaryScenario,
+    _rebase_blocks,
+    write_binary_scenario,
+)
+
+# Scenario generator
+from generate_scenario import build_scenario
+
+
+def write_legacy_copy(file_path, legacy_file_path):
+    """Rewrites a binary scenario in the legacy layout (magic | header size | header | blocks)."""
+    scenario = BinaryScenario(file_path)
+    header_offset = int(scenario.buffer[len(LEGACY_BINARY_SCENARIO_MAGIC) : len(LEGACY_BINARY_SCENARIO_MAGIC) + 8].view("<u8")[0])
+    blocks = bytes(scenario.buffer[BLOCK_ALIGNMENT:header_offset])
+
+    classes = scenario.classes
+    _rebase_blocks(classes, -BLOCK_ALIGNMENT)
+    header = msgpack.packb({"version": 1, "classes": classes}, use_bin_type=True)
+
+    with open(legacy_file_path, "wb") as output_file:
+        output_file.write(LEGACY_BINARY_SCENARIO_MAGIC)
+        output_file.write(np.array([len(header)], dtype="<u8").tobytes())
+        output_file.write(header)
+        output_file.write(bytes(-(len(LEGACY_BINARY_SCENARIO_MAGIC) + 8 + len(header)) % BLOCK_ALIGNMENT))
+        output_file.write(blocks)
+
+
+def test_legacy_layout_is_readable(tmp_path):
+    scenario = build_scenario(users=10, tier1=3, tier2=1, seed=1)
+    write_binary_scenario(scenario, str(tmp_path / "scenario.esb"))
+    write_legacy_copy(str(tmp_path / "scenario.esb"), str(tmp_path / "legacy.esb"))
+
+    assert BinaryScenario(str(tmp_path / "legacy.esb")).to_dict() == BinaryScenario(str(tmp_path / "scenario.esb")).to_dict()
+    assert BinaryScenario(str(tmp_path / "scenario.esb")).to_dict() == scenario
+
+
+def loaded_components(simulator):
+    components = {
+        component_class.__name__: [(obj.unique_id, json.dumps(obj._to_dict(), sort_keys=True)) for obj in component_class.all()]
+        for component_class in ComponentManager.__subclasses__()
+        if component_class.__name__ not in ["Simulator", "Topology"]
+    }
+    components["schedule"] = [str(agent) for agent in simulator.schedule.agents]
+    return components
+
+
+def write_scenario_files(scenario, tmp_path):
+    with open(tmp_path / "scenario.json", "w", encoding="UTF-8") as output_file:
+        json.dump(scenario, output_file)
+    write_binary_scenario(scenario, str(tmp_path / "scenario.esb"))
+    return str(tmp_path / "scenario.json"), str(tmp_path / "scenario.esb")
+
+
+def test_binary_load_matches_json_load(tmp_path):
+    json_file, binary_file = write_scenario_files(build_scenario(users=30, tier1=4, tier2=2, seed=3), tmp_path)
+
+    simulator = Simulator()
+    simulator.initialize(json_file)
+    from_json = loaded_components(simulator)
+
+    simulator = Simulator()
+    simulator.initialize(binary_file)
+    assert loaded_components(simulator) == from_json
+
+
+def test_binary_load_is_faster_than_json_load(tmp_path):
+    json_file, binary_file = write_scenario_files(build_scenario(users=20000, tier1=30, tier2=9, seed=1), tmp_path)
+
+    load_times = {}
+    for input_file in [json_file, binary_file]:
+        start = time.perf_counter()
+        Simulator().initialize(input_file)
+        load_times[input_file] = time.perf_counter() - start
+
+    assert load_times[binary_file] < min(load_times[json_file] / 2, 1)
@@ -0,0 +1,75 @@
+""" Checks 'ComponentManager.find_by()' against a linear search over the list of instances."""
+# Python libraries
+import random
+import time
+import pytest
+
+# EdgeSimPy components
+from edge_sim_py import BaseStation
+
+
+def linear_find_by(cls, attribute_name, attribute_value):
+    return next((obj for obj in cls._instances if getattr(obj, attribute_name) == attribute_value), None)
+
+
+@pytest.fixture(autouse=True)
+def empty_base_stations():
+    BaseStation._instances = []
+    BaseStation._object_count = 0
+    yield
+    BaseStation._instances = []
+    BaseStation._object_count = 0
+
+
+def test_find_by_returns_first_match_after_reassignment():
+    first = BaseStation()
+    second = BaseStation()
+    first.coordinates = [0, 0]
+    second.coordinates = [1, 1]
+    assert BaseStation.find_by("coordinates", [1, 1]) is second
+
+    first.coordinates = [1, 1]
+    assert BaseStation.find_by("coordinates", [1, 1]) is first
+    assert BaseStation.find_by("coordinates", [0, 0]) is None
+
+
+def test_find_by_matches_linear_search():
+    generator = random.Random(0)
+    values = [[x, y] for x in range(3) for y in range(3)] + [(0, 0), None]
+
+    for step in range(2000):
+        operation = generator.random()
+        if operation < 0.3 or BaseStation.count() == 0:
+            base_station = BaseStation(obj_id=generator.randint(1, 20))
+            base_station.coordinates = generator.choice(values)
+        elif operation < 0.6:
+            generator.choice(BaseStation.all()).coordinates = generator.choice(values)
+        elif operation < 0.75:
+            generator.choice(BaseStation.all()).id = generator.randint(1, 20)
+        elif operation < 0.8:
+            BaseStation.remove(generator.choice(BaseStation.all()))
+        elif operation < 0.85:
+            BaseStation._from_dict({"id": generator.randint(1, 20), "coordinates": generator.choice(values)})
+
+        value = generator.choice(values)
+        assert BaseStation.find_by("coordinates", value) is linear_find_by(BaseStation, "coordinates", value), step
+        obj_id = generator.randint(1, 20)
+        assert BaseStation.find_by_id(obj_id) is linear_find_by(BaseStation, "id", obj_id), step
+
+
+def test_find_by_keeps_indexes_up_to_date_without_rescanning():
+    for position in range(20000):
+        BaseStation().coordinates = [position, position]
+    BaseStation.find_by_id(1)
+
+    started = time.perf_counter()
+    for step in range(200):
+        assert BaseStation.find_by("coordinates", [-1, step]) is None
+
+        base_station = BaseStation.all()[step * 50]
+        base_station.coordinates = [-2, step]
+        assert BaseStation.find_by("coordinates", [-2, step]) is base_station
+        assert BaseStation.find_by("coordinates", [step * 50, step * 50]) is None
+
+    # Misses and writes used to scan or rebuild the indexes (about 5 seconds for these lookups)
+    assert time.perf_counter() - started < 0.5
@@ -0,0 +1,153 @@
+""" Checks the vectorized fitness kernel against a per-task reference computation and the cache of raw metrics."""
+# Python libraries
+import json
+import random
+from collections import deque
+import numpy as np
+import pytest
+
+# Fitness library and scenario loading
+import config
+import main
+from generate_scenario import build_scenario
+
+
+def reference_path_delay(graph, resource_bs_id, user_bs_id, data_size, wireless_delay):
+    # Per-task BFS that divides the data size by the bandwidth of each link, as the original fitness did
+    queue = deque([(resource_bs_id, 0)])
+    visited = {resource_bs_id}
+    while queue:
+        current_node, cumulative_delay = queue.popleft()
+        if current_node == user_bs_id:
+            return data_size / wireless_delay + cumulative_delay
+        for neighbor, bandwidth in graph.get(current_node, []):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, cumulative_delay + data_size / bandwidth))
+    return None
+
+
+def reference_metrics(data, assignment):
+    servers = data["EdgeServer"].all()
+    users_by_server = {server: [] for server in servers}
+    for user in data["User"].all():
+        # Genes point at servers by id (slot index + 1)
+        users_by_server[data["EdgeServer"].find_by_id(int(assignment[user.id - 1]) + 1)].append(user)
+
+    metrics = {"energy": 0, "latency": 0, "cost": 0, "resource_utilization": 0, "missed_deadlines": 0}
+    metrics["memory_overloaded"] = False
+    metrics["max_resource_latency"] = 0
+    for server, users in users_by_server.items():
+        frequency = config.get_freq(server.model_name)
+        tasks = [user.applications[0].services[0] for user in users]
+        if sum(task.memory_demand for task in tasks) > server.memory:
+            metrics["memory_overloaded"] = True
+        if users:
+            metrics["cost"] += server.power_model_parameters["monetary_cost"]
+
+        server_energy, server_latency, active_time = 0, 0, 0
+        for user in sorted(users, key=lambda user: user.applications[0].services[0].deadline):
+            task = user.applications[0].services[0]
+            path_delay = reference_path_delay(
+                data["graph"], server.base_station.id, user.base_station.id, task.data_size, user.base_station.wireless_delay
+            )
+            delay = path_delay + task.weight / frequency
+            server_energy += task.weight * (server.power_model_parameters["static_power_percentage"] / 1e9)
+            server_latency += delay
+            active_time += task.weight / frequency
+            metrics["missed_deadlines"] += delay > task.deadline
+
+        if users:
+            metrics["resource_utilization"] += sum(task.weight for task in tasks) / (frequency * active_time)
+        metrics["energy"] += server_energy
+        metrics["latency"] += server_latency
+        metrics["max_resource_latency"] = max(metrics["max_resource_latency"], active_time)
+
+    return metrics
+
+
+@pytest.mark.parametrize("topology", ["full_mesh", "grid", "hierarchical"])
+def test_vectorized_fitness_matches_reference(tmp_path, topology):
+    dataset = tmp_path / f"{topology}.json"
+    dataset.write_text(json.dumps(build_scenario(users=40, tier1=6, tier2=2, seed=3, topology=topology)))
+    data = main.load_scenario(str(dataset))
+
+    generator = random.Random(0)
+    population = []
+    for _ in range(20):
+        individual = config.Individual()
+        individual.assignment = np.array(
+            [generator.randrange(data["EdgeServer"].count()) for _ in range(data["User"].count())], dtype=np.int32
+        )
+        population.append(individual)
+
+    config.fitness(population, data)
+
+    for individual in population:
+        expected = reference_metrics(data, individual.assignment)
+        assert individual.missed_deadlines == expected["missed_deadlines"]
+        assert individual.memory_overloaded == expected["memory_overloaded"]
+        assert individual.cost == expected["cost"]
+        assert individual.max_resource_latency == expected["max_resource_latency"]
+
+        num_servers = data["EdgeServer"].count()
+        for name in ["energy", "latency", "resource_utilization"]:
+            assert getattr(individual, name) == pytest.approx(expected[name] / num_servers, rel=1e-15, abs=0), name
+
+
+def test_unknown_server_ids_raise_key_error(tmp_path):
+    dataset = tmp_path / "scenario.json"
+    dataset.write_text(json.dumps(build_scenario(users=10, tier1=3, tier2=1, seed=3)))
+    data = main.load_scenario(str(dataset))
+
+    individual = config.Individual()
+    individual.assignment = np.full(data["User"].count(), data["EdgeServer"].count(), dtype=np.int32)
+    with pytest.raises(KeyError):
+        config.fitness([individual], data)
+
+
+def row_sums(evaluated_rows):
+    def evaluator(assignments):
+        evaluated_rows.extend(map(tuple, assignments.tolist()))
+        return {"sum": assignments.sum(axis=1), "first": assignments[:, 0]}
+
+    return evaluator
+
+
+def test_fitness_cache_evaluates_each_assignment_once():
+    cache = config.FitnessCache(max_size=10)
+    evaluated_rows = []
+    evaluator = row_sums(evaluated_rows)
+
+    first = np.array([[1, 2], [3, 4], [1, 2]], dtype=np.int32)
+    second = np.array([[3, 4], [5, 6], [1, 2]], dtype=np.int32)
+    for assignments in [first, second]:
+        metrics = cache.evaluate(assignments, evaluator)
+        assert metrics["sum"].tolist() == assignments.sum(axis=1).tolist()
+        assert metrics["first"].tolist() == assignments[:, 0].tolist()
+
+    # Duplicates within a population and assignments seen before are not evaluated again
+    assert evaluated_rows == [(1, 2), (3, 4), (5, 6)]
+    assert cache.stats() == {"hits": 3, "misses": 3, "hit_rate": 0.5, "entries": 3}
+
+
+def test_fitness_cache_evicts_least_recently_used_assignments():
+    cache = config.FitnessCache(max_size=2)
+    evaluated_rows = []
+    evaluator = row_sums(evaluated_rows)
+
+    for row in [[1], [2], [1], [3], [1], [2]]:
+        cache.evaluate(np.array([row], dtype=np.int32), evaluator)
+
+    # [2] was the least recently used entry when [3] came in, while [1] stayed cached
+    assert evaluated_rows == [(1,), (2,), (3,), (2,)]
+    assert cache.stats()["entries"] == 2
+
+
+def test_disabled_fitness_cache_evaluates_every_assignment():
+    cache = config.FitnessCache(max_size=0)
+    evaluated_rows = []
+    cache.evaluate(np.array([[1], [1]], dtype=np.int32), row_sums(evaluated_rows))
+
+    assert evaluated_rows == [(1,), (1,)]
+    assert cache.stats() == {"hits": 0, "misses": 2, "hit_rate": 0.0, "entries": 0}
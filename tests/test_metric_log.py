@@ -0,0 +1,79 @@
+""" Checks that metric logs written by 'MetricWriter' and 'AsyncMetricWriter' read back the same through 'MetricStream',
+for every compression codec and for both metric layouts."""
+# Python libraries
+import numpy as np
+import pytest
+
+# EdgeSimPy metric logs
+from edge_sim_py.metric_log import SUPPORTED_METRIC_COMPRESSIONS, AsyncMetricWriter, MetricStream, MetricWriter
+from edge_sim_py.metric_store import MetricColumns
+
+FRAMES = [
+    [{"Object": "User_1", "Time Step": 0, "Delay": 4.5}, {"Object": "User_2", "Time Step": 0, "Delay": None}],
+    [{"Object": "User_1", "Time Step": 1, "Delay": 3, "Coordinates": [1, 2]}],
+]
+
+
+@pytest.mark.parametrize("compression", SUPPORTED_METRIC_COMPRESSIONS)
+def test_metric_log_round_trip(tmp_path, compression):
+    writer = MetricWriter(logs_directory=str(tmp_path), compression=compression)
+    for frame in FRAMES:
+        writer.write("User", frame)
+    writer.close()
+
+    stream = MetricStream(str(tmp_path / "User.msgpack"))
+    assert list(stream) == FRAMES
+    assert list(stream.rows()) == [row for frame in FRAMES for row in frame]
+
+
+@pytest.mark.parametrize("compression", SUPPORTED_METRIC_COMPRESSIONS)
+def test_async_metric_log_round_trip(tmp_path, compression):
+    writer = AsyncMetricWriter(logs_directory=str(tmp_path), compression=compression, max_pending=1)
+    for step in range(20):
+        writer.write("User", [{"Object": "User_1", "Time Step": step}])
+        writer.write("EdgeServer", [{"Object": "EdgeServer_1", "Time Step": step}])
+    writer.close()
+
+    expected = [[{"Object": "User_1", "Time Step": step}] for step in range(20)]
+    assert list(MetricStream(str(tmp_path / "User.msgpack"))) == expected
+    assert len(list(MetricStream(str(tmp_path / "EdgeServer.msgpack")))) == 20
+
+
+def test_async_metric_writer_raises_errors_of_its_thread(tmp_path):
+    # The logs directory can't be created where a file already exists
+    (tmp_path / "logs").write_text("")
+    writer = AsyncMetricWriter(logs_directory=str(tmp_path / "logs"))
+    writer.write("User", FRAMES[0])
+
+    with pytest.raises(OSError):
+        writer.close()
+
+
+@pytest.mark.parametrize("compression", SUPPORTED_METRIC_COMPRESSIONS)
+def test_columnar_metric_log_round_trip(tmp_path, compression):
+    columns = MetricColumns(schema={"Delay": "float64", "Available": "bool", "Instance ID": "int64"})
+    rows = [
+        {"Delay": 1.5, "Available": True, "Instance ID": 1},
+        {"Delay": 2.0, "Available": False, "Instance ID": 2, "Path": [1, 2]},
+        # Values that don't fit the declared type and metrics the agent doesn't report
+        {"Delay": 3, "Available": True},
+    ]
+    for time_step, metrics in enumerate(rows):
+        columns.append(time_step, f"User_{time_step + 1}", metrics)
+
+    writer = MetricWriter(logs_directory=str(tmp_path), compression=compression)
+    writer.write("User", columns.frame())
+    writer.write("User", columns.frame(start=2))
+    writer.close()
+
+    missing = {"Delay": None, "Available": None, "Instance ID": None, "Path": None}
+    expected = [
+        {"Object": f"User_{time_step + 1}", "Time Step": time_step, **missing, **metrics} for time_step, metrics in enumerate(rows)
+    ]
+    stream = MetricStream(str(tmp_path / "User.msgpack"))
+    assert list(stream.rows()) == expected + expected[2:]
+
+    decoded = next(stream.columns())
+    assert decoded["Available"].dtype == np.bool_ and decoded["Available"].tolist() == [True, False, True]
+    assert decoded["Delay"] == [1.5, 2.0, 3]
+    assert decoded["Instance ID"] == [1, 2, None]
@@ -0,0 +1,54 @@
+""" Checks that network topology generators only apply link specifications to their own links."""
+# Python libraries
+import pytest
+
+# EdgeSimPy components
+from edge_sim_py import ComponentManager, NetworkSwitch, NetworkLink
+from edge_sim_py.dataset_generator import quadratic_grid, hexagonal_grid, grid_mesh, hierarchical_tree
+from edge_sim_py.dataset_generator import partially_connected_hexagonal_mesh
+
+
+@pytest.fixture(autouse=True)
+def empty_components():
+    for component_class in ComponentManager.__subclasses__():
+        if component_class.__name__ != "Simulator":
+            component_class._object_count = 0
+            component_class._instances = []
+
+
+def network_switches(coordinates):
+    switches = []
+    for position in coordinates:
+        switch = NetworkSwitch()
+        switch.coordinates = position
+        switches.append(switch)
+    return switches
+
+
+def specifications(number_of_links):
+    return [
+        {"number_of_objects": number_of_links // 2, "delay": 5, "bandwidth": 1000},
+        {"number_of_objects": number_of_links - number_of_links // 2, "delay": 10, "bandwidth": 100},
+    ]
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda specs: grid_mesh(network_switches(quadratic_grid(x_size=4, y_size=4)), specs),
+        lambda specs: partially_connected_hexagonal_mesh(network_switches(hexagonal_grid(x_size=4, y_size=4)), specs),
+        lambda specs: hierarchical_tree([network_switches([(0, 0)]), network_switches(quadratic_grid(x_size=3, y_size=3))], specs),
+    ],
+)
+def test_link_specifications_only_change_the_topology_links(build):
+    first = build([])
+    first_links = list(NetworkLink.all())
+    number_of_links = len(first.edges())
+
+    second = build(specifications(number_of_links))
+    second_links = NetworkLink.all()[len(first_links) :]
+
+    assert all(link.bandwidth == 0 and link.delay == 0 for link in first_links)
+    assert sorted(link.bandwidth for link in second_links) == sorted(
+        spec["bandwidth"] for spec in specifications(number_of_links) for _ in range(spec["number_of_objects"])
+    )
@@ -0,0 +1,33 @@
+""" Checks the qubit register of QIGA against the qubit-by-qubit operators it vectorizes."""
+# Python libraries
+import numpy as np
+
+# QIGA
+from algorithms.QIGA import QubitRegister
+
+
+def sequential_cnot_chain(angles, mutated):
+    # Visits qubits in order, as QIGA._quantum_mutation does, swapping the amplitudes of the qubit after each
+    # mutated qubit whose |1> amplitude exceeds 0.5
+    angles = angles.copy()
+    for row in range(len(angles)):
+        for i in range(angles.shape[1] - 1):
+            if mutated[row, i] and np.sin(angles[row, i]) > 0.5:
+                angles[row, i + 1] = np.float32(np.pi / 2) - angles[row, i + 1]
+    return angles
+
+
+def test_mutation_applies_cnot_chain_in_order():
+    generator = np.random.default_rng(0)
+    angles = generator.uniform(0, np.pi, (16, 30, 4)).astype(np.float32)
+
+    for mutation_rate in [0.2, 0.6, 1.0]:
+        np.random.seed(1)
+        mutated = np.random.rand(16, 30 * 4) < mutation_rate
+        expected = sequential_cnot_chain(angles.reshape(16, -1), mutated)
+
+        register = QubitRegister(angles)
+        np.random.seed(1)
+        register.mutate(mutation_rate)
+
+        assert np.array_equal(register.angles.reshape(16, -1), expected)
@@ -0,0 +1,76 @@
+""" Checks the multi-objective selection shared by QIGA and MOHEFT against straightforward reference computations."""
+# Python libraries
+import numpy as np
+import pytest
+
+# Selection
+from algorithms.selection import crowding_distances, non_dominated_ranks, select_population
+
+
+class Individual:
+    def __init__(self, fitness):
+        self.fitness = fitness
+
+
+def random_fitness(generator, individuals, objectives):
+    # Few distinct values, so that ties (and duplicate individuals) are common, plus some infinite objectives
+    fitness = generator.integers(0, 6, (individuals, objectives)).astype(float)
+    fitness[generator.random((individuals, objectives)) < 0.05] = np.inf
+    return fitness
+
+
+def reference_crowding_distances(fitness, ranks):
+    # NSGA-II crowding distance, front by front and objective by objective
+    distances = np.zeros(len(fitness))
+    for rank in np.unique(ranks):
+        front = np.flatnonzero(ranks == rank)
+        for objective in range(fitness.shape[1]):
+            ordered = sorted(front, key=lambda i: fitness[i, objective])
+            span = fitness[ordered[-1], objective] - fitness[ordered[0], objective]
+            distances[ordered[0]] = distances[ordered[-1]] = np.inf
+            for position in range(1, len(ordered) - 1):
+                if span > 0:
+                    gap = fitness[ordered[position + 1], objective] - fitness[ordered[position - 1], objective]
+                    distances[ordered[position]] += gap / span
+    return distances
+
+
+@pytest.mark.parametrize("objectives", [2, 3])
+def test_sweep_ranks_match_matrix_ranks(objectives):
+    generator = np.random.default_rng(objectives)
+    for individuals in [1, 2, 7, 50, 200]:
+        fitness = random_fitness(generator, individuals, objectives)
+        sweep = non_dominated_ranks(fitness, method="sweep")
+        assert np.array_equal(sweep, non_dominated_ranks(fitness, method="matrix"))
+
+
+def test_crowding_distances_match_reference():
+    generator = np.random.default_rng(0)
+    for individuals in [1, 2, 3, 40, 150]:
+        fitness = generator.integers(0, 20, (individuals, 3)).astype(float)
+        ranks = non_dominated_ranks(fitness)
+        assert np.array_equal(crowding_distances(fitness, ranks), reference_crowding_distances(fitness, ranks))
+
+
+def test_select_population_keeps_best_fronts_and_least_crowded_individuals():
+    generator = np.random.default_rng(1)
+    population = [Individual(list(row)) for row in generator.integers(0, 10, (60, 3)).astype(float)]
+
+    survivors = select_population(population, 25)
+
+    assert len(survivors) == 25 and len({id(individual) for individual in survivors}) == 25
+    fitness = np.array([individual.fitness for individual in population])
+    ranks = non_dominated_ranks(fitness)
+    distances = crowding_distances(fitness, ranks)
+    assert [individual.rank for individual in population] == ranks.tolist()
+    assert [individual.crowding_distance for individual in population] == distances.tolist()
+
+    # Survivors come best first, and no one left out is better ranked or less crowded within the same front
+    keys = [(individual.rank, -individual.crowding_distance) for individual in survivors]
+    assert keys == sorted(keys)
+    left_out = [individual for individual in population if all(individual is not survivor for survivor in survivors)]
+    assert all((individual.rank, -individual.crowding_distance) >= keys[-1] for individual in left_out)
+
+
+def test_select_population_of_nobody():
+    assert select_population([], 10) == []
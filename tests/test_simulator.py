@@ -0,0 +1,53 @@
+""" Checks that 'Simulator.restore()' brings components back to the state of a freshly loaded scenario."""
+# Python libraries
+import json
+import time
+
+# EdgeSimPy components
+from edge_sim_py import Simulator, NetworkLink, EdgeServer, User
+
+# Scenario generator
+from generate_scenario import build_scenario
+
+COMPONENT_CLASSES = [NetworkLink, EdgeServer, User]
+
+
+def component_states(component_class):
+    return [json.dumps(obj._to_dict(), sort_keys=True) for obj in component_class.all()]
+
+
+def test_restore_matches_fresh_load():
+    dataset = json.dumps(build_scenario(users=10, tier1=3, tier2=1, seed=1))
+
+    simulator = Simulator()
+    simulator.initialize(json.loads(dataset))
+    snapshot = simulator.snapshot()
+
+    # NetworkLink keeps its attributes as dictionary items rather than in its '__dict__'
+    link = NetworkLink.first()
+    link["bandwidth_demand"] = 123
+    link.active = False
+    link.active_flows.append(EdgeServer.first())
+    EdgeServer.first().cpu_demand += 1
+    user = User.first()
+    user.coordinates = User.last().coordinates
+    user.coordinates_trace.append(user.coordinates)
+    user.base_station = User.last().base_station
+
+    simulator.restore(snapshot)
+    restored = {component_class: component_states(component_class) for component_class in COMPONENT_CLASSES}
+    restored_flows = [list(link.active_flows) for link in NetworkLink.all()]
+
+    Simulator().initialize(json.loads(dataset))
+    assert restored == {component_class: component_states(component_class) for component_class in COMPONENT_CLASSES}
+    assert restored_flows == [[] for _ in NetworkLink.all()]
+
+
+def test_snapshot_and_restore_are_fast():
+    simulator = Simulator()
+    simulator.initialize(build_scenario(users=20000, tier1=30, tier2=9, seed=1))
+
+    start = time.perf_counter()
+    snapshot = simulator.snapshot()
+    simulator.restore(snapshot)
+    assert time.perf_counter() - start < 0.5
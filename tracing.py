@@ -0,0 +1,92 @@
+"""Leveled, sampled tracing for the fitness hot path.
+
+Tracing is off by default and then costs a single integer comparison per fitness call. When enabled, records
+are written as JSON lines to a file instead of stdout:
+
+    from tracing import configure_tracing, TASKS
+    configure_tracing(level=TASKS, path="logs/fitness_trace.jsonl", sample_individuals=1)
+"""
+import atexit
+import json
+import os
+
+# Trace levels (each level includes the ones below it)
+OFF = 0
+CALLS = 1  # One record per fitness call
+SCORES = 2  # Raw and normalized objectives, penalties and final fitness of each sampled individual
+TASKS = 3  # Per-resource load and per-task path/exec delays of each sampled individual
+
+LEVELS = {"off": OFF, "calls": CALLS, "scores": SCORES, "tasks": TASKS}
+
+
+class Tracer:
+    def __init__(self, level=OFF, path="logs/fitness_trace.jsonl", sample_individuals=None, every=1):
+        """Creates a Tracer object.
+
+        Args:
+            level (int, optional): Trace level. Defaults to OFF.
+            path (str, optional): JSON lines file the records are appended to. Defaults to "logs/fitness_trace.jsonl".
+            sample_individuals (int, optional): Individuals traced per fitness call (None traces all). Defaults to None.
+            every (int, optional): Only every N-th fitness call is traced. Defaults to 1.
+        """
+        self._file = None
+        self._file_pid = None
+        self.configure(level, path, sample_individuals, every)
+
+    def configure(self, level=OFF, path="logs/fitness_trace.jsonl", sample_individuals=None, every=1):
+        self.close()
+        self.level = LEVELS[level.lower()] if isinstance(level, str) else level
+        self.path = path
+        self.sample_individuals = sample_individuals
+        self.every = every
+        self.context = {}
+        self.calls = 0
+
+    def enabled(self, level):
+        return self.level >= level
+
+    def next_call(self):
+        """Registers a fitness call and tells whether it is traced."""
+        self.calls += 1
+        return self.level > OFF and (self.calls - 1) % self.every == 0
+
+    def sampled(self, count):
+        """Returns the indices of the individuals traced out of a population of 'count' individuals."""
+        if self.sample_individuals is None:
+            return range(count)
+        return range(min(count, self.sample_individuals))
+
+    def emit(self, event, **fields):
+        # Opened lazily, and reopened by forked processes instead of sharing the parent's file object
+        if self._file_pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", buffering=1, encoding="UTF-8")
+            self._file_pid = os.getpid()
+
+        record = {"event": event, "call": self.calls, **self.context, **fields}
+        self._file.write(json.dumps(record, default=_to_json) + "\n")
+
+    def close(self):
+        if self._file is not None and self._file_pid == os.getpid():
+            self._file.close()
+        self._file = None
+        self._file_pid = None
+
+
+def _to_json(value):
+    # NumPy scalars and arrays
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+TRACER = Tracer()
+atexit.register(TRACER.close)
+
+
+def configure_tracing(level=OFF, path="logs/fitness_trace.jsonl", sample_individuals=None, every=1):
+    """Replaces the settings of the global tracer used by config.fitness."""
+    TRACER.configure(level, path, sample_individuals, every)
+    return TRACER